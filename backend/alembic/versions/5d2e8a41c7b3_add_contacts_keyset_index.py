@@ -0,0 +1,40 @@
+"""キーセットページネーション用の複合インデックスを追加
+
+Revision ID: 5d2e8a41c7b3
+Revises: abffa78d850d
+Create Date: 2026-10-17 03:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '5d2e8a41c7b3'
+down_revision: Union[str, None] = 'abffa78d850d'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """アップグレード処理"""
+    # 稼働中のテーブルをロックしないようトランザクション外で CONCURRENTLY 作成
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_contacts_created_at_id',
+            'contacts',
+            [sa.text('created_at DESC'), sa.text('id DESC')],
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """ダウングレード処理"""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_contacts_created_at_id',
+            table_name='contacts',
+            postgresql_concurrently=True,
+        )
@@ -0,0 +1,59 @@
+"""contactsテーブルのインデックスを再設計して復元
+
+75cadcbcfeb8 で削除されたインデックスを、実際のクエリに合わせて作り直す。
+created_at 単体は ix_contacts_created_at_id、status 単体は
+ix_contacts_status_created_at の先頭列で代替できるため再作成しない。
+ix_contacts_status_created_at は iter_all の ORDER BY（created_at DESC, id DESC）と一致させる。
+未処理（status = 'pending'）だけの部分インデックスは、リポジトリがステータスを
+バインド変数で渡すため汎用プランで使われず、作成しない。
+lesson_type は選択性が低いため対象外とする。
+
+Revision ID: 9b4f1e6a2c85
+Revises: 5d2e8a41c7b3
+Create Date: 2026-10-17 04:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '9b4f1e6a2c85'
+down_revision: Union[str, None] = '5d2e8a41c7b3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """アップグレード処理"""
+    # 稼働中のテーブルをロックしないようトランザクション外で CONCURRENTLY 作成
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_contacts_email',
+            'contacts',
+            ['email'],
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            'ix_contacts_status_created_at',
+            'contacts',
+            ['status', sa.text('created_at DESC'), sa.text('id DESC')],
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """ダウングレード処理"""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_contacts_status_created_at',
+            table_name='contacts',
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            'ix_contacts_email',
+            table_name='contacts',
+            postgresql_concurrently=True,
+        )
@@ -0,0 +1,85 @@
+"""問い合わせ件数カウンターテーブルと維持トリガーを追加
+
+Revision ID: c3a7d0e59f14
+Revises: 9b4f1e6a2c85
+Create Date: 2026-10-17 05:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'c3a7d0e59f14'
+down_revision: Union[str, None] = '9b4f1e6a2c85'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """アップグレード処理"""
+    # 件数はステータス・レッスンタイプごとの増減の行の合計（同じ行を更新しないため、
+    # 同時に問い合わせを書き込むトランザクションがカウンターの行ロックで待ち合わない）
+    op.create_table(
+        'contact_counts',
+        sa.Column('id', sa.BigInteger(), autoincrement=True, nullable=False, comment='ID'),
+        sa.Column('status', sa.String(length=20), nullable=False, comment='ステータス'),
+        sa.Column('lesson_type', sa.String(length=20), nullable=False, comment='レッスンタイプ'),
+        sa.Column('count', sa.BigInteger(), nullable=False, comment='件数の増減'),
+        sa.PrimaryKeyConstraint('id'),
+        comment='問い合わせ件数カウンター（増減の行）'
+    )
+    
+    # 集計とトリガー作成の間に書き込みが入らないよう書き込みのみ止める（読み取りは可能）
+    op.execute("LOCK TABLE contacts IN SHARE MODE")
+    
+    op.execute(
+        """
+        INSERT INTO contact_counts (status, lesson_type, count)
+        SELECT status, lesson_type, count(*) FROM contacts GROUP BY status, lesson_type
+        """
+    )
+    
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION contact_counts_maintain() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP IN ('UPDATE', 'DELETE') THEN
+                INSERT INTO contact_counts (status, lesson_type, count)
+                VALUES (OLD.status, OLD.lesson_type, -1);
+            END IF;
+            IF TG_OP IN ('INSERT', 'UPDATE') THEN
+                INSERT INTO contact_counts (status, lesson_type, count)
+                VALUES (NEW.status, NEW.lesson_type, 1);
+            END IF;
+            RETURN NULL;
+        END
+        $$ LANGUAGE plpgsql
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER contacts_counts_insert_delete
+        AFTER INSERT OR DELETE ON contacts
+        FOR EACH ROW EXECUTE FUNCTION contact_counts_maintain()
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER contacts_counts_update
+        AFTER UPDATE OF status, lesson_type ON contacts
+        FOR EACH ROW
+        WHEN (OLD.status IS DISTINCT FROM NEW.status OR OLD.lesson_type IS DISTINCT FROM NEW.lesson_type)
+        EXECUTE FUNCTION contact_counts_maintain()
+        """
+    )
+
+
+def downgrade() -> None:
+    """ダウングレード処理"""
+    op.execute("DROP TRIGGER IF EXISTS contacts_counts_update ON contacts")
+    op.execute("DROP TRIGGER IF EXISTS contacts_counts_insert_delete ON contacts")
+    op.execute("DROP FUNCTION IF EXISTS contact_counts_maintain()")
+    op.drop_table('contact_counts')
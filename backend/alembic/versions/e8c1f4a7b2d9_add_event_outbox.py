@@ -0,0 +1,67 @@
+"""ドメインイベントのアウトボックステーブルと通知トリガーを追加
+
+Revision ID: e8c1f4a7b2d9
+Revises: c3a7d0e59f14
+Create Date: 2026-10-17 06:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'e8c1f4a7b2d9'
+down_revision: Union[str, None] = 'c3a7d0e59f14'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """アップグレード処理"""
+    op.create_table(
+        'event_outbox',
+        sa.Column('id', sa.BigInteger(), autoincrement=True, nullable=False, comment='ID'),
+        sa.Column('event_id', postgresql.UUID(), nullable=False, comment='イベントID'),
+        sa.Column('event_type', sa.String(length=100), nullable=False, comment='イベントタイプ'),
+        sa.Column('payload', postgresql.JSONB(), nullable=False, comment='DomainEvent.to_dict() の結果'),
+        sa.Column('created_at', sa.DateTime(timezone=True), nullable=False, comment='書き込み日時'),
+        sa.Column('available_at', sa.DateTime(timezone=True), nullable=True,
+                  comment='配信可能日時（再試行の待機、NULLは再試行打ち切り）'),
+        sa.Column('attempts', sa.Integer(), nullable=False, server_default='0', comment='配信失敗回数'),
+        sa.Column('last_error', sa.Text(), nullable=True, comment='最後の配信エラー'),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('event_id'),
+        comment='配信待ちドメインイベント'
+    )
+    # リレーの確保（available_at <= now）用。行が溜まってもポーリングのたびに全行を走査しない
+    op.create_index('ix_event_outbox_available_at', 'event_outbox', ['available_at'])
+    
+    # 書き込みを LISTEN 中のリレーワーカーに通知（文単位）
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION event_outbox_notify() RETURNS trigger AS $$
+        BEGIN
+            PERFORM pg_notify('event_outbox', '');
+            RETURN NULL;
+        END
+        $$ LANGUAGE plpgsql
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER event_outbox_notify
+        AFTER INSERT ON event_outbox
+        FOR EACH STATEMENT EXECUTE FUNCTION event_outbox_notify()
+        """
+    )
+
+
+def downgrade() -> None:
+    """ダウングレード処理"""
+    op.execute("DROP TRIGGER IF EXISTS event_outbox_notify ON event_outbox")
+    op.execute("DROP FUNCTION IF EXISTS event_outbox_notify()")
+    op.drop_index('ix_event_outbox_available_at', table_name='event_outbox')
+    op.drop_table('event_outbox')
@@ -0,0 +1,42 @@
+"""Admin API endpoints."""
+import secrets
+from dataclasses import asdict
+from typing import Annotated, Optional
+
+from fastapi import APIRouter, Depends, Header, HTTPException, status
+
+from app.api.schemas.admin import SlowQueryListResponse, SlowQueryResponse
+from app.config import get_settings
+from app.infrastructure.database.slow_query import get_slow_query_log
+
+router = APIRouter(prefix="/admin", tags=["admin"])
+
+
+async def require_admin_token(
+    x_admin_token: Annotated[Optional[str], Header()] = None
+) -> None:
+    """管理APIのトークンを検証（admin_api_token が未設定なら管理APIは無効）"""
+    expected = get_settings().admin_api_token
+    if not expected:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not Found")
+    if x_admin_token is None or not secrets.compare_digest(x_admin_token, expected):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="管理APIのトークンが無効です。"
+        )
+
+
+@router.get(
+    "/slow-queries",
+    response_model=SlowQueryListResponse,
+    summary="スロークエリ一覧取得",
+    description="直近のスロークエリと、サンプリングされたものは実行計画を返します。",
+    dependencies=[Depends(require_admin_token)]
+)
+async def list_slow_queries() -> SlowQueryListResponse:
+    """スロークエリ一覧を取得"""
+    slow_query_log = get_slow_query_log()
+    return SlowQueryListResponse(
+        threshold_ms=slow_query_log.threshold_ms,
+        items=[SlowQueryResponse(**asdict(entry)) for entry in slow_query_log.entries()]
+    )
@@ -1,20 +1,38 @@
 """Contact API endpoints."""
-from typing import Annotated
+import logging
+from typing import Annotated, AsyncGenerator, Optional
 from uuid import UUID
-from fastapi import APIRouter, Depends, HTTPException, status
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from fastapi.responses import JSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
-import logging
 
 from app.api.schemas.contact import (
     ContactCreateRequest,
     ContactCreateResponse,
-    ContactResponse
+    ContactListResponse,
+    ContactResponse,
+)
+from app.config import get_settings
+from app.domain.entities.contact import Contact
+from app.domain.repositories.contact_repository import ContactRepository
+from app.infrastructure.database.connection import (
+    get_async_session,
+    get_read_only_session,
+)
+from app.infrastructure.database.unit_of_work import UnitOfWork
+from app.infrastructure.di.container import get_container
+from app.infrastructure.event_bus import EventBus
+from app.infrastructure.repositories.cached_contact_repository import (
+    CachedContactRepository,
+    get_contact_cache,
+)
+from app.infrastructure.repositories.sqlalchemy_contact_repository import (
+    SQLAlchemyContactRepository,
 )
 from app.services.contact_service import ContactService
-from app.infrastructure.database.connection import get_async_session
-from app.infrastructure.repositories.sqlalchemy_contact_repository import SQLAlchemyContactRepository
 from app.services.email_service import MockEmailService
+from app.utils.cursor import decode_cursor, encode_cursor
 
 logger = logging.getLogger(__name__)
 
@@ -27,13 +45,63 @@ async def contacts_options():
     return {"message": "OK"}
 
 
-async def get_contact_service(
+def _build_contact_service(session: AsyncSession) -> ContactService:
+    """セッションからContactServiceを組み立てる"""
+    settings = get_settings()
+    contact_repository: ContactRepository = SQLAlchemyContactRepository(session)
+    if settings.contact_cache_enabled:
+        contact_repository = CachedContactRepository(
+            contact_repository,
+            get_contact_cache(),
+            negative_ttl=settings.contact_cache_negative_ttl_seconds,
+            session=session,
+        )
+    email_service = MockEmailService()
+    return ContactService(contact_repository, email_service)
+
+
+async def get_unit_of_work(
     session: Annotated[AsyncSession, Depends(get_async_session)]
+) -> AsyncGenerator[UnitOfWork, None]:
+    """
+    リクエスト単位のユニットオブワーク
+    
+    成功時はコミットしてから、リクエスト中に保存したエンティティのドメインイベントを
+    まとめて配信する（アウトボックス有効時は同じトランザクションで書き込む）。
+    例外時はロールバックしてイベントを破棄する。
+    """
+    outbox = get_settings().event_outbox_enabled
+    async with UnitOfWork(session, get_container().get(EventBus), outbox=outbox) as unit_of_work:
+        yield unit_of_work
+
+
+async def get_contact_service(
+    unit_of_work: Annotated[UnitOfWork, Depends(get_unit_of_work)]
 ) -> ContactService:
     """ContactServiceの依存性注入"""
-    contact_repository = SQLAlchemyContactRepository(session)
-    email_service = MockEmailService()
-    return ContactService(contact_repository, email_service)
+    return _build_contact_service(unit_of_work.session)
+
+
+async def get_read_contact_service(
+    session: Annotated[AsyncSession, Depends(get_read_only_session)]
+) -> ContactService:
+    """読み取り専用セッションを使うContactServiceの依存性注入（GET用）"""
+    return _build_contact_service(session)
+
+
+def _to_response(contact: Contact) -> ContactResponse:
+    """Contactエンティティをレスポンススキーマに変換"""
+    return ContactResponse(
+        id=str(contact.id),
+        name=contact.name,
+        email=str(contact.email),
+        phone=str(contact.phone) if contact.phone else None,
+        lesson_type=contact.lesson_type.value,
+        preferred_contact=contact.preferred_contact.value,
+        message=contact.message,
+        status=contact.status.value,
+        created_at=contact.created_at.isoformat()
+    )
 
 
 @router.post(
@@ -51,10 +119,10 @@ async def create_contact(
     try:
         contact = await contact_service.create_contact(
             name=request.name,
-            email=str(request.email),
+            email=request.email,
             phone=request.phone,
-            lesson_type=request.lesson_type.value,
-            preferred_contact=request.preferred_contact.value,
+            lesson_type=request.lesson_type,
+            preferred_contact=request.preferred_contact,
             message=request.message
         )
         
@@ -77,6 +145,42 @@ async def create_contact(
         )
 
 
+@router.get(
+    "/",
+    response_model=ContactListResponse,
+    summary="問い合わせ一覧取得",
+    description="問い合わせを新しい順に取得します。次ページは next_cursor を cursor に指定して取得します。"
+)
+async def list_contacts(
+    contact_service: Annotated[ContactService, Depends(get_read_contact_service)],
+    cursor: Annotated[Optional[str], Query(description="前ページの next_cursor")] = None,
+    limit: Annotated[int, Query(ge=1, le=100, description="取得件数")] = 20
+) -> ContactListResponse:
+    """問い合わせ一覧を取得"""
+    try:
+        after = decode_cursor(cursor) if cursor else None
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    
+    try:
+        page = await contact_service.get_contacts_page(after=after, limit=limit)
+        
+        return ContactListResponse(
+            items=[_to_response(contact) for contact in page.items],
+            next_cursor=encode_cursor(page.next_key) if page.next_key else None
+        )
+        
+    except Exception as e:
+        logger.error(f"Failed to list contacts: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="問い合わせ一覧の取得に失敗しました。"
+        )
+
+
 @router.get(
     "/{contact_id}",
     response_model=ContactResponse,
@@ -85,7 +189,7 @@ async def create_contact(
 )
 async def get_contact(
     contact_id: UUID,
-    contact_service: Annotated[ContactService, Depends(get_contact_service)]
+    contact_service: Annotated[ContactService, Depends(get_read_contact_service)]
 ) -> ContactResponse:
     """問い合わせを取得"""
     try:
@@ -97,17 +201,7 @@ async def get_contact(
                 detail="指定された問い合わせが見つかりません。"
             )
         
-        return ContactResponse(
-            id=str(contact.id),
-            name=contact.name,
-            email=str(contact.email),
-            phone=str(contact.phone) if contact.phone else None,
-            lesson_type=contact.lesson_type.value,
-            preferred_contact=contact.preferred_contact.value,
-            message=contact.message,
-            status=contact.status.value,
-            created_at=contact.created_at.isoformat()
-        )
+        return _to_response(contact)
         
     except HTTPException:
         raise
@@ -0,0 +1,24 @@
+"""Admin API schemas."""
+from datetime import datetime
+from typing import List, Optional
+
+from pydantic import BaseModel, Field
+
+
+class SlowQueryResponse(BaseModel):
+    """スロークエリレスポンススキーマ"""
+    
+    fingerprint: str = Field(..., description="正規化したステートメントのフィンガープリント")
+    statement: str = Field(..., description="正規化したステートメント（値は含まない）")
+    parameters_shape: str = Field(..., description="パラメータの型と個数")
+    duration_ms: float = Field(..., description="所要時間（ミリ秒）")
+    caller: Optional[str] = Field(None, description="呼び出し元のリポジトリメソッド")
+    occurred_at: datetime = Field(..., description="発生日時")
+    plan: Optional[str] = Field(None, description="実行計画（サンプリングされた場合のみ）")
+
+
+class SlowQueryListResponse(BaseModel):
+    """スロークエリ一覧レスポンススキーマ"""
+    
+    threshold_ms: float = Field(..., description="スロークエリのしきい値（ミリ秒）")
+    items: List[SlowQueryResponse] = Field(..., description="スロークエリ（新しい順）")
@@ -1,15 +1,56 @@
 """Contact API schemas."""
-from typing import Optional
-from pydantic import BaseModel, EmailStr, Field
+from typing import Annotated, Any, List, Optional
+
+from pydantic import BaseModel, Field, PlainSerializer, PlainValidator, WithJsonSchema
+
 from app.domain.entities.contact import LessonType, PreferredContact
+from app.domain.value_objects.email import Email
+from app.domain.value_objects.phone import Phone
+
+PHONE_MAX_LENGTH = 20
+
+
+def _parse_email(value: Any) -> Email:
+    """入力値をEmail値オブジェクトに変換（検証はEmailの1回のみ）"""
+    if isinstance(value, Email):
+        return value
+    if not isinstance(value, str):
+        raise ValueError("メールアドレスは文字列で指定してください")
+    return Email(value)
+
+
+def _parse_phone(value: Any) -> Optional[Phone]:
+    """入力値をPhone値オブジェクトに変換（空文字はNone）"""
+    if value is None or isinstance(value, Phone):
+        return value
+    if not isinstance(value, str):
+        raise ValueError("電話番号は文字列で指定してください")
+    if len(value) > PHONE_MAX_LENGTH:
+        raise ValueError(f"電話番号は{PHONE_MAX_LENGTH}文字以内で指定してください")
+    return Phone.create_optional(value)
+
+
+# リクエストの検証で値オブジェクトを生成し、サービス・エンティティへそのまま渡す
+EmailField = Annotated[
+    Email,
+    PlainValidator(_parse_email),
+    PlainSerializer(lambda email: email.value, return_type=str),
+    WithJsonSchema({"type": "string", "format": "email"}),
+]
+PhoneField = Annotated[
+    Optional[Phone],
+    PlainValidator(_parse_phone),
+    PlainSerializer(lambda phone: phone.value if phone else None, return_type=Optional[str]),
+    WithJsonSchema({"anyOf": [{"type": "string", "maxLength": PHONE_MAX_LENGTH}, {"type": "null"}]}),
+]
 
 
 class ContactCreateRequest(BaseModel):
     """問い合わせ作成リクエストスキーマ"""
     
     name: str = Field(..., min_length=1, max_length=100, description="お名前")
-    email: EmailStr = Field(..., description="メールアドレス")
-    phone: Optional[str] = Field(None, max_length=20, description="電話番号")
+    email: EmailField = Field(..., description="メールアドレス")
+    phone: PhoneField = Field(None, description="電話番号")
     lesson_type: LessonType = Field(..., description="希望レッスンタイプ")
     preferred_contact: PreferredContact = Field(..., description="希望連絡方法")
     message: str = Field(..., min_length=1, max_length=1000, description="メッセージ")
@@ -58,6 +99,22 @@ class ContactResponse(BaseModel):
     }
 
 
+class ContactListResponse(BaseModel):
+    """問い合わせ一覧レスポンススキーマ"""
+    
+    items: List[ContactResponse] = Field(..., description="問い合わせ一覧")
+    next_cursor: Optional[str] = Field(None, description="次ページ取得用カーソル（最終ページではnull）")
+    
+    model_config = {
+        "json_schema_extra": {
+            "example": {
+                "items": [ContactResponse.model_config["json_schema_extra"]["example"]],
+                "next_cursor": "WyIyMDI0LTAxLTAxVDEwOjAwOjAwKzAwOjAwIiwiMTIzZTQ1NjciXQ"
+            }
+        }
+    }
+
+
 class ContactCreateResponse(BaseModel):
     """問い合わせ作成成功レスポンススキーマ"""
     
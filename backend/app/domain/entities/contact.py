@@ -5,7 +5,7 @@ Contact エンティティ
 """
 
 from dataclasses import dataclass, field
-from datetime import datetime, UTC
+from datetime import UTC, datetime
 from enum import Enum
 from typing import List, Optional
 from uuid import UUID, uuid4
@@ -44,12 +44,13 @@ class ContactStatus(Enum):
     CANCELLED = "cancelled"   # キャンセル
 
 
-@dataclass
+@dataclass(slots=True)
 class Contact:
     """
     問い合わせエンティティ
     
-    問い合わせに関するビジネスロジックを含む
+    問い合わせに関するビジネスロジックを含む。
+    インスタンス辞書を持たない（slots）。ドメインイベントのリストは最初のイベント追加時に作成する。
     """
     
     # 識別子
@@ -77,8 +78,8 @@ class Contact:
     processed_by: Optional[str] = field(default=None)
     processing_notes: Optional[str] = field(default=None)
     
-    # ドメインイベント
-    _domain_events: List[DomainEvent] = field(default_factory=list, init=False)
+    # ドメインイベント（イベントがなければNone）
+    _domain_events: Optional[List[DomainEvent]] = field(default=None, init=False, repr=False, compare=False)
     
     def __post_init__(self):
         """初期化後の処理"""
@@ -91,19 +92,63 @@ class Contact:
         if not self.message:
             raise ValueError("メッセージは必須です")
     
+    @classmethod
+    def _from_trusted_row(
+        cls,
+        id: UUID,
+        name: str,
+        email: Email,
+        phone: Optional[Phone],
+        message: str,
+        lesson_type: LessonType,
+        preferred_contact: PreferredContact,
+        status: ContactStatus,
+        created_at: datetime,
+        updated_at: datetime,
+        processed_at: Optional[datetime] = None,
+        processed_by: Optional[str] = None,
+        processing_notes: Optional[str] = None,
+    ) -> "Contact":
+        """
+        保存済みの行から問い合わせを復元（リポジトリ用）
+        
+        書き込み時に検証済みのデータを前提とし、__init__ と __post_init__ の検証を省略する。
+        
+        Returns:
+            Contact: 復元された問い合わせ
+        """
+        contact = object.__new__(cls)
+        contact.id = id
+        contact.name = name
+        contact.email = email
+        contact.phone = phone
+        contact.message = message
+        contact.lesson_type = lesson_type
+        contact.preferred_contact = preferred_contact
+        contact.status = status
+        contact.created_at = created_at
+        contact.updated_at = updated_at
+        contact.processed_at = processed_at
+        contact.processed_by = processed_by
+        contact.processing_notes = processing_notes
+        contact._domain_events = None
+        return contact
+    
     @classmethod
     def create(
         cls,
         name: str,
-        email: str,
+        email: Email | str,
         message: str,
-        lesson_type: str,
-        preferred_contact: str,
-        phone: Optional[str] = None,
+        lesson_type: LessonType | str,
+        preferred_contact: PreferredContact | str,
+        phone: Optional[Phone | str] = None,
     ) -> "Contact":
         """
         新しい問い合わせを作成
         
+        検証済みの値オブジェクト・Enumが渡された場合はそのまま使う。
+        
         Args:
             name: 名前
             email: メールアドレス
@@ -119,8 +164,8 @@ class Contact:
             ValueError: 無効な値が指定された場合
         """
         # 値オブジェクトの作成
-        email_vo = Email.create(email)
-        phone_vo = Phone.create_optional(phone)
+        email_vo = email if isinstance(email, Email) else Email.create(email)
+        phone_vo = phone if isinstance(phone, Phone) else Phone.create_optional(phone)
         
         # Enumの変換
         try:
@@ -254,6 +299,8 @@ class Contact:
         Args:
             event: 追加するドメインイベント
         """
+        if self._domain_events is None:
+            self._domain_events = []
         self._domain_events.append(event)
     
     def get_domain_events(self) -> List[DomainEvent]:
@@ -263,11 +310,11 @@ class Contact:
         Returns:
             List[DomainEvent]: ドメインイベントのリスト
         """
-        return self._domain_events.copy()
+        return list(self._domain_events) if self._domain_events else []
     
     def clear_domain_events(self) -> None:
         """ドメインイベントをクリア"""
-        self._domain_events.clear()
+        self._domain_events = None
     
     def is_pending(self) -> bool:
         """未処理かどうかを判定"""
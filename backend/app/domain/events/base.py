@@ -5,9 +5,11 @@
 """
 
 from abc import ABC
-from dataclasses import dataclass, field
-from datetime import datetime, UTC
-from typing import Any, Dict
+from dataclasses import dataclass, field, fields
+from datetime import UTC, datetime
+from enum import Enum
+from types import NoneType, UnionType
+from typing import Any, Dict, Type, Union, get_args, get_origin, get_type_hints
 from uuid import UUID, uuid4
 
 
@@ -48,6 +50,39 @@ class DomainEvent(ABC):
             'data': self._get_event_data()
         }
     
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "DomainEvent":
+        """
+        to_dict() の結果からイベントを復元
+        
+        event_type から具象クラスを特定し、event_id・occurred_at も元の値に戻す。
+        フィールドは型ヒントに従い UUID・datetime・Enum を文字列から変換する
+        （Optional などの Union は None 以外の型で変換する）。
+        
+        Args:
+            data: to_dict() の結果
+            
+        Returns:
+            DomainEvent: 復元されたイベント
+            
+        Raises:
+            ValueError: 未知のイベントタイプの場合
+        """
+        event_class = _find_event_class(cls, data['event_type'])
+        hints = get_type_hints(event_class)
+        event_data = data['data']
+        kwargs = {}
+        for event_field in fields(event_class):
+            if not event_field.init or event_field.name not in event_data:
+                continue
+            kwargs[event_field.name] = _convert_field(event_data[event_field.name], hints.get(event_field.name))
+        
+        event = event_class(**kwargs)
+        object.__setattr__(event, 'event_id', UUID(data['event_id']))
+        object.__setattr__(event, 'occurred_at', datetime.fromisoformat(data['occurred_at']))
+        object.__setattr__(event, 'event_version', data['event_version'])
+        return event
+    
     def _get_event_data(self) -> Dict[str, Any]:
         """
         イベント固有のデータを取得
@@ -66,4 +101,43 @@ class DomainEvent(ABC):
                     data[key] = value.__dict__ if hasattr(value, '__dict__') else str(value)
                 else:
                     data[key] = value
-        return data
\ No newline at end of file
+        return data
+
+
+def _find_event_class(base: Type[DomainEvent], event_type: str) -> Type[DomainEvent]:
+    """イベントタイプ名から base 以下の具象クラスを探す"""
+    if base.__name__ == event_type:
+        return base
+    for subclass in base.__subclasses__():
+        try:
+            return _find_event_class(subclass, event_type)
+        except ValueError:
+            continue
+    raise ValueError(f"Unknown event type: {event_type}")
+
+
+def _convert_field(value: Any, hint: Any) -> Any:
+    """to_dict() で文字列化された値を型ヒントの型に戻す"""
+    if value is None or hint is None:
+        return value
+    if get_origin(hint) in (Union, UnionType):
+        # Optional などは None 以外の型のうち変換できる最初の型で復元
+        for arg in get_args(hint):
+            if arg is NoneType:
+                continue
+            try:
+                converted = _convert_field(value, arg)
+            except (TypeError, ValueError):
+                continue
+            if converted is not value:
+                return converted
+        return value
+    if not isinstance(value, str) or not isinstance(hint, type):
+        return value
+    if hint is UUID:
+        return UUID(value)
+    if hint is datetime:
+        return datetime.fromisoformat(value)
+    if issubclass(hint, Enum):
+        return hint(value)
+    return value
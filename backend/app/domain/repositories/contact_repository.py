@@ -1,10 +1,46 @@
 """Contact repository interface."""
 
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from dataclasses import dataclass
+from datetime import datetime
+from enum import Enum
+from typing import AsyncIterator, Iterable, List, Optional, Tuple
 from uuid import UUID
 
-from ..entities.contact import Contact
+from ..entities.contact import Contact, ContactStatus, LessonType
+
+# キーセットページネーションの位置（created_at, id）
+PageKey = Tuple[datetime, UUID]
+
+
+@dataclass(frozen=True)
+class ContactPage:
+    """A page of contacts ordered by (created_at DESC, id DESC)."""
+
+    items: List[Contact]
+    next_key: Optional[PageKey]
+
+    @property
+    def has_next(self) -> bool:
+        """Whether another page follows this one."""
+        return self.next_key is not None
+
+
+class CountMode(Enum):
+    """How count() obtains the number of contacts."""
+
+    EXACT = "exact"  # 正確な件数（カウンターから取得）
+    ESTIMATED = "estimated"  # 統計情報からの推定値（最も安価）
+
+
+@dataclass(frozen=True)
+class ContactFilter:
+    """Criteria for selecting contacts; unset fields match everything."""
+
+    status: Optional[ContactStatus] = None
+    lesson_type: Optional[LessonType] = None
+    created_from: Optional[datetime] = None
+    created_to: Optional[datetime] = None
 
 
 class ContactRepository(ABC):
@@ -22,6 +58,18 @@ class ContactRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    async def save_many(self, contacts: Iterable[Contact]) -> int:
+        """Save multiple contact entities in bulk.
+        
+        Args:
+            contacts: The contact entities to save
+            
+        Returns:
+            Number of contacts written
+        """
+        pass
+
     @abstractmethod
     async def find_by_id(self, contact_id: UUID) -> Optional[Contact]:
         """Find a contact by its ID.
@@ -34,6 +82,18 @@ class ContactRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    async def find_by_ids(self, contact_ids: Iterable[UUID]) -> List[Contact]:
+        """Find contacts by their IDs in a single lookup.
+        
+        Args:
+            contact_ids: The unique identifiers of the contacts
+            
+        Returns:
+            The contact entities found, in no particular order; unknown IDs are skipped
+        """
+        pass
+
     @abstractmethod
     async def find_by_email(self, email: str) -> Optional[Contact]:
         """Find a contact by email address.
@@ -59,6 +119,36 @@ class ContactRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    async def find_page(
+        self, after: Optional[PageKey] = None, limit: int = 20
+    ) -> ContactPage:
+        """Find contacts with keyset pagination.
+        
+        Args:
+            after: Key of the last contact on the previous page, None for the first page
+            limit: Maximum number of contacts to return
+            
+        Returns:
+            The page of contacts and the key to continue from
+        """
+        pass
+
+    @abstractmethod
+    def iter_all(
+        self, batch_size: int = 1000, filters: Optional[ContactFilter] = None
+    ) -> AsyncIterator[Contact]:
+        """Stream contacts without loading them all into memory.
+        
+        Args:
+            batch_size: Number of rows fetched from the database at a time
+            filters: Criteria the contacts must match
+            
+        Returns:
+            Async iterator of contact entities, newest first
+        """
+        pass
+
     @abstractmethod
     async def delete(self, contact_id: UUID) -> bool:
         """Delete a contact by its ID.
@@ -72,10 +162,30 @@ class ContactRepository(ABC):
         pass
 
     @abstractmethod
-    async def count(self) -> int:
+    async def count(self, mode: CountMode = CountMode.EXACT) -> int:
         """Count total number of contacts.
         
+        Args:
+            mode: Whether an exact or an estimated count is required
+            
         Returns:
             Total number of contacts in the repository
         """
+        pass
+
+    @abstractmethod
+    async def count_by(
+        self,
+        status: Optional[ContactStatus] = None,
+        lesson_type: Optional[LessonType] = None,
+    ) -> int:
+        """Count contacts with the given status and/or lesson type.
+        
+        Args:
+            status: Status to count, None for all statuses
+            lesson_type: Lesson type to count, None for all lesson types
+            
+        Returns:
+            Number of matching contacts
+        """
         pass
\ No newline at end of file
@@ -6,5 +6,6 @@
 
 from .email import Email
 from .phone import Phone
+from .validation import BatchValidationResult, ValidationResult
 
-__all__ = ["Email", "Phone"]
\ No newline at end of file
+__all__ = ["BatchValidationResult", "Email", "Phone", "ValidationResult"]
\ No newline at end of file
@@ -6,10 +6,14 @@ Email値オブジェクト
 
 import re
 from dataclasses import dataclass
-from typing import Self
+from typing import Iterable, List, Optional, Self
 
+from .validation import BatchValidationResult
 
-@dataclass(frozen=True)
+_EMAIL_PATTERN = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+
+
+@dataclass(frozen=True, slots=True)
 class Email:
     """
     メールアドレス値オブジェクト
@@ -41,8 +45,24 @@ class Email:
         Returns:
             bool: 有効な形式の場合True
         """
-        pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        return bool(re.match(pattern, email))
+        return _EMAIL_PATTERN.match(email) is not None
+    
+    @classmethod
+    def _from_trusted(cls, value: str) -> Self:
+        """
+        保存済みの正規化されたメールアドレスから復元（リポジトリ用）
+        
+        書き込み時に検証・正規化済みの値を前提とし、__post_init__ を省略する。
+        
+        Args:
+            value: 正規化済みのメールアドレス
+            
+        Returns:
+            Email: 復元されたEmailオブジェクト
+        """
+        obj = object.__new__(cls)
+        object.__setattr__(obj, 'value', value)
+        return obj
     
     @classmethod
     def create(cls, value: str) -> Self:
@@ -60,6 +80,37 @@ class Email:
         """
         return cls(value)
     
+    @classmethod
+    def validate_many(cls, values: Iterable[str]) -> BatchValidationResult[Self]:
+        """
+        メールアドレスを一括で検証・正規化
+        
+        1件ずつ Email() を呼ぶ場合と同じ判定を、例外を送出せずに行う。
+        インポートやスプレッドシートの検証など大量の行を扱う用途向け。
+        
+        Args:
+            values: メールアドレス文字列
+            
+        Returns:
+            BatchValidationResult[Email]: 入力と同じ順序の1行ごとの結果
+        """
+        raw = values if isinstance(values, list) else list(values)
+        match = _EMAIL_PATTERN.match
+        new = object.__new__
+        set_value = cls.value.__set__
+        emails: List[Optional[Self]] = []
+        append = emails.append
+        errors = {}
+        for index, value in enumerate(raw):
+            if isinstance(value, str) and match(value) is not None:
+                email = new(cls)
+                set_value(email, value.lower().strip())
+                append(email)
+                continue
+            append(None)
+            errors[index] = f"無効なメールアドレス形式です: {value}" if value else "メールアドレスは必須です"
+        return BatchValidationResult(raw, emails, errors)
+    
     def __str__(self) -> str:
         """文字列表現"""
         return self.value
@@ -6,10 +6,26 @@ Phone値オブジェクト
 
 import re
 from dataclasses import dataclass
-from typing import Optional, Self
+from typing import Iterable, List, Optional, Self
 
+from .validation import BatchValidationResult
 
-@dataclass(frozen=True)
+# 空白、ハイフン、括弧
+_SEPARATORS = re.compile(r'[\s\-\(\)]')
+
+# 日本の電話番号パターン（1つの正規表現にまとめたもの）
+_PHONE_PATTERN = re.compile(
+    r'^(?:'
+    r'0[1-9]\d{8,9}'   # 固定電話（10-11桁）
+    r'|0[789]0\d{8}'   # 携帯電話（11桁）
+    r'|050\d{8}'       # IP電話（11桁）
+    r'|0120\d{6}'      # フリーダイヤル（10桁）
+    r'|0800\d{7}'      # フリーダイヤル（11桁）
+    r')$'
+)
+
+
+@dataclass(frozen=True, slots=True)
 class Phone:
     """
     電話番号値オブジェクト
@@ -44,7 +60,7 @@ class Phone:
             str: 正規化された電話番号
         """
         # 空白、ハイフン、括弧を除去
-        normalized = re.sub(r'[\s\-\(\)]', '', phone)
+        normalized = _SEPARATORS.sub('', phone)
         
         # 先頭の+81を0に変換（日本の国際番号）
         if normalized.startswith('+81'):
@@ -65,16 +81,24 @@ class Phone:
         Returns:
             bool: 有効な形式の場合True
         """
-        # 日本の電話番号パターン
-        patterns = [
-            r'^0[1-9]\d{8,9}$',  # 固定電話（10-11桁）
-            r'^0[789]0\d{8}$',   # 携帯電話（11桁）
-            r'^050\d{8}$',       # IP電話（11桁）
-            r'^0120\d{6}$',      # フリーダイヤル（10桁）
-            r'^0800\d{7}$',      # フリーダイヤル（11桁）
-        ]
-        
-        return any(re.match(pattern, phone) for pattern in patterns)
+        return _PHONE_PATTERN.match(phone) is not None
+    
+    @classmethod
+    def _from_trusted(cls, value: str) -> Self:
+        """
+        保存済みの正規化された電話番号から復元（リポジトリ用）
+        
+        書き込み時に検証・正規化済みの値を前提とし、__post_init__ を省略する。
+        
+        Args:
+            value: 正規化済みの電話番号
+            
+        Returns:
+            Phone: 復元されたPhoneオブジェクト
+        """
+        obj = object.__new__(cls)
+        object.__setattr__(obj, 'value', value)
+        return obj
     
     @classmethod
     def create(cls, value: str) -> Self:
@@ -107,6 +131,47 @@ class Phone:
             return None
         return cls.create(value)
     
+    @classmethod
+    def normalize_many(cls, values: Iterable[str]) -> BatchValidationResult[Self]:
+        """
+        電話番号を一括で正規化・検証
+        
+        1件ずつ Phone() を呼ぶ場合と同じ判定を、例外を送出せずに行う。
+        インポートやスプレッドシートの検証など大量の行を扱う用途向け。
+        
+        Args:
+            values: 電話番号文字列
+            
+        Returns:
+            BatchValidationResult[Phone]: 入力と同じ順序の1行ごとの結果
+        """
+        raw = values if isinstance(values, list) else list(values)
+        strip_separators = _SEPARATORS.sub
+        match = _PHONE_PATTERN.match
+        new = object.__new__
+        set_value = cls.value.__set__
+        phones: List[Optional[Self]] = []
+        append = phones.append
+        errors = {}
+        for index, value in enumerate(raw):
+            if value and isinstance(value, str):
+                # 数字のみ（正規化済み）の行は区切り文字の除去を省略
+                normalized = value if value.isdigit() else strip_separators('', value)
+                if normalized[:1] != '0':
+                    if normalized.startswith('+81'):
+                        normalized = '0' + normalized[3:]
+                    elif normalized.startswith('81') and len(normalized) >= 10:
+                        normalized = '0' + normalized[2:]
+                
+                if match(normalized) is not None:
+                    phone = new(cls)
+                    set_value(phone, normalized)
+                    append(phone)
+                    continue
+            append(None)
+            errors[index] = f"無効な電話番号形式です: {value}" if value else "電話番号は必須です"
+        return BatchValidationResult(raw, phones, errors)
+    
     def __str__(self) -> str:
         """文字列表現"""
         return self.value
@@ -0,0 +1,76 @@
+"""
+一括検証の結果
+
+値オブジェクトの一括検証（Email.validate_many / Phone.normalize_many）の結果を定義
+"""
+
+from dataclasses import dataclass
+from typing import (
+    Dict,
+    Generic,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    TypeVar,
+)
+
+T = TypeVar("T")
+
+
+class ValidationResult(NamedTuple, Generic[T]):
+    """
+    一括検証の1行分の結果
+    
+    有効な行は value に値オブジェクトを、無効な行は error にエラーメッセージを持つ。
+    """
+    
+    index: int
+    raw: object
+    value: Optional[T] = None
+    error: Optional[str] = None
+    
+    @property
+    def ok(self) -> bool:
+        """有効な行の場合True"""
+        return self.error is None
+
+
+@dataclass(frozen=True, slots=True)
+class BatchValidationResult(Generic[T]):
+    """
+    一括検証の結果
+    
+    大量の行でも1行ごとのオブジェクトを作らないよう列指向で保持する。
+    values は入力と同じ順序の値オブジェクト（無効な行はNone）、
+    errors は無効な行の行番号とエラーメッセージ。
+    インデックス・イテレーションでは1行分の ValidationResult を返す。
+    """
+    
+    raw: Sequence[object]
+    values: List[Optional[T]]
+    errors: Dict[int, str]
+    
+    @property
+    def ok(self) -> bool:
+        """すべての行が有効な場合True"""
+        return not self.errors
+    
+    def valid(self) -> List[T]:
+        """有効な行の値オブジェクト（入力順）"""
+        if not self.errors:
+            return list(self.values)
+        return [value for value in self.values if value is not None]
+    
+    def __len__(self) -> int:
+        return len(self.values)
+    
+    def __getitem__(self, index: int) -> ValidationResult[T]:
+        index = range(len(self.values))[index]
+        return ValidationResult(index, self.raw[index], self.values[index], self.errors.get(index))
+    
+    def __iter__(self) -> Iterator[ValidationResult[T]]:
+        errors = self.errors
+        for index, (raw, value) in enumerate(zip(self.raw, self.values, strict=True)):
+            yield ValidationResult(index, raw, value, errors.get(index))
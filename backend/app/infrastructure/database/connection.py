@@ -2,72 +2,302 @@
 データベース接続設定
 
 SQLAlchemyを使用したPostgreSQL接続の管理
+
+エンジンはインポート時ではなく初回使用時に作成する（EngineRegistry）。
+同期エンジン（psycopg2）はマイグレーションやスクリプトが要求した場合のみ作成する。
 """
 
 import os
-from typing import AsyncGenerator
+from typing import Any, AsyncGenerator, Dict, List, Optional
 
-from sqlalchemy import create_engine
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.exc import InvalidRequestError
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import NullPool
 
 from ...config import get_settings
+from .pool_metrics import (
+    InstrumentedAsyncAdaptedQueuePool,
+    InstrumentedQueuePool,
+    instrument_engine,
+)
+from .routing import ReplicaSet, RoutingSession
+from .slow_query import get_slow_query_log
 
+# Session.info に保存する「読み取り専用」フラグのキー
+READ_ONLY = "read_only"
 
-def get_database_url(async_mode: bool = True) -> str:
+
+def get_database_url(async_mode: bool = True, url: str | None = None) -> str:
     """
     データベースURLを取得
     
     Args:
         async_mode: 非同期モードかどうか
+        url: 変換元のURL（省略時はプライマリの database_url）
         
     Returns:
         str: データベースURL
     """
-    settings = get_settings()
+    url = url or get_settings().database_url
     
     if async_mode:
         # 非同期用（asyncpg）
-        return settings.database_url.replace("postgresql://", "postgresql+asyncpg://")
+        return url.replace("postgresql://", "postgresql+asyncpg://")
     else:
         # 同期用（psycopg2）
-        return settings.database_url.replace("postgresql://", "postgresql+psycopg2://")
+        return url.replace("postgresql://", "postgresql+psycopg2://")
 
 
-# 非同期エンジンの作成
-async_engine = create_async_engine(
-    get_database_url(async_mode=True),
-    echo=os.getenv("DATABASE_ECHO", "false").lower() == "true",
-    pool_size=int(os.getenv("DATABASE_POOL_SIZE", "10")),
-    max_overflow=int(os.getenv("DATABASE_MAX_OVERFLOW", "20")),
-    pool_pre_ping=True,
-    pool_recycle=3600,  # 1時間でコネクションをリサイクル
-)
+def get_replica_urls() -> List[str]:
+    """
+    読み取りレプリカのURL一覧を取得
+    
+    Returns:
+        List[str]: 非同期用のレプリカURL（未設定なら空）
+    """
+    replica_urls = get_settings().database_replica_urls
+    return [
+        get_database_url(async_mode=True, url=url.strip())
+        for url in replica_urls.split(",")
+        if url.strip()
+    ]
 
-# 同期エンジンの作成（マイグレーション用）
-sync_engine = create_engine(
-    get_database_url(async_mode=False),
-    echo=os.getenv("DATABASE_ECHO", "false").lower() == "true",
-    pool_size=int(os.getenv("DATABASE_POOL_SIZE", "10")),
-    max_overflow=int(os.getenv("DATABASE_MAX_OVERFLOW", "20")),
-    pool_pre_ping=True,
-    pool_recycle=3600,
-)
 
-# セッションファクトリーの作成
-AsyncSessionLocal = async_sessionmaker(
-    bind=async_engine,
-    class_=AsyncSession,
-    expire_on_commit=False,
-    autoflush=False,
-    autocommit=False,
-)
+def _unnamed_statement() -> str:
+    """asyncpg に名前なし（unnamed）の準備済みステートメントを使わせる"""
+    return ""
 
-SessionLocal = sessionmaker(
-    bind=sync_engine,
-    autocommit=False,
-    autoflush=False,
-)
+
+def _engine_options(url: str, async_mode: bool = True) -> Dict[str, Any]:
+    """
+    エンジンのオプションを設定・環境変数から取得
+    
+    direct モードではアプリ側のプールと asyncpg の準備済みステートメントキャッシュを使う。
+    pgbouncer モードではプールをPgBouncerに任せ（NullPool）、トランザクションごとに
+    別のサーバー接続に割り当てられても衝突しないよう名前なしステートメントを使う。
+    
+    Args:
+        url: 接続先URL
+        async_mode: 非同期エンジン用かどうか
+        
+    Returns:
+        Dict[str, Any]: create_engine / create_async_engine のオプション
+    """
+    settings = get_settings()
+    uses_asyncpg = make_url(url).get_driver_name() == "asyncpg"
+    options: Dict[str, Any] = {
+        "echo": os.getenv("DATABASE_ECHO", "false").lower() == "true",
+        "query_cache_size": settings.database_compiled_cache_size,
+    }
+    
+    if settings.database_connection_mode == "pgbouncer":
+        options["poolclass"] = NullPool
+        if uses_asyncpg:
+            options["connect_args"] = {
+                "statement_cache_size": 0,
+                "prepared_statement_cache_size": 0,
+                "prepared_statement_name_func": _unnamed_statement,
+            }
+        return options
+    
+    options.update(
+        # チェックアウト待ち時間を計測するプール
+        poolclass=InstrumentedAsyncAdaptedQueuePool if async_mode else InstrumentedQueuePool,
+        pool_size=int(os.getenv("DATABASE_POOL_SIZE", "10")),
+        max_overflow=int(os.getenv("DATABASE_MAX_OVERFLOW", "20")),
+        pool_pre_ping=True,
+        pool_recycle=3600,  # 1時間でコネクションをリサイクル
+    )
+    if uses_asyncpg:
+        options["connect_args"] = {
+            "prepared_statement_cache_size": settings.database_prepared_statement_cache_size,
+        }
+    return options
+
+
+def _instrument(engine: AsyncEngine | Engine, name: str) -> None:
+    """プールのメトリクスとスロークエリログのフックを登録"""
+    instrument_engine(engine, name)
+    if get_settings().slow_query_log_enabled:
+        get_slow_query_log().instrument(engine)
+
+
+class EngineRegistry:
+    """
+    エンジンレジストリ
+    
+    エンジンとセッションファクトリーを初回アクセス時に作成して保持する。
+    dispose() ですべてのプールを閉じ、次回アクセス時に作り直す。
+    """
+    
+    def __init__(self):
+        """初期化"""
+        self._async_engine: Optional[AsyncEngine] = None
+        self._replica_engines: Optional[List[AsyncEngine]] = None
+        self._replica_set: Optional[ReplicaSet] = None
+        self._sync_engine: Optional[Engine] = None
+        self._session_factory: Optional[async_sessionmaker[AsyncSession]] = None
+        self._read_only_session_factory: Optional[async_sessionmaker[AsyncSession]] = None
+        self._sync_session_factory: Optional[sessionmaker[Session]] = None
+    
+    @property
+    def async_engine(self) -> AsyncEngine:
+        """プライマリの非同期エンジン（asyncpg）"""
+        if self._async_engine is None:
+            url = get_database_url(async_mode=True)
+            self._async_engine = create_async_engine(url, **_engine_options(url))
+            _instrument(self._async_engine, "primary")
+        return self._async_engine
+    
+    @property
+    def replica_engines(self) -> List[AsyncEngine]:
+        """読み取りレプリカの非同期エンジン（未設定なら空）"""
+        if self._replica_engines is None:
+            self._replica_engines = [
+                create_async_engine(url, **_engine_options(url)) for url in get_replica_urls()
+            ]
+            for index, engine in enumerate(self._replica_engines):
+                _instrument(engine, f"replica{index}")
+        return self._replica_engines
+    
+    @property
+    def replica_set(self) -> Optional[ReplicaSet]:
+        """
+        読み取りレプリカの集合（未設定ならNone）
+        
+        レプリカの障害状態を全セッションファクトリーで共有するため1つだけ作成する。
+        """
+        if self._replica_set is None and self.replica_engines:
+            self._replica_set = ReplicaSet(
+                self.replica_engines,
+                retry_after=get_settings().database_replica_retry_seconds,
+            )
+        return self._replica_set
+    
+    @property
+    def sync_engine(self) -> Engine:
+        """同期エンジン（psycopg2、マイグレーション・スクリプト用）"""
+        if self._sync_engine is None:
+            url = get_database_url(async_mode=False)
+            self._sync_engine = create_engine(url, **_engine_options(url, async_mode=False))
+            _instrument(self._sync_engine, "sync")
+        return self._sync_engine
+    
+    @property
+    def session_factory(self) -> async_sessionmaker[AsyncSession]:
+        """非同期セッションファクトリー"""
+        if self._session_factory is None:
+            self._session_factory = self._make_session_factory(self.async_engine)
+        return self._session_factory
+    
+    @property
+    def read_only_session_factory(self) -> async_sessionmaker[AsyncSession]:
+        """読み取り専用の非同期セッションファクトリー"""
+        if self._read_only_session_factory is None:
+            # PostgreSQLでは BEGIN READ ONLY でトランザクションを開始する
+            # （プールへの返却時に解除される接続特性のため他のセッションには影響しない）
+            self._read_only_session_factory = self._make_session_factory(
+                self.async_engine.execution_options(postgresql_readonly=True),
+                route_reads=True,
+                info={READ_ONLY: True},
+            )
+        return self._read_only_session_factory
+    
+    def _make_session_factory(
+        self, bind: AsyncEngine, route_reads: bool = False, **kwargs: Any
+    ) -> async_sessionmaker[AsyncSession]:
+        """
+        セッションファクトリーを作成
+        
+        Args:
+            bind: プライマリのエンジン
+            route_reads: レプリカ設定時に SELECT をレプリカへ振り分ける場合True
+                （読み書きするセッションは遅延したレプリカを読んで上書きしないようプライマリに固定する）
+            **kwargs: async_sessionmaker に渡す追加の引数
+        """
+        if route_reads and self.replica_set is not None:
+            kwargs.update(sync_session_class=RoutingSession, replicas=self.replica_set)
+        
+        return async_sessionmaker(
+            bind=bind,
+            class_=AsyncSession,
+            expire_on_commit=False,
+            autoflush=False,
+            autocommit=False,
+            **kwargs,
+        )
+    
+    @property
+    def sync_session_factory(self) -> sessionmaker[Session]:
+        """同期セッションファクトリー"""
+        if self._sync_session_factory is None:
+            self._sync_session_factory = sessionmaker(
+                bind=self.sync_engine,
+                autocommit=False,
+                autoflush=False,
+            )
+        return self._sync_session_factory
+    
+    def built_engines(self) -> List[AsyncEngine | Engine]:
+        """作成済みのエンジン一覧"""
+        built: List[AsyncEngine | Engine] = []
+        if self._async_engine is not None:
+            built.append(self._async_engine)
+        built.extend(self._replica_engines or [])
+        if self._sync_engine is not None:
+            built.append(self._sync_engine)
+        return built
+    
+    async def dispose(self) -> None:
+        """作成済みのすべてのエンジンのプールを閉じる"""
+        for engine in self.built_engines():
+            if isinstance(engine, AsyncEngine):
+                await engine.dispose()
+            else:
+                engine.dispose()
+        
+        self._async_engine = None
+        self._replica_engines = None
+        self._replica_set = None
+        self._sync_engine = None
+        self._session_factory = None
+        self._read_only_session_factory = None
+        self._sync_session_factory = None
+
+
+# グローバルレジストリインスタンス
+_registry = EngineRegistry()
+
+
+def get_engine_registry() -> EngineRegistry:
+    """
+    エンジンレジストリを取得
+    
+    Returns:
+        EngineRegistry: エンジンレジストリ
+    """
+    return _registry
+
+
+def __getattr__(name: str) -> Any:
+    """旧来のモジュール属性（async_engine など）を遅延評価で提供（後方互換性のため）"""
+    lazy_attributes = {
+        "async_engine": "async_engine",
+        "sync_engine": "sync_engine",
+        "AsyncSessionLocal": "session_factory",
+        "SessionLocal": "sync_session_factory",
+    }
+    if name in lazy_attributes:
+        return getattr(_registry, lazy_attributes[name])
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 async def get_session() -> AsyncGenerator[AsyncSession, None]:
@@ -79,7 +309,7 @@ async def get_session() -> AsyncGenerator[AsyncSession, None]:
     Yields:
         AsyncSession: データベースセッション
     """
-    async with AsyncSessionLocal() as session:
+    async with _registry.session_factory() as session:
         try:
             yield session
             await session.commit()
@@ -90,6 +320,32 @@ async def get_session() -> AsyncGenerator[AsyncSession, None]:
             await session.close()
 
 
+async def get_read_only_session() -> AsyncGenerator[AsyncSession, None]:
+    """
+    読み取り専用のデータベースセッションを取得
+    
+    GETエンドポイントの依存性注入で使用する。PostgreSQLでは READ ONLY トランザクションで実行し、
+    コミットせずに閉じる（ロールバック）。
+    コネクションは最初のクエリ実行時にチェックアウトされるため、
+    キャッシュヒットなどでクエリを発行しないリクエストはプールを使用しない。
+    
+    Yields:
+        AsyncSession: 読み取り専用のデータベースセッション
+    """
+    async with _registry.read_only_session_factory() as session:
+        try:
+            yield session
+        finally:
+            await session.close()
+
+
+@event.listens_for(Session, "before_flush")
+def _reject_read_only_flush(session: Session, flush_context: Any, instances: Any) -> None:
+    """読み取り専用セッションでの書き込みを拒否"""
+    if session.info.get(READ_ONLY):
+        raise InvalidRequestError("Read-only session cannot flush changes")
+
+
 def get_sync_session():
     """
     同期データベースセッションを取得
@@ -99,8 +355,8 @@ def get_sync_session():
     Returns:
         Session: 同期データベースセッション
     """
-    return SessionLocal()
+    return _registry.sync_session_factory()
 
 
 # エイリアス（後方互換性のため）
-get_async_session = get_session
\ No newline at end of file
+get_async_session = get_session
@@ -0,0 +1,106 @@
+"""
+問い合わせ件数カウンターの集約
+
+contacts のトリガーが contact_counts に追加した増減の行を、
+ステータス・レッスンタイプごとに1行へまとめるバックグラウンドワーカー。
+"""
+
+import asyncio
+import logging
+from collections import defaultdict
+from contextlib import suppress
+from typing import Dict, Optional, Tuple
+
+from sqlalchemy import delete, insert
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from .models.contact_count import ContactCountModel
+
+logger = logging.getLogger(__name__)
+
+_counts = ContactCountModel.__table__
+
+
+class ContactCountCompactor:
+    """
+    問い合わせ件数カウンターの集約ワーカー
+
+    増減の行を DELETE ... RETURNING で取り出し、合計を1行ずつ書き戻す（同じトランザクション）。
+    取り出すのはコミット済みの行だけのため、集約中に書き込まれた増減の行は次回に回り、
+    集約の前後で合計は変わらない。問い合わせの書き込みはカウンターの行を更新しないので待たされない。
+    """
+
+    def __init__(self, engine: AsyncEngine, interval: float = 60.0):
+        """
+        初期化
+
+        Args:
+            engine: contact_counts のあるデータベースのエンジン
+            interval: 集約する間隔（秒）
+        """
+        self._engine = engine
+        self._interval = interval
+        self._stopping = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def running(self) -> bool:
+        """ワーカーが起動している場合True"""
+        return self._task is not None
+
+    async def start(self) -> None:
+        """ワーカーを起動"""
+        if self._task is not None:
+            return
+        self._stopping = asyncio.Event()
+        self._task = asyncio.create_task(self._run(), name="contact-count-compactor")
+        logger.info(f"Started contact count compactor (every {self._interval}s)")
+
+    async def stop(self) -> None:
+        """処理中の集約を終えてからワーカーを停止"""
+        if self._task is None:
+            return
+        self._stopping.set()
+        try:
+            await self._task
+        except Exception as e:
+            logger.error(f"Contact count compactor stopped with an error: {e}", exc_info=True)
+        self._task = None
+        logger.info("Stopped contact count compactor")
+
+    async def compact_once(self) -> int:
+        """
+        増減の行をステータス・レッスンタイプごとの1行に集約
+
+        Returns:
+            int: 集約した（削除した）行数
+        """
+        async with self._engine.begin() as connection:
+            rows = (
+                await connection.execute(
+                    delete(_counts).returning(_counts.c.status, _counts.c.lesson_type, _counts.c.count)
+                )
+            ).all()
+            totals: Dict[Tuple[str, str], int] = defaultdict(int)
+            for status, lesson_type, count in rows:
+                totals[(status, lesson_type)] += count
+            values = [
+                {"status": status, "lesson_type": lesson_type, "count": count}
+                for (status, lesson_type), count in totals.items()
+                if count
+            ]
+            if values:
+                await connection.execute(insert(_counts), values)
+        return len(rows)
+
+    async def _run(self) -> None:
+        """起動時と interval ごとに集約"""
+        while True:
+            try:
+                await self.compact_once()
+            except Exception as e:
+                logger.error(f"Error compacting contact counts: {e}", exc_info=True)
+            with suppress(TimeoutError):
+                await asyncio.wait_for(self._stopping.wait(), self._interval)
+            if self._stopping.is_set():
+                return
@@ -6,5 +6,7 @@ SQLAlchemyモデル
 
 from .base import Base
 from .contact import ContactModel
+from .contact_count import ContactCountModel
+from .event_outbox import EventOutboxModel
 
-__all__ = ["Base", "ContactModel"]
\ No newline at end of file
+__all__ = ["Base", "ContactModel", "ContactCountModel", "EventOutboxModel"]
\ No newline at end of file
@@ -7,7 +7,7 @@ Contactモデル
 from datetime import datetime
 from typing import Optional
 
-from sqlalchemy import DateTime, String, Text
+from sqlalchemy import DateTime, Index, String, Text
 from sqlalchemy.orm import Mapped, mapped_column
 
 from .base import Base, TimestampMixin, UUIDMixin
@@ -93,4 +93,25 @@ class ContactModel(Base, UUIDMixin, TimestampMixin):
         return (
             f"<ContactModel(id='{self.id}', name='{self.name}', "
             f"email='{self.email}', status='{self.status}')>"
-        )
\ No newline at end of file
+        )
+
+
+# キーセットページネーション用（find_page の ORDER BY と一致させる）
+Index(
+    "ix_contacts_created_at_id",
+    ContactModel.created_at.desc(),
+    ContactModel.id.desc(),
+)
+
+# find_by_email 用
+Index("ix_contacts_email", ContactModel.email)
+
+# ステータス別の新着順検索用（iter_all のステータス指定。ORDER BY と一致させてソートを不要にする）
+# 未処理（pending）の一覧もこのインデックスの先頭列で絞り込める。部分インデックスは
+# リポジトリがステータスをバインド変数で渡すため汎用プランで使われず、作成しない
+Index(
+    "ix_contacts_status_created_at",
+    ContactModel.status,
+    ContactModel.created_at.desc(),
+    ContactModel.id.desc(),
+)
@@ -0,0 +1,120 @@
+"""
+ContactCountモデル
+
+ステータス・レッスンタイプ別の問い合わせ件数カウンターのORM定義
+"""
+
+from sqlalchemy import DDL, BigInteger, Integer, String, event
+from sqlalchemy.orm import Mapped, mapped_column
+
+from .base import Base
+
+
+class ContactCountModel(Base):
+    """
+    問い合わせ件数カウンターモデル
+    
+    contacts テーブルのトリガーが INSERT/UPDATE/DELETE と同じトランザクション内に
+    件数の増減（+1/-1）を1行ずつ追加し、件数はステータス・レッスンタイプごとの合計とする。
+    同じ行を更新しないため、同時に問い合わせを書き込むトランザクションが行ロックで待ち合わない。
+    増減の行は ContactCountCompactor が定期的に1行ずつに集約する。
+    """
+    
+    __tablename__ = "contact_counts"
+    __table_args__ = {"comment": "問い合わせ件数カウンター（増減の行）"}
+    
+    # 増減の行の連番（SQLiteでは INTEGER PRIMARY KEY で自動採番）
+    id: Mapped[int] = mapped_column(
+        BigInteger().with_variant(Integer, "sqlite"),
+        primary_key=True,
+        autoincrement=True,
+        comment="ID"
+    )
+    
+    status: Mapped[str] = mapped_column(
+        String(20),
+        nullable=False,
+        comment="ステータス"
+    )
+    
+    lesson_type: Mapped[str] = mapped_column(
+        String(20),
+        nullable=False,
+        comment="レッスンタイプ"
+    )
+    
+    count: Mapped[int] = mapped_column(
+        BigInteger,
+        nullable=False,
+        comment="件数の増減"
+    )
+    
+    def __repr__(self) -> str:
+        """デバッグ用文字列表現"""
+        return (
+            f"<ContactCountModel(id={self.id}, status='{self.status}', "
+            f"lesson_type='{self.lesson_type}', count={self.count})>"
+        )
+
+
+# カウンター維持トリガー（create_all 用。本番環境はマイグレーションで作成）
+_POSTGRESQL_TRIGGER_DDL = [
+    """
+    CREATE OR REPLACE FUNCTION contact_counts_maintain() RETURNS trigger AS $$
+    BEGIN
+        IF TG_OP IN ('UPDATE', 'DELETE') THEN
+            INSERT INTO contact_counts (status, lesson_type, count)
+            VALUES (OLD.status, OLD.lesson_type, -1);
+        END IF;
+        IF TG_OP IN ('INSERT', 'UPDATE') THEN
+            INSERT INTO contact_counts (status, lesson_type, count)
+            VALUES (NEW.status, NEW.lesson_type, 1);
+        END IF;
+        RETURN NULL;
+    END
+    $$ LANGUAGE plpgsql
+    """,
+    """
+    CREATE TRIGGER contacts_counts_insert_delete
+    AFTER INSERT OR DELETE ON contacts
+    FOR EACH ROW EXECUTE FUNCTION contact_counts_maintain()
+    """,
+    """
+    CREATE TRIGGER contacts_counts_update
+    AFTER UPDATE OF status, lesson_type ON contacts
+    FOR EACH ROW
+    WHEN (OLD.status IS DISTINCT FROM NEW.status OR OLD.lesson_type IS DISTINCT FROM NEW.lesson_type)
+    EXECUTE FUNCTION contact_counts_maintain()
+    """,
+]
+
+_SQLITE_TRIGGER_DDL = [
+    """
+    CREATE TRIGGER contacts_counts_insert AFTER INSERT ON contacts
+    BEGIN
+        INSERT INTO contact_counts (status, lesson_type, count)
+        VALUES (NEW.status, NEW.lesson_type, 1);
+    END
+    """,
+    """
+    CREATE TRIGGER contacts_counts_delete AFTER DELETE ON contacts
+    BEGIN
+        INSERT INTO contact_counts (status, lesson_type, count)
+        VALUES (OLD.status, OLD.lesson_type, -1);
+    END
+    """,
+    """
+    CREATE TRIGGER contacts_counts_update AFTER UPDATE OF status, lesson_type ON contacts
+    WHEN OLD.status IS NOT NEW.status OR OLD.lesson_type IS NOT NEW.lesson_type
+    BEGIN
+        INSERT INTO contact_counts (status, lesson_type, count)
+        VALUES (OLD.status, OLD.lesson_type, -1), (NEW.status, NEW.lesson_type, 1);
+    END
+    """,
+]
+
+# トリガーは contacts / contact_counts の両方が揃ってから作成する
+for _statement in _POSTGRESQL_TRIGGER_DDL:
+    event.listen(Base.metadata, "after_create", DDL(_statement).execute_if(dialect="postgresql"))
+for _statement in _SQLITE_TRIGGER_DDL:
+    event.listen(Base.metadata, "after_create", DDL(_statement).execute_if(dialect="sqlite"))
@@ -0,0 +1,126 @@
+"""
+EventOutboxモデル
+
+トランザクショナルアウトボックス（配信待ちドメインイベント）テーブルのORM定義
+"""
+
+from datetime import datetime
+from typing import Any, Dict, Optional
+from uuid import UUID
+
+from sqlalchemy import (
+    DDL,
+    JSON,
+    BigInteger,
+    DateTime,
+    Index,
+    Integer,
+    String,
+    Text,
+    event,
+)
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Mapped, mapped_column
+
+from .base import GUID, Base
+
+# 新しい行を通知する LISTEN/NOTIFY のチャンネル
+OUTBOX_CHANNEL = "event_outbox"
+
+
+class EventOutboxModel(Base):
+    """
+    イベントアウトボックスモデル
+    
+    ドメインイベントを発生元のエンティティと同じトランザクションで書き込み、
+    リレーワーカーが配信後に削除する（行数は配信待ちの件数に保たれるため主キー以外の索引は持たない）。
+    available_at が NULL の行は再試行を打ち切ったイベント（確認して手動で再投入する）。
+    """
+    
+    __tablename__ = "event_outbox"
+    __table_args__ = {"comment": "配信待ちドメインイベント"}
+    
+    # 書き込み順に配信するための連番（SQLiteでは INTEGER PRIMARY KEY で自動採番）
+    id: Mapped[int] = mapped_column(
+        BigInteger().with_variant(Integer, "sqlite"),
+        primary_key=True,
+        autoincrement=True,
+        comment="ID"
+    )
+    
+    event_id: Mapped[UUID] = mapped_column(
+        GUID(),
+        nullable=False,
+        unique=True,
+        comment="イベントID"
+    )
+    
+    event_type: Mapped[str] = mapped_column(
+        String(100),
+        nullable=False,
+        comment="イベントタイプ"
+    )
+    
+    payload: Mapped[Dict[str, Any]] = mapped_column(
+        JSON().with_variant(JSONB(), "postgresql"),
+        nullable=False,
+        comment="DomainEvent.to_dict() の結果"
+    )
+    
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        comment="書き込み日時"
+    )
+    
+    available_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True),
+        nullable=True,
+        comment="配信可能日時（再試行の待機、NULLは再試行打ち切り）"
+    )
+    
+    attempts: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=0,
+        comment="配信失敗回数"
+    )
+    
+    last_error: Mapped[Optional[str]] = mapped_column(
+        Text,
+        nullable=True,
+        comment="最後の配信エラー"
+    )
+    
+    def __repr__(self) -> str:
+        """デバッグ用文字列表現"""
+        return (
+            f"<EventOutboxModel(id={self.id}, event_type='{self.event_type}', "
+            f"attempts={self.attempts})>"
+        )
+
+
+# リレーの確保（available_at <= now）用。行が溜まってもポーリングのたびに全行を走査しない
+Index("ix_event_outbox_available_at", EventOutboxModel.available_at)
+
+
+# 書き込みを LISTEN 中のリレーワーカーに通知するトリガー（create_all 用。本番環境はマイグレーションで作成）
+# 文単位で通知し、同じトランザクション内の同一通知は PostgreSQL がまとめる
+_POSTGRESQL_NOTIFY_DDL = [
+    f"""
+    CREATE OR REPLACE FUNCTION event_outbox_notify() RETURNS trigger AS $$
+    BEGIN
+        PERFORM pg_notify('{OUTBOX_CHANNEL}', '');
+        RETURN NULL;
+    END
+    $$ LANGUAGE plpgsql
+    """,
+    """
+    CREATE TRIGGER event_outbox_notify
+    AFTER INSERT ON event_outbox
+    FOR EACH STATEMENT EXECUTE FUNCTION event_outbox_notify()
+    """,
+]
+
+for _statement in _POSTGRESQL_NOTIFY_DDL:
+    event.listen(EventOutboxModel.__table__, "after_create", DDL(_statement).execute_if(dialect="postgresql"))
@@ -0,0 +1,162 @@
+"""
+コネクションプールのメトリクス
+
+チェックアウト待ち時間、使用中・アイドル・オーバーフロー数、
+プリピング失敗、リサイクル回数を記録する
+"""
+
+import time
+import weakref
+from typing import Callable, Dict, Optional
+
+from sqlalchemy import event, exc
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+from ..metrics import get_metrics_registry
+
+# チェックアウト待ち時間のバケット（秒）
+CHECKOUT_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 5.0, 30.0)
+
+# _ConnectionRecord.record_info に保持するフラグ（再接続の理由の判定用）
+_CONNECTED_KEY = "metrics_connected"
+_INVALIDATED_KEY = "metrics_invalidated"
+
+CheckoutObserver = Callable[[float], None]
+
+_metrics = get_metrics_registry()
+
+checkout_seconds = _metrics.histogram(
+    "db_pool_checkout_seconds",
+    "Time spent waiting for a connection from the pool",
+    ("pool",),
+    buckets=CHECKOUT_BUCKETS,
+)
+connections_created = _metrics.counter(
+    "db_pool_connections_created_total",
+    "DBAPI connections opened by the pool",
+    ("pool",),
+)
+recycles = _metrics.counter(
+    "db_pool_recycles_total",
+    "Connections replaced because they exceeded pool_recycle or were soft-invalidated",
+    ("pool",),
+)
+invalidations = _metrics.counter(
+    "db_pool_invalidations_total",
+    "Connections invalidated after a disconnect",
+    ("pool",),
+)
+pre_ping_failures = _metrics.counter(
+    "db_pool_pre_ping_failures_total",
+    "Checkouts whose pre-ping found a dead connection",
+    ("pool",),
+)
+
+# 計測対象のエンジン（プール名 -> エンジンの弱参照）
+_engines: Dict[str, "weakref.ReferenceType[Engine]"] = {}
+
+
+class _CheckoutTimingMixin:
+    """プールからの取得（_do_get）にかかった時間を通知するミックスイン"""
+
+    checkout_observer: Optional[CheckoutObserver] = None
+
+    def _do_get(self):
+        started = time.perf_counter()
+        record = super()._do_get()
+        if self.checkout_observer is not None:
+            self.checkout_observer(time.perf_counter() - started)
+        return record
+
+    def recreate(self):
+        # Engine.dispose() は recreate() で作り直したプールに差し替えるため引き継ぐ
+        pool = super().recreate()
+        pool.checkout_observer = self.checkout_observer
+        return pool
+
+
+class InstrumentedQueuePool(_CheckoutTimingMixin, QueuePool):
+    """チェックアウト時間を計測する QueuePool（同期エンジン用）"""
+
+
+class InstrumentedAsyncAdaptedQueuePool(_CheckoutTimingMixin, AsyncAdaptedQueuePool):
+    """チェックアウト時間を計測する AsyncAdaptedQueuePool（非同期エンジン用）"""
+
+
+def _pool_gauge(attribute: str) -> Callable[[], list]:
+    """計測対象の各プールから値を収集するコールバックを作成"""
+    def collect() -> list:
+        samples = []
+        for name, engine_ref in list(_engines.items()):
+            engine = engine_ref()
+            pool = engine.pool if engine is not None else None
+            if not isinstance(pool, QueuePool):
+                continue
+            samples.append(({"pool": name}, getattr(pool, attribute)()))
+        return samples
+    return collect
+
+
+_metrics.gauge(
+    "db_pool_connections_in_use",
+    "Connections currently checked out",
+    ("pool",),
+    collect=_pool_gauge("checkedout"),
+)
+_metrics.gauge(
+    "db_pool_connections_idle",
+    "Connections idle in the pool",
+    ("pool",),
+    collect=_pool_gauge("checkedin"),
+)
+_metrics.gauge(
+    "db_pool_overflow",
+    "Connections open beyond pool_size (negative while the pool is still filling)",
+    ("pool",),
+    collect=_pool_gauge("overflow"),
+)
+_metrics.gauge(
+    "db_pool_size",
+    "Configured pool_size",
+    ("pool",),
+    collect=_pool_gauge("size"),
+)
+
+
+def instrument_engine(engine: AsyncEngine | Engine, name: str) -> None:
+    """
+    エンジンのプールにメトリクス用のリスナーを登録
+
+    チェックアウト時間は InstrumentedQueuePool / InstrumentedAsyncAdaptedQueuePool
+    を使用している場合のみ記録する。
+
+    Args:
+        engine: 計測対象のエンジン
+        name: メトリクスの pool ラベル
+    """
+    sync_engine = engine.sync_engine if isinstance(engine, AsyncEngine) else engine
+    _engines[name] = weakref.ref(sync_engine)
+
+    if isinstance(sync_engine.pool, _CheckoutTimingMixin):
+        sync_engine.pool.checkout_observer = (
+            lambda elapsed: checkout_seconds.observe(elapsed, pool=name)
+        )
+
+    @event.listens_for(sync_engine, "connect")
+    def on_connect(dbapi_connection, connection_record):
+        connections_created.inc(pool=name)
+        record_info = connection_record.record_info
+        # 同じレコードでの再接続は、無効化によるものでなければリサイクル
+        if record_info.get(_CONNECTED_KEY) and not record_info.pop(_INVALIDATED_KEY, False):
+            recycles.inc(pool=name)
+        record_info[_CONNECTED_KEY] = True
+
+    @event.listens_for(sync_engine, "invalidate")
+    def on_invalidate(dbapi_connection, connection_record, exception):
+        invalidations.inc(pool=name)
+        connection_record.record_info[_INVALIDATED_KEY] = True
+        # プリピングで切断を検出した場合は InvalidatePoolError で無効化される
+        if isinstance(exception, exc.InvalidatePoolError):
+            pre_ping_failures.inc(pool=name)
@@ -0,0 +1,152 @@
+"""
+プライマリ/レプリカ読み取りルーティング
+
+読み取り専用の SELECT をレプリカに、書き込みとそれ以降の読み取りをプライマリに振り分ける
+"""
+
+import itertools
+import logging
+import time
+from typing import Callable, Dict, List, Optional
+
+from sqlalchemy import Delete, Insert, Select, Update, event
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.orm import Session
+
+logger = logging.getLogger(__name__)
+
+# Session.info に保存する「プライマリ固定」フラグのキー
+PINNED_TO_PRIMARY = "pinned_to_primary"
+# Session.info に保存する、トランザクション中の読み取り先エンジンのキー
+READ_BIND = "read_bind"
+
+
+class ReplicaSet:
+    """
+    レプリカエンジンの集合
+    
+    正常なレプリカをラウンドロビンで選択する。接続エラーが発生したレプリカは
+    retry_after 秒間除外し、正常なレプリカがなければプライマリを使用する。
+    """
+    
+    def __init__(
+        self,
+        replicas: List[AsyncEngine],
+        retry_after: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        初期化
+        
+        Args:
+            replicas: レプリカの非同期エンジン
+            retry_after: 障害レプリカを再度試すまでの秒数
+            clock: 現在時刻（秒）を返す関数
+        """
+        self._replicas = [replica.sync_engine for replica in replicas]
+        self._retry_after = retry_after
+        self._clock = clock
+        self._unhealthy_until: Dict[Engine, float] = {}
+        self._cycle = itertools.cycle(self._replicas)
+        
+        for replica in self._replicas:
+            event.listen(replica, "handle_error", self._on_error)
+    
+    def choose(self) -> Optional[Engine]:
+        """
+        読み取りに使うレプリカを選択
+        
+        Returns:
+            Optional[Engine]: 正常なレプリカ。すべて障害中の場合はNone
+        """
+        now = self._clock()
+        for _ in range(len(self._replicas)):
+            replica = next(self._cycle)
+            if self._unhealthy_until.get(replica, 0.0) <= now:
+                return replica
+        return None
+    
+    def mark_unhealthy(self, replica: Engine) -> None:
+        """レプリカを一定時間除外"""
+        self._unhealthy_until[replica] = self._clock() + self._retry_after
+        logger.warning(
+            f"Replica {replica.url.render_as_string(hide_password=True)} marked unhealthy "
+            f"for {self._retry_after}s, reads fall back to primary"
+        )
+    
+    def is_healthy(self, replica: Engine) -> bool:
+        """レプリカが正常か判定"""
+        return self._unhealthy_until.get(replica, 0.0) <= self._clock()
+    
+    def _on_error(self, context) -> None:
+        """接続断・接続失敗を検知してレプリカを除外"""
+        if context.is_disconnect or context.connection is None:
+            self.mark_unhealthy(context.engine)
+
+
+class RoutingSession(Session):
+    """
+    読み取りルーティングセッション
+    
+    - INSERT/UPDATE/DELETE、flush、FOR UPDATE 付き SELECT はプライマリ
+    - 一度でも書き込んだセッションは以降の読み取りもプライマリに固定（read-your-writes）
+    - それ以外の SELECT は正常なレプリカ（なければプライマリ）
+    
+    読み取り先はトランザクションの最初の SELECT で1つ選び、トランザクションが終わるまで使い続ける
+    （同じトランザクションの読み取りが同じスナップショットを見て、接続も1つで済むように）。
+    選んだレプリカが途中で障害になった場合だけ選び直す。
+    レプリカへの接続失敗・接続断で失敗した SELECT は、プライマリで1回だけ再実行する
+    （以降のトランザクション中の読み取りもプライマリを使う）。
+    """
+    
+    def __init__(self, *args, replicas: ReplicaSet, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._replicas = replicas
+    
+    def get_bind(self, mapper=None, clause=None, **kwargs):
+        """ステートメントに応じて接続先エンジンを選択"""
+        primary = super().get_bind(mapper=mapper, clause=clause, **kwargs)
+        
+        if self._flushing or isinstance(clause, (Insert, Update, Delete)):
+            self.info[PINNED_TO_PRIMARY] = True
+            return primary
+        
+        if (
+            self.info.get(PINNED_TO_PRIMARY)
+            or not isinstance(clause, Select)
+            or clause._for_update_arg is not None
+        ):
+            return primary
+        
+        read_bind = self.info.get(READ_BIND)
+        if read_bind is None or not (read_bind is primary or self._replicas.is_healthy(read_bind)):
+            read_bind = self.info[READ_BIND] = self._replicas.choose() or primary
+        return read_bind
+    
+    def execute(self, statement, *args, **kwargs):
+        """ステートメントを実行（レプリカの障害で失敗した SELECT はプライマリで再実行）"""
+        try:
+            return super().execute(statement, *args, **kwargs)
+        except DBAPIError:
+            replica = self.info.get(READ_BIND)
+            primary = super().get_bind()
+            # 障害として除外されたレプリカでの読み取りだけを再実行（SQLエラーはそのまま送出）
+            if (
+                not isinstance(statement, Select)
+                or replica is None
+                or replica is primary
+                or self._replicas.is_healthy(replica)
+            ):
+                raise
+            logger.warning("Read on an unhealthy replica failed, retrying on primary")
+            self.info[READ_BIND] = primary
+            return super().execute(statement, *args, **kwargs)
+
+
+@event.listens_for(RoutingSession, "after_transaction_end")
+def _release_read_bind(session: Session, transaction) -> None:
+    """トランザクションの終了時に読み取り先の選択を解除"""
+    if transaction.parent is None:
+        session.info.pop(READ_BIND, None)
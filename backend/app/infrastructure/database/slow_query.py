@@ -0,0 +1,267 @@
+"""
+スロークエリログ
+
+しきい値を超えたステートメントを、フィンガープリント・パラメータの形・所要時間・
+呼び出し元のリポジトリメソッドとともにログに記録する。
+サンプリングしたスロークエリは実行計画（PostgreSQLでは EXPLAIN (ANALYZE, BUFFERS)）を取得し、
+直近のものをリングバッファに保持する（管理APIから参照）。
+"""
+
+import hashlib
+import logging
+import random
+import re
+import sys
+import time
+from collections import deque
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from types import FrameType
+from typing import Any, Callable, Deque, List, Optional
+
+from greenlet import getcurrent
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from ...config import get_settings
+
+logger = logging.getLogger(__name__)
+
+# Connection.info に保存する実行開始時刻のスタックのキー
+_STARTED_AT = "slow_query_started_at"
+
+# 呼び出し元として記録するモジュール
+_CALLER_MODULE_PREFIX = "app.infrastructure.repositories."
+
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r"(?<![\w$])-?\d+(?:\.\d+)?\b")
+_PLACEHOLDER = re.compile(r"\$\d+|%\(\w+\)s|%s|(?<!:):\w+|\?")
+_VALUE_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+_WHITESPACE = re.compile(r"\s+")
+
+# 実行計画を取得するSQL（方言ごと）
+_EXPLAIN_PREFIXES = {
+    "postgresql": "EXPLAIN (ANALYZE, BUFFERS) ",
+    "sqlite": "EXPLAIN QUERY PLAN ",
+}
+
+
+def normalize_statement(statement: str) -> str:
+    """
+    ステートメントを正規化
+
+    リテラルとプレースホルダーを ? に、値リスト（IN句など）を (...) に置き換え、
+    空白をまとめる。パラメータの個数が違うだけのステートメントは同じ結果になる。
+    """
+    normalized = _STRING_LITERAL.sub("?", statement)
+    normalized = _PLACEHOLDER.sub("?", normalized)
+    normalized = _NUMBER_LITERAL.sub("?", normalized)
+    normalized = _VALUE_LIST.sub("(...)", normalized)
+    return _WHITESPACE.sub(" ", normalized).strip()
+
+
+def fingerprint(statement: str) -> str:
+    """正規化したステートメントのフィンガープリント（SHA-1の先頭16桁）"""
+    return _hash(normalize_statement(statement))
+
+
+def _hash(normalized: str) -> str:
+    """正規化済みステートメントのハッシュ"""
+    return hashlib.sha1(normalized.encode()).hexdigest()[:16]
+
+
+def parameters_shape(parameters: Any, executemany: bool = False) -> str:
+    """
+    パラメータの形（型と個数）を文字列で表す
+
+    値は個人情報を含みうるため記録しない。
+    """
+    if executemany:
+        first = parameters[0] if parameters else ()
+        return f"{len(parameters)} x {parameters_shape(first)}"
+    if isinstance(parameters, dict):
+        return "{" + ", ".join(f"{key}: {type(value).__name__}" for key, value in parameters.items()) + "}"
+    if isinstance(parameters, (list, tuple)):
+        return "(" + ", ".join(type(value).__name__ for value in parameters) + ")"
+    return type(parameters).__name__
+
+
+def _repository_method(frame: Optional[FrameType]) -> Optional[str]:
+    """フレームを外側へたどり、最初に見つかったリポジトリのメソッド名を返す"""
+    while frame is not None:
+        if frame.f_globals.get("__name__", "").startswith(_CALLER_MODULE_PREFIX):
+            return frame.f_code.co_qualname
+        frame = frame.f_back
+    return None
+
+
+def find_caller() -> Optional[str]:
+    """
+    ステートメントを発行したリポジトリのメソッドを特定
+
+    AsyncSession ではDBアクセスが子グリーンレット内で実行されるため、
+    見つからなければ親グリーンレット（リポジトリのコルーチンが待機中）をたどる。
+    """
+    caller = _repository_method(sys._getframe(1))
+    if caller is None:
+        parent = getcurrent().parent
+        if parent is not None:
+            caller = _repository_method(parent.gr_frame)
+    return caller
+
+
+@dataclass(frozen=True)
+class SlowQuery:
+    """スロークエリの記録"""
+
+    fingerprint: str
+    statement: str
+    parameters_shape: str
+    duration_ms: float
+    caller: Optional[str]
+    occurred_at: datetime
+    plan: Optional[str] = None
+
+
+class SlowQueryLog:
+    """
+    スロークエリログ
+
+    instrument() したエンジンのステートメントの所要時間を計測し、
+    threshold_ms を超えたものをログとリングバッファに記録する。
+    explain_sample_rate の割合で SELECT の実行計画を同じトランザクション内で取得する
+    （セーブポイント内で実行するため、取得に失敗してもトランザクションは継続する）。
+    """
+
+    def __init__(
+        self,
+        threshold_ms: float = 500.0,
+        explain_sample_rate: float = 0.0,
+        buffer_size: int = 100,
+        random_func: Callable[[], float] = random.random,
+    ):
+        """
+        初期化
+
+        Args:
+            threshold_ms: スロークエリとみなす所要時間（ミリ秒）
+            explain_sample_rate: 実行計画を取得する割合（0.0〜1.0）
+            buffer_size: 保持するスロークエリの件数
+            random_func: サンプリング用の乱数関数
+        """
+        self.threshold_ms = threshold_ms
+        self.explain_sample_rate = explain_sample_rate
+        self._random = random_func
+        self._entries: Deque[SlowQuery] = deque(maxlen=buffer_size)
+
+    def instrument(self, engine: AsyncEngine | Engine) -> None:
+        """エンジンにフックを登録"""
+        sync_engine = engine.sync_engine if isinstance(engine, AsyncEngine) else engine
+        event.listen(sync_engine, "before_cursor_execute", self._before_cursor_execute)
+        event.listen(sync_engine, "after_cursor_execute", self._after_cursor_execute)
+        event.listen(sync_engine, "handle_error", self._handle_error)
+
+    def entries(self) -> List[SlowQuery]:
+        """記録されたスロークエリ（新しい順）"""
+        return list(reversed(self._entries))
+
+    def clear(self) -> None:
+        """記録をすべて削除"""
+        self._entries.clear()
+
+    def _before_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault(_STARTED_AT, []).append(time.perf_counter())
+
+    def _after_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        started_at = conn.info[_STARTED_AT].pop()
+        duration_ms = (time.perf_counter() - started_at) * 1000
+        if duration_ms < self.threshold_ms:
+            return
+
+        plan = None
+        if self._should_explain(statement, context, executemany):
+            plan = self._explain(conn, statement, parameters)
+
+        normalized = normalize_statement(statement)
+        entry = SlowQuery(
+            fingerprint=_hash(normalized),
+            statement=normalized,
+            parameters_shape=parameters_shape(parameters, executemany),
+            duration_ms=round(duration_ms, 3),
+            caller=find_caller(),
+            occurred_at=datetime.now(timezone.utc),
+            plan=plan,
+        )
+        self._entries.append(entry)
+        logger.warning(
+            f"Slow query {entry.fingerprint} took {entry.duration_ms:.1f}ms "
+            f"(caller={entry.caller}, parameters={entry.parameters_shape}): {entry.statement}"
+        )
+
+    def _handle_error(self, context) -> None:
+        # 失敗したステートメントの開始時刻を破棄
+        connection = context.connection
+        if connection is not None and connection.info.get(_STARTED_AT):
+            connection.info[_STARTED_AT].pop()
+
+    def _should_explain(self, statement: str, context, executemany: bool) -> bool:
+        """実行計画を取得するか判定"""
+        if self.explain_sample_rate <= 0 or executemany:
+            return False
+        # EXPLAIN ANALYZE は実行を伴うため SELECT のみ。ストリーミング中のカーソルにも干渉しない
+        if statement.lstrip()[:6].upper() != "SELECT":
+            return False
+        if context is not None and context.execution_options.get("stream_results"):
+            return False
+        return self._random() < self.explain_sample_rate
+
+    def _explain(self, conn, statement: str, parameters: Any) -> Optional[str]:
+        """実行計画を取得（失敗した場合はNone）"""
+        prefix = _EXPLAIN_PREFIXES.get(conn.dialect.name)
+        if prefix is None:
+            return None
+
+        cursor = conn.connection.cursor()
+        try:
+            cursor.execute("SAVEPOINT slow_query_explain")
+            try:
+                cursor.execute(prefix + statement, parameters)
+                rows = cursor.fetchall()
+            except Exception as e:
+                cursor.execute("ROLLBACK TO SAVEPOINT slow_query_explain")
+                logger.debug(f"EXPLAIN failed for slow query: {e}")
+                return None
+            finally:
+                cursor.execute("RELEASE SAVEPOINT slow_query_explain")
+        except Exception as e:
+            # トランザクション外（AUTOCOMMIT）などでセーブポイントを使えない場合
+            logger.debug(f"Could not capture plan for slow query: {e}")
+            return None
+        finally:
+            cursor.close()
+
+        # PostgreSQLは1行1列、SQLiteは (id, parent, notused, detail)
+        return "\n".join(str(row[-1]) for row in rows)
+
+
+# グローバルスロークエリログ（初回使用時に設定から作成）
+_slow_query_log: Optional[SlowQueryLog] = None
+
+
+def get_slow_query_log() -> SlowQueryLog:
+    """
+    スロークエリログを取得
+
+    Returns:
+        SlowQueryLog: スロークエリログ
+    """
+    global _slow_query_log
+    if _slow_query_log is None:
+        settings = get_settings()
+        _slow_query_log = SlowQueryLog(
+            threshold_ms=settings.slow_query_threshold_ms,
+            explain_sample_rate=settings.slow_query_explain_sample_rate,
+            buffer_size=settings.slow_query_buffer_size,
+        )
+    return _slow_query_log
@@ -0,0 +1,207 @@
+"""
+ユニットオブワーク
+
+AsyncSession のトランザクション単位でドメインイベントを集め、
+コミット後にまとめてイベントバスへ配信する。
+ロールバックされたトランザクションのイベントは配信しない。
+アウトボックスを有効にした場合は、イベントを同じトランザクションで event_outbox に書き込み、
+配信はリレーワーカー（OutboxRelay）に任せる。
+"""
+
+import logging
+from datetime import datetime, timezone
+from typing import Any, Callable, List, Optional, Protocol, Sequence
+
+from sqlalchemy import event, insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, SessionTransaction
+
+from ...domain.events.base import DomainEvent
+from ..event_bus.event_bus import EventBus
+from .models.event_outbox import EventOutboxModel
+
+logger = logging.getLogger(__name__)
+
+# Session.info のキー
+# ユニットオブワークが有効なセッション（イベントを集めるのはこの間だけ）
+ACTIVE_UNIT_OF_WORK = "unit_of_work_active"
+# イベント
+# コミット前（ロールバックで破棄）
+PENDING_EVENTS = "pending_domain_events"
+# コミット済み（配信待ち）
+COMMITTED_EVENTS = "committed_domain_events"
+# コミット後に実行するコールバック（キャッシュの無効化など、ロールバックで破棄）
+AFTER_COMMIT_CALLBACKS = "after_commit_callbacks"
+
+
+class HasDomainEvents(Protocol):
+    """ドメインイベントを蓄積するエンティティ"""
+
+    def get_domain_events(self) -> List[DomainEvent]: ...
+
+    def clear_domain_events(self) -> None: ...
+
+
+def collect_domain_events(session: AsyncSession | Session, entity: HasDomainEvents) -> None:
+    """
+    エンティティのドメインイベントをセッションに移す
+
+    リポジトリが保存時に呼び出す。移したイベントはエンティティから削除する。
+    ユニットオブワークが有効でないセッションでは、コミットしても配信する者がいないため
+    イベントを移さずエンティティに残す。
+
+    Args:
+        session: 保存に使ったセッション
+        entity: 保存したエンティティ
+    """
+    if not session.info.get(ACTIVE_UNIT_OF_WORK):
+        return
+    events = entity.get_domain_events()
+    if events:
+        session.info.setdefault(PENDING_EVENTS, []).extend(events)
+        entity.clear_domain_events()
+
+
+def call_after_commit(session: AsyncSession | Session, callback: Callable[[], None]) -> None:
+    """
+    現在のトランザクションのコミット後に callback を呼び出す
+
+    ロールバックされた場合は呼び出さない。
+
+    Args:
+        session: 書き込みに使ったセッション
+        callback: 引数なしの同期関数
+    """
+    session.info.setdefault(AFTER_COMMIT_CALLBACKS, []).append(callback)
+
+
+@event.listens_for(Session, "after_commit")
+def _promote_pending_events(session: Session) -> None:
+    """コミットされたトランザクションのイベントを配信待ちにする"""
+    pending = session.info.pop(PENDING_EVENTS, None)
+    if pending:
+        session.info.setdefault(COMMITTED_EVENTS, []).extend(pending)
+
+
+@event.listens_for(Session, "after_commit")
+def _run_after_commit_callbacks(session: Session) -> None:
+    """コミット後のコールバックを実行（失敗はログに記録して続行）"""
+    for callback in session.info.pop(AFTER_COMMIT_CALLBACKS, ()):
+        try:
+            callback()
+        except Exception as e:
+            logger.error(f"After-commit callback failed: {e}", exc_info=True)
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _discard_pending_events(session: Session, previous_transaction: SessionTransaction) -> None:
+    """ロールバックされたトランザクションのイベントを破棄"""
+    if previous_transaction.parent is None:
+        session.info.pop(AFTER_COMMIT_CALLBACKS, None)
+        discarded = session.info.pop(PENDING_EVENTS, None)
+        if discarded:
+            logger.info(f"Discarded {len(discarded)} domain events from a rolled-back transaction")
+
+
+class UnitOfWork:
+    """
+    ユニットオブワーク
+
+    コミットに成功した後、トランザクション中に保存されたエンティティの
+    ドメインイベントを publish_many で1回にまとめて配信する。
+    生成してから close() するまでの間、同じセッションで保存したエンティティのイベントを集める。
+    async with で使用した場合は、例外がなければコミット、あればロールバックして close() する。
+    outbox=True の場合はコミット直前にイベントを event_outbox に書き込み、
+    イベントバスには配信しない（コミットされたイベントだけがリレーワーカーから配信される）。
+    """
+
+    def __init__(self, session: AsyncSession, event_bus: EventBus, outbox: bool = False):
+        """
+        初期化
+
+        Args:
+            session: データベースセッション
+            event_bus: イベントの配信先
+            outbox: イベントをアウトボックスに書き込む場合True
+        """
+        self.session = session
+        self._event_bus = event_bus
+        self._outbox = outbox
+        session.info[ACTIVE_UNIT_OF_WORK] = True
+
+    async def __aenter__(self) -> "UnitOfWork":
+        return self
+
+    async def __aexit__(self, exc_type: Optional[type], exc: Optional[BaseException], tb: Any) -> None:
+        try:
+            if exc_type is None:
+                await self.commit()
+            else:
+                await self.rollback()
+        finally:
+            self.close()
+
+    def close(self) -> None:
+        """ユニットオブワークを終了（以降はこのセッションでイベントを集めない）"""
+        self.session.info.pop(ACTIVE_UNIT_OF_WORK, None)
+        unpublished = self.session.info.pop(COMMITTED_EVENTS, None)
+        if unpublished:
+            logger.error(
+                f"Discarding {len(unpublished)} committed domain events that were never published "
+                f"({', '.join(event.event_type for event in unpublished)})"
+            )
+
+    def collect(self, entity: HasDomainEvents) -> None:
+        """エンティティのドメインイベントをこのユニットオブワークに移す"""
+        collect_domain_events(self.session, entity)
+
+    async def commit(self) -> None:
+        """コミットしてドメインイベントを配信（アウトボックス使用時は同じトランザクションで書き込む）"""
+        if self._outbox:
+            await self.write_outbox()
+        await self.session.commit()
+        await self.publish_committed()
+
+    async def write_outbox(self) -> None:
+        """コミット前のドメインイベントをアウトボックスに書き込む"""
+        events: List[DomainEvent] = self.session.info.pop(PENDING_EVENTS, None)
+        if events:
+            await self.session.execute(insert(EventOutboxModel), outbox_rows(events))
+
+    async def rollback(self) -> None:
+        """
+        ロールバック（コミット前のドメインイベントは破棄される）
+
+        途中で session.commit() が直接呼ばれていた場合、そのトランザクションのイベントは配信する。
+        """
+        await self.session.rollback()
+        await self.publish_committed()
+
+    async def publish_committed(self) -> None:
+        """
+        コミット済みのドメインイベントを配信
+
+        コミットは完了しているため、配信に失敗してもログに記録して例外は送出しない。
+        """
+        events: List[DomainEvent] = self.session.info.pop(COMMITTED_EVENTS, None)
+        if not events:
+            return
+        try:
+            await self._event_bus.publish_many(events)
+        except Exception as e:
+            logger.error(f"Failed to publish {len(events)} domain events after commit: {e}", exc_info=True)
+
+
+def outbox_rows(events: Sequence[DomainEvent]) -> List[dict]:
+    """ドメインイベントを event_outbox の行に変換"""
+    now = datetime.now(timezone.utc)
+    return [
+        {
+            "event_id": event.event_id,
+            "event_type": event.event_type,
+            "payload": event.to_dict(),
+            "created_at": now,
+            "available_at": now,
+        }
+        for event in events
+    ]
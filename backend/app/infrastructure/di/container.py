@@ -8,13 +8,18 @@ from typing import Dict, Type, TypeVar
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from ...config import get_settings
 from ...domain.repositories.contact_repository import ContactRepository
 from ...services.contact_service import ContactService
 from ...services.email_service import EmailService, MockEmailService
 from ..database.connection import get_async_session
 from ..event_bus.event_bus import EventBus
-from ..event_bus.in_memory_event_bus import InMemoryEventBus
-from ..event_handlers.contact_handlers import ContactCreatedHandler, ContactProcessedHandler
+from ..event_bus.in_memory_event_bus import DispatchMode, InMemoryEventBus
+from ..event_bus.queued_event_bus import OverflowPolicy, QueuedEventBus
+from ..event_handlers.contact_handlers import (
+    ContactCreatedHandler,
+    ContactProcessedHandler,
+)
 from ..repositories.sqlalchemy_contact_repository import SQLAlchemyContactRepository
 
 T = TypeVar('T')
@@ -35,7 +40,23 @@ class Container:
     def _setup_services(self) -> None:
         """サービスのセットアップ"""
         # イベントバスの設定
-        event_bus = InMemoryEventBus()
+        settings = get_settings()
+        handler_bus = InMemoryEventBus(
+            mode=DispatchMode(settings.event_dispatch_mode),
+            max_concurrency=settings.event_handler_concurrency or None,
+            handler_timeout=settings.event_handler_timeout_seconds or None,
+        )
+        # アウトボックスのリレーはハンドラーを直接実行して成否を判定する
+        self._services[InMemoryEventBus] = handler_bus
+        event_bus: EventBus = handler_bus
+        if settings.event_queue_enabled:
+            # ハンドラーはリクエストの外でバックグラウンドのワーカーが実行する
+            event_bus = QueuedEventBus(
+                event_bus,
+                max_size=settings.event_queue_max_size,
+                workers=settings.event_queue_workers,
+                overflow_policy=OverflowPolicy(settings.event_queue_overflow_policy),
+            )
         self._services[EventBus] = event_bus
         
         # イベントハンドラーの登録
@@ -6,6 +6,17 @@
 
 from .event_bus import EventBus
 from .handlers import EventHandler
-from .in_memory_event_bus import InMemoryEventBus
+from .in_memory_event_bus import DispatchMode, InMemoryEventBus
+from .outbox_relay import OutboxRelay
+from .queued_event_bus import EventQueueFullError, OverflowPolicy, QueuedEventBus
 
-__all__ = ["EventBus", "EventHandler", "InMemoryEventBus"]
\ No newline at end of file
+__all__ = [
+    "DispatchMode",
+    "EventBus",
+    "EventHandler",
+    "EventQueueFullError",
+    "InMemoryEventBus",
+    "OutboxRelay",
+    "OverflowPolicy",
+    "QueuedEventBus",
+]
\ No newline at end of file
@@ -5,7 +5,7 @@
 """
 
 from abc import ABC, abstractmethod
-from typing import Type
+from typing import Optional, Sequence, Type
 
 from ...domain.events.base import DomainEvent
 from .handlers import EventHandler
@@ -28,6 +28,18 @@ class EventBus(ABC):
         """
         pass
     
+    async def publish_many(self, events: Sequence[DomainEvent]) -> None:
+        """
+        複数のイベントを順に配信
+        
+        既定では publish を1件ずつ呼び出す。まとめて配信できる実装はオーバーライドする。
+        
+        Args:
+            events: 配信するドメインイベント（発生順）
+        """
+        for event in events:
+            await self.publish(event)
+    
     @abstractmethod
     def subscribe(self, event_type: Type[DomainEvent], handler: EventHandler) -> None:
         """
@@ -48,4 +60,21 @@ class EventBus(ABC):
             event_type: 処理するイベントタイプ
             handler: イベントハンドラー
         """
-        pass
\ No newline at end of file
+        pass
+    
+    async def start(self) -> None:  # noqa: B027 - 任意のフック
+        """
+        バックグラウンド処理を開始（アプリ起動時に呼ばれる）
+        
+        任意のフック。バックグラウンド処理を持つ実装だけがオーバーライドし、既定では何もしない
+        """
+    
+    async def stop(self, timeout: Optional[float] = None) -> None:  # noqa: B027 - 任意のフック
+        """
+        未処理のイベントを処理して停止（アプリ終了時に呼ばれる）
+        
+        任意のフック。未処理のイベントを抱える実装だけがオーバーライドし、既定では何もしない
+        
+        Args:
+            timeout: 処理を待つ最大秒数（Noneなら無制限）
+        """
@@ -5,6 +5,7 @@
 """
 
 from abc import ABC, abstractmethod
+from typing import Sequence
 
 from ...domain.events.base import DomainEvent
 
@@ -13,9 +14,16 @@ class EventHandler(ABC):
     """
     イベントハンドラー基底クラス
     
-    ドメインイベントを処理するハンドラーのインターフェース
+    ドメインイベントを処理するハンドラーのインターフェース。
+    handle_batch をオーバーライドしたハンドラーには、イベントバスがイベントを
+    max_batch_size 件ごと、または最初のイベントから batch_window 秒後にまとめて渡す。
     """
     
+    # handle_batch に一度に渡す最大件数（達したらすぐに呼び出す）
+    max_batch_size: int = 100
+    # 最初のイベントを受け取ってから、件数に満たなくても handle_batch を呼び出すまでの秒数
+    batch_window: float = 0.05
+    
     @abstractmethod
     async def handle(self, event: DomainEvent) -> None:
         """
@@ -26,6 +34,23 @@ class EventHandler(ABC):
         """
         pass
     
+    async def handle_batch(self, events: Sequence[DomainEvent]) -> None:
+        """
+        複数のイベントをまとめて処理（任意）
+        
+        既定では handle を1件ずつ呼び出す。DBや外部APIへの書き込みをまとめたいハンドラーはオーバーライドする。
+        
+        Args:
+            events: 処理するドメインイベント（発生順）
+        """
+        for event in events:
+            await self.handle(event)
+    
+    @property
+    def supports_batch(self) -> bool:
+        """handle_batch をオーバーライドしている場合True"""
+        return type(self).handle_batch is not EventHandler.handle_batch
+    
     @property
     @abstractmethod
     def event_type(self) -> type:
@@ -4,9 +4,21 @@
 メモリ内でイベントの配信と処理を行う実装
 """
 
+import asyncio
 import logging
 from collections import defaultdict
-from typing import Dict, List, Type
+from enum import Enum
+from typing import (
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+)
 
 from ...domain.events.base import DomainEvent
 from .event_bus import EventBus
@@ -15,16 +27,61 @@ from .handlers import EventHandler
 logger = logging.getLogger(__name__)
 
 
+class DispatchMode(Enum):
+    """ハンドラーの実行方式"""
+    SEQUENTIAL = "sequential"  # 登録順に1つずつ実行
+    CONCURRENT = "concurrent"  # TaskGroup で同時に実行
+
+
+class _Route(NamedTuple):
+    """イベントクラスの配信先"""
+    handlers: Tuple[EventHandler, ...]  # すべてのハンドラー（dispatch 用）
+    single: Tuple[EventHandler, ...]    # handle で1件ずつ処理するハンドラー
+    batch: Tuple[EventHandler, ...]     # handle_batch でまとめて処理するハンドラー
+
+
 class InMemoryEventBus(EventBus):
     """
     インメモリイベントバス
     
-    メモリ内でドメインイベントの配信と処理を行う
+    メモリ内でドメインイベントの配信と処理を行う。
+    ハンドラーは登録したイベントタイプのサブクラスのイベントも処理する
+    （DomainEvent に登録すればすべてのイベントを受け取る）。
+    イベントクラスごとの配信先は初回の配信時に MRO から求めてキャッシュし、
+    登録・解除のたびに破棄する。
+    handle_batch を実装したハンドラーにはイベントをハンドラーごとにバッファし、
+    max_batch_size 件に達した時点か batch_window 秒後にまとめて渡す
+    （そのため1件ずつ処理するハンドラーとの処理順は保証しない）。
+    CONCURRENT モードではイベントのハンドラーを同時に実行するため、
+    publish の所要時間は合計ではなく最も遅いハンドラーに比例する。
+    ハンドラーの例外・タイムアウトはログに記録し、ほかのハンドラーには影響させない。
     """
     
-    def __init__(self):
-        """初期化"""
+    def __init__(
+        self,
+        mode: DispatchMode = DispatchMode.SEQUENTIAL,
+        max_concurrency: Optional[int] = None,
+        handler_timeout: Optional[float] = None,
+    ):
+        """
+        初期化
+        
+        Args:
+            mode: ハンドラーの実行方式
+            max_concurrency: 同時に実行するハンドラーの上限（バス全体、Noneなら無制限）
+            handler_timeout: ハンドラー1つあたりのタイムアウト秒数（Noneなら無制限）
+        """
         self._handlers: Dict[Type[DomainEvent], List[EventHandler]] = defaultdict(list)
+        # イベントクラス → 配信先ハンドラー（MRO を解決済み）
+        self._dispatch_table: Dict[Type[DomainEvent], _Route] = {}
+        # バッチ対応ハンドラー → 未処理のイベントと時間経過で処理するタスク
+        self._buffers: Dict[EventHandler, List[DomainEvent]] = {}
+        self._flush_timers: Dict[EventHandler, asyncio.Task] = {}
+        # バッチ対応ハンドラー → handle_batch を同時に呼ばないためのロック
+        self._flush_locks: Dict[EventHandler, asyncio.Lock] = {}
+        self._mode = mode
+        self._semaphore = asyncio.Semaphore(max_concurrency) if max_concurrency else None
+        self._handler_timeout = handler_timeout
     
     async def publish(self, event: DomainEvent) -> None:
         """
@@ -33,29 +90,226 @@ class InMemoryEventBus(EventBus):
         Args:
             event: 配信するドメインイベント
         """
-        event_type = type(event)
-        handlers = self._handlers.get(event_type, [])
+        await self.publish_many((event,))
+    
+    async def publish_many(self, events: Sequence[DomainEvent]) -> None:
+        """
+        複数のイベントを配信
+        
+        1件ずつ処理するハンドラーには発生順に渡し、バッチ対応ハンドラーには
+        ハンドラーごとにまとめてバッファに積んで max_batch_size 件ごとに handle_batch を呼び出す
+        （残りは batch_window 秒後）。
+        
+        Args:
+            events: 配信するドメインイベント（発生順）
+        """
+        batches: Dict[EventHandler, List[DomainEvent]] = {}
+        for event in events:
+            route = self._route(type(event))
+            if not route.handlers:
+                logger.warning(f"No handlers registered for event type: {type(event).__name__}")
+                continue
+            
+            self._log_publish(event)
+            if route.single:
+                await self._dispatch_to(route.single, event)
+            for handler in route.batch:
+                batches.setdefault(handler, []).append(event)
+        
+        full: List[EventHandler] = []
+        for handler, batch in batches.items():
+            buffer = self._buffers.setdefault(handler, [])
+            buffer.extend(batch)
+            if len(buffer) >= handler.max_batch_size:
+                full.append(handler)
+            else:
+                self._schedule_flush(handler)
+        
+        if full:
+            await self._gather([lambda handler=handler: self._flush(handler, full_only=True) for handler in full])
+    
+    async def dispatch(self, event: DomainEvent) -> bool:
+        """
+        イベントをすぐに配信し、すべてのハンドラーが成功したかを返す
+        
+        アウトボックスのリレーが再試行の要否を判定するために使用する。
+        成否を1件ごとに判定するため、バッチ対応ハンドラーも handle で処理する。
+        
+        Args:
+            event: 配信するドメインイベント
+            
+        Returns:
+            bool: 失敗・タイムアウトしたハンドラーがない場合True
+        """
+        route = self._route(type(event))
+        self._log_publish(event)
+        if not route.handlers:
+            logger.warning(f"No handlers registered for event type: {type(event).__name__}")
+            return True
+        return await self._dispatch_to(route.handlers, event)
+    
+    async def flush(self) -> None:
+        """バッファに残っているイベントをバッチ対応ハンドラーで処理"""
+        for timer in self._flush_timers.values():
+            timer.cancel()
+        self._flush_timers.clear()
+        await self._gather([lambda handler=handler: self._flush(handler) for handler in list(self._buffers)])
+    
+    async def stop(self, timeout: Optional[float] = None) -> None:
+        """
+        バッファに残っているイベントを処理
         
+        Args:
+            timeout: 処理を待つ最大秒数（Noneなら無制限、超えた場合は残りを破棄）
+        """
+        try:
+            await asyncio.wait_for(self.flush(), timeout)
+        except TimeoutError:
+            logger.error(f"Batched event handlers did not finish within {timeout}s")
+            self._buffers.clear()
+    
+    def resolve_handlers(self, event_type: Type[DomainEvent]) -> Tuple[EventHandler, ...]:
+        """
+        イベントクラスの配信先ハンドラーを取得（キャッシュに保存）
+        
+        具体的なクラスに登録したハンドラーから順に、同じクラス内では登録順に並べる。
+        複数の祖先クラスに登録されたハンドラーは1回だけ含める。
+        
+        Args:
+            event_type: 配信するイベントのクラス
+            
+        Returns:
+            Tuple[EventHandler, ...]: 配信先ハンドラー
+        """
+        return self._route(event_type).handlers
+    
+    def _route(self, event_type: Type[DomainEvent]) -> _Route:
+        """イベントクラスの配信先を取得（初回は MRO から求めてキャッシュ）"""
+        route = self._dispatch_table.get(event_type)
+        if route is None:
+            resolved: List[EventHandler] = []
+            for cls in event_type.__mro__:
+                for handler in self._handlers.get(cls, ()):
+                    if handler not in resolved:
+                        resolved.append(handler)
+            route = self._dispatch_table[event_type] = _Route(
+                handlers=tuple(resolved),
+                single=tuple(handler for handler in resolved if not handler.supports_batch),
+                batch=tuple(handler for handler in resolved if handler.supports_batch),
+            )
+        return route
+    
+    def _log_publish(self, event: DomainEvent) -> None:
+        """配信するイベントをログに記録"""
         logger.info(f"Publishing event: {event.event_type} (ID: {event.event_id})")
-        logger.debug(f"Event data: {event.to_dict()}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Event data: {event.to_dict()}")
+    
+    async def _dispatch_to(self, handlers: Sequence[EventHandler], event: DomainEvent) -> bool:
+        """1件のイベントを各ハンドラーの handle で処理（すべて成功した場合True）"""
+        return await self._gather([lambda handler=handler: self._run_handler(handler, event) for handler in handlers])
+    
+    async def _gather(self, calls: Sequence[Callable[[], Awaitable[bool]]]) -> bool:
+        """モードに従って逐次または同時に実行（すべて成功した場合True）"""
+        if self._mode is DispatchMode.CONCURRENT and len(calls) > 1:
+            # 同時に実行（例外は各呼び出し内で処理するため兄弟タスクは中断されない）
+            async with asyncio.TaskGroup() as group:
+                tasks = [group.create_task(call()) for call in calls]
+            return all(task.result() for task in tasks)
         
-        if not handlers:
-            logger.warning(f"No handlers registered for event type: {event_type.__name__}")
-            return
+        succeeded = True
+        for call in calls:
+            succeeded &= await call()
+        return succeeded
+    
+    def _schedule_flush(self, handler: EventHandler) -> None:
+        """batch_window 秒後にバッファを処理するタスクを予約（予約済みなら何もしない）"""
+        if handler not in self._flush_timers:
+            self._flush_timers[handler] = asyncio.create_task(self._flush_later(handler))
+    
+    async def _flush_later(self, handler: EventHandler) -> None:
+        """batch_window 秒待ってからバッファを処理"""
+        await asyncio.sleep(handler.batch_window)
+        # 処理中に届いたイベントには新しいタイマーを予約させる
+        self._flush_timers.pop(handler, None)
+        await self._flush(handler)
+    
+    async def _flush(self, handler: EventHandler, full_only: bool = False) -> bool:
+        """
+        バッファのイベントを max_batch_size 件ずつ handle_batch で処理
         
-        # 各ハンドラーでイベントを処理
-        for handler in handlers:
-            try:
-                logger.debug(f"Processing event {event.event_id} with handler: {handler.__class__.__name__}")
-                await handler.handle(event)
-                logger.debug(f"Successfully processed event {event.event_id} with handler: {handler.__class__.__name__}")
-            except Exception as e:
-                logger.error(
-                    f"Error processing event {event.event_id} with handler {handler.__class__.__name__}: {e}",
-                    exc_info=True
-                )
-                # エラーが発生してもほかのハンドラーの処理は継続
-                continue
+        full_only の場合は件数に満たない残りをバッファに残し、タイマーを予約する。
+        同じハンドラーの処理はロックで1つずつ行い、処理中に届いたイベントも同じ処理で続けて渡す。
+        """
+        async with self._flush_locks.setdefault(handler, asyncio.Lock()):
+            buffer = self._buffers.get(handler)
+            if buffer is None:
+                return True
+            succeeded = True
+            while buffer and (not full_only or len(buffer) >= handler.max_batch_size):
+                batch = buffer[:handler.max_batch_size]
+                del buffer[:handler.max_batch_size]
+                succeeded &= await self._run_batch(handler, batch)
+            
+            # 処理中にバッファが破棄・作り直された場合は新しいバッファとタイマーに触れない
+            if self._buffers.get(handler) is not buffer:
+                return succeeded
+            if buffer:
+                self._schedule_flush(handler)
+            else:
+                del self._buffers[handler]
+                timer = self._flush_timers.pop(handler, None)
+                if timer is not None:
+                    timer.cancel()
+            return succeeded
+    
+    async def _run_batch(self, handler: EventHandler, events: List[DomainEvent]) -> bool:
+        """
+        バッチ対応ハンドラーでイベントをまとめて処理（成功した場合True）
+        
+        エラーやタイムアウトはログに記録し、バッチのイベントは破棄する。
+        """
+        return await self._run(handler, lambda: handler.handle_batch(events), f"a batch of {len(events)} events")
+    
+    async def _run_handler(self, handler: EventHandler, event: DomainEvent) -> bool:
+        """
+        1つのハンドラーでイベントを処理（成功した場合True）
+        
+        エラーやタイムアウトが発生してもほかのハンドラーの処理は継続する。
+        """
+        return await self._run(handler, lambda: handler.handle(event), f"event {event.event_id}")
+    
+    async def _run(self, handler: EventHandler, call: Callable[[], Awaitable[None]], subject: str) -> bool:
+        """ハンドラーの呼び出しを上限・タイムアウト付きで実行し、例外をログに記録"""
+        handler_name = handler.__class__.__name__
+        try:
+            logger.debug(f"Processing {subject} with handler: {handler_name}")
+            if self._semaphore is None:
+                await self._call_handler(call)
+            else:
+                async with self._semaphore:
+                    await self._call_handler(call)
+            logger.debug(f"Successfully processed {subject} with handler: {handler_name}")
+            return True
+        except TimeoutError:
+            logger.error(
+                f"Handler {handler_name} timed out after {self._handler_timeout}s "
+                f"processing {subject}"
+            )
+        except Exception as e:
+            logger.error(
+                f"Error processing {subject} with handler {handler_name}: {e}",
+                exc_info=True
+            )
+        return False
+    
+    async def _call_handler(self, call: Callable[[], Awaitable[None]]) -> None:
+        """タイムアウト付きでハンドラーを呼び出す（上限の待ち時間は含めない）"""
+        if self._handler_timeout is None:
+            await call()
+            return
+        async with asyncio.timeout(self._handler_timeout):
+            await call()
     
     def subscribe(self, event_type: Type[DomainEvent], handler: EventHandler) -> None:
         """
@@ -67,6 +321,7 @@ class InMemoryEventBus(EventBus):
         """
         if handler not in self._handlers[event_type]:
             self._handlers[event_type].append(handler)
+            self._dispatch_table.clear()
             logger.info(f"Registered handler {handler.__class__.__name__} for event type: {event_type.__name__}")
         else:
             logger.warning(f"Handler {handler.__class__.__name__} already registered for event type: {event_type.__name__}")
@@ -81,13 +336,14 @@ class InMemoryEventBus(EventBus):
         """
         if handler in self._handlers[event_type]:
             self._handlers[event_type].remove(handler)
+            self._dispatch_table.clear()
             logger.info(f"Unregistered handler {handler.__class__.__name__} for event type: {event_type.__name__}")
         else:
             logger.warning(f"Handler {handler.__class__.__name__} not found for event type: {event_type.__name__}")
     
     def get_handlers(self, event_type: Type[DomainEvent]) -> List[EventHandler]:
         """
-        指定されたイベントタイプのハンドラーを取得
+        指定されたイベントタイプに登録されたハンドラーを取得（祖先クラスへの登録は含まない）
         
         Args:
             event_type: イベントタイプ
@@ -100,6 +356,7 @@ class InMemoryEventBus(EventBus):
     def clear_handlers(self) -> None:
         """すべてのハンドラーをクリア"""
         self._handlers.clear()
+        self._dispatch_table.clear()
         logger.info("Cleared all event handlers")
     
     def get_registered_event_types(self) -> List[Type[DomainEvent]]:
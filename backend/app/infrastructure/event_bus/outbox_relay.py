@@ -0,0 +1,314 @@
+"""
+アウトボックスリレー
+
+event_outbox テーブルに書き込まれたドメインイベントを取り出し、
+イベントハンドラーに配信するバックグラウンドワーカー。
+行は短いトランザクションで available_at をリースの期限まで進めて確保し、
+コミットしてから配信するため、配信中にトランザクションや行ロックを保持しない。
+複数のワーカー（uvicorn のワーカーごとに1つ）が同時に動いても
+確保時の FOR UPDATE SKIP LOCKED とリースで同じ行を取り合わない。
+配信は at-least-once（配信中に落ちたワーカーの行はリースが切れた後に再配信）のため、
+ハンドラーは同じイベントを複数回受け取っても問題ないようにする。
+"""
+
+import asyncio
+import logging
+from contextlib import suppress
+from datetime import datetime, timedelta, timezone
+from typing import Any, List, Optional, Tuple
+
+from sqlalchemy import bindparam, delete, select, update
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+
+from ...domain.events.base import DomainEvent
+from ..database.models.event_outbox import OUTBOX_CHANNEL, EventOutboxModel
+from ..metrics import get_metrics_registry
+from .in_memory_event_bus import InMemoryEventBus
+
+logger = logging.getLogger(__name__)
+
+# 書き込みから配信までの時間のバケット（秒）
+LAG_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 300.0)
+# 再試行間隔の上限（秒）
+MAX_RETRY_DELAY = 300.0
+
+_metrics = get_metrics_registry()
+
+outbox_relayed = _metrics.counter(
+    "event_outbox_relayed_total",
+    "Outbox events delivered to every handler and removed from the outbox",
+    ("event_type",),
+)
+outbox_failures = _metrics.counter(
+    "event_outbox_failures_total",
+    "Outbox deliveries that failed and were rescheduled or abandoned",
+    ("event_type", "outcome"),
+)
+outbox_lag_seconds = _metrics.histogram(
+    "event_outbox_lag_seconds",
+    "Time between writing an event to the outbox and dispatching it",
+    ("event_type",),
+    buckets=LAG_BUCKETS,
+)
+
+_outbox = EventOutboxModel.__table__
+
+# 配信可能な行を書き込み順に選び（ほかのリレーが確保中の行は飛ばす）、
+# available_at をリースの期限まで進めて確保する
+_claim_statement = (
+    update(_outbox)
+    .where(
+        _outbox.c.id.in_(
+            select(_outbox.c.id)
+            .where(_outbox.c.available_at <= bindparam("now"))
+            .order_by(_outbox.c.id)
+            .limit(bindparam("limit"))
+            .with_for_update(skip_locked=True)
+        )
+    )
+    .values(available_at=bindparam("lease_until"))
+    .returning(_outbox.c.id, _outbox.c.event_type, _outbox.c.payload, _outbox.c.created_at, _outbox.c.attempts)
+)
+
+
+class OutboxRelay:
+    """
+    アウトボックスリレー
+
+    start() でワーカーを起動し、stop() で処理中のバッチを終えてから停止する。
+    PostgreSQL（asyncpg で直接接続）では LISTEN で書き込みの通知を受けてすぐに処理し、
+    通知を受けられない環境（PgBouncer のトランザクションプーリング・SQLite）や
+    通知を取りこぼした場合は poll_interval ごとのポーリングで拾う。
+    LISTEN の接続が切れた場合はポーリングで処理を続けながら、poll_interval ごとに接続し直す。
+    配信に失敗した行は指数バックオフで再試行し、max_attempts 回失敗したら
+    available_at を NULL にして再試行を打ち切る（行は調査用に残す）。
+    """
+
+    def __init__(
+        self,
+        engine: AsyncEngine,
+        event_bus: InMemoryEventBus,
+        batch_size: int = 100,
+        poll_interval: float = 1.0,
+        max_attempts: int = 10,
+        retry_delay: float = 1.0,
+        lease_duration: float = 60.0,
+        listen: bool = True,
+    ):
+        """
+        初期化
+
+        Args:
+            engine: アウトボックスのあるデータベースのエンジン
+            event_bus: ハンドラーを実行するイベントバス
+            batch_size: 1トランザクションで確保する最大行数
+            poll_interval: ポーリング間隔（秒）
+            max_attempts: 再試行を打ち切るまでの配信回数
+            retry_delay: 最初の再試行までの秒数（失敗ごとに倍にする）
+            lease_duration: 確保した行をほかのリレーが再確保できるようになるまでの秒数
+                （1バッチの配信にかかる時間より長くする）
+            listen: LISTEN/NOTIFY を使う場合True（asyncpg 以外では無視）
+        """
+        self._engine = engine
+        self._event_bus = event_bus
+        self._batch_size = batch_size
+        self._poll_interval = poll_interval
+        self._max_attempts = max_attempts
+        self._retry_delay = retry_delay
+        self._lease_duration = lease_duration
+        self._listen = listen and engine.dialect.driver == "asyncpg"
+        self._wakeup = asyncio.Event()
+        self._stopping = False
+        self._task: Optional[asyncio.Task] = None
+        # LISTEN 中の asyncpg 接続（切断されたら None）
+        self._listener: Optional[Any] = None
+
+    @property
+    def running(self) -> bool:
+        """ワーカーが起動している場合True"""
+        return self._task is not None
+
+    def notify(self) -> None:
+        """待機中のワーカーを起こす（NOTIFY を受信したとき、またはテスト用）"""
+        self._wakeup.set()
+
+    async def start(self) -> None:
+        """ワーカーを起動"""
+        if self._task is not None:
+            return
+        self._stopping = False
+        self._wakeup = asyncio.Event()
+        self._task = asyncio.create_task(self._run(), name="event-outbox-relay")
+        logger.info(f"Started event outbox relay ({'LISTEN/NOTIFY' if self._listen else 'polling'})")
+
+    async def stop(self, timeout: Optional[float] = None) -> None:
+        """
+        処理中のバッチを終えてからワーカーを停止
+
+        Args:
+            timeout: 待つ最大秒数（超えた場合は中断し、確保していた行はリースが切れた後に再配信される）
+        """
+        if self._task is None:
+            return
+        self._stopping = True
+        self._wakeup.set()
+        try:
+            await asyncio.wait_for(self._task, timeout)
+        except TimeoutError:
+            logger.error(f"Event outbox relay did not stop within {timeout}s; cancelled")
+        except Exception as e:
+            logger.error(f"Event outbox relay stopped with an error: {e}", exc_info=True)
+        self._task = None
+        logger.info("Stopped event outbox relay")
+
+    async def relay_once(self) -> int:
+        """
+        1バッチ分の行を確保して配信
+
+        確保をコミットしてからトランザクションの外で配信し、
+        成功した行の削除と失敗した行の再試行の予約を別の短いトランザクションでコミットする。
+
+        Returns:
+            int: 確保した行数
+        """
+        now = datetime.now(timezone.utc)
+        lease_until = now + timedelta(seconds=self._lease_duration)
+        async with self._engine.begin() as connection:
+            result = await connection.execute(
+                _claim_statement, {"now": now, "limit": self._batch_size, "lease_until": lease_until}
+            )
+            # RETURNING の順序は保証されないため書き込み順に並べ直す
+            rows = sorted(result.all(), key=lambda row: row.id)
+        if not rows:
+            return 0
+
+        delivered: List[int] = []
+        failed: List[Tuple[Any, str]] = []
+        for row in rows:
+            try:
+                event = DomainEvent.from_dict(row.payload)
+            except Exception as e:
+                failed.append((row, f"Could not deserialize event: {e}"))
+                continue
+            outbox_lag_seconds.observe(
+                (datetime.now(timezone.utc) - _as_utc(row.created_at)).total_seconds(),
+                event_type=row.event_type,
+            )
+            if await self._event_bus.dispatch(event):
+                delivered.append(row.id)
+                outbox_relayed.inc(event_type=row.event_type)
+            else:
+                failed.append((row, "One or more handlers failed; see the application log"))
+
+        async with self._engine.begin() as connection:
+            if delivered:
+                await connection.execute(delete(_outbox).where(_outbox.c.id.in_(delivered)))
+            for row, error in failed:
+                await self._reschedule(connection, row, error, lease_until)
+        return len(rows)
+
+    async def _reschedule(self, connection: AsyncConnection, row: Any, error: str, lease_until: datetime) -> None:
+        """配信に失敗した行の再試行を予約（上限に達した場合は打ち切る）"""
+        attempts = row.attempts + 1
+        if attempts >= self._max_attempts:
+            available_at = None
+        else:
+            delay = min(self._retry_delay * 2 ** (attempts - 1), MAX_RETRY_DELAY)
+            available_at = datetime.now(timezone.utc) + timedelta(seconds=delay)
+        # リースが切れてほかのリレーが確保し直した行は上書きしない
+        result = await connection.execute(
+            update(_outbox)
+            .where(_outbox.c.id == row.id, _outbox.c.available_at == lease_until)
+            .values(attempts=attempts, available_at=available_at, last_error=error)
+        )
+        if result.rowcount == 0:
+            logger.warning(f"Lease on outbox event {row.id} ({row.event_type}) expired before it was rescheduled")
+        elif available_at is None:
+            outbox_failures.inc(event_type=row.event_type, outcome="abandoned")
+            logger.error(
+                f"Giving up on outbox event {row.id} ({row.event_type}) after {attempts} attempts: {error}"
+            )
+        else:
+            outbox_failures.inc(event_type=row.event_type, outcome="retry")
+            logger.warning(
+                f"Outbox event {row.id} ({row.event_type}) failed on attempt {attempts}; "
+                f"retrying in {delay:.1f}s: {error}"
+            )
+
+    async def _run(self) -> None:
+        """通知かポーリング間隔ごとにアウトボックスを空になるまで処理"""
+        connection: Optional[AsyncConnection] = None
+        listen_failed = False
+        try:
+            while not self._stopping:
+                self._wakeup.clear()
+                if self._listen and not self._listening():
+                    # 初回、または接続が切れた後に LISTEN し直す（切断中の通知はこの後の処理で拾う）
+                    if connection is not None:
+                        logger.warning(f"Lost the LISTEN connection on {OUTBOX_CHANNEL}; reconnecting")
+                        await self._stop_listening(connection)
+                    connection = await self._start_listening(log_failure=not listen_failed)
+                    listen_failed = connection is None
+                try:
+                    # バッチが満杯なら続きがあるため待たずに次を確保
+                    while not self._stopping and await self.relay_once() >= self._batch_size:
+                        pass
+                except Exception as e:
+                    logger.error(f"Error relaying outbox events: {e}", exc_info=True)
+                with suppress(TimeoutError):
+                    await asyncio.wait_for(self._wakeup.wait(), self._poll_interval)
+        finally:
+            if connection is not None:
+                await self._stop_listening(connection)
+
+    def _listening(self) -> bool:
+        """LISTEN 中の接続が生きている場合True"""
+        return self._listener is not None and not self._listener.is_closed()
+
+    async def _start_listening(self, log_failure: bool = True) -> Optional[AsyncConnection]:
+        """LISTEN 専用の接続を開く（失敗した場合はポーリングのみで動作）"""
+        connection = None
+        try:
+            connection = await self._engine.connect()
+            raw = await connection.get_raw_connection()
+            listener = raw.driver_connection
+            listener.add_termination_listener(self._on_listener_terminated)
+            await listener.add_listener(OUTBOX_CHANNEL, self._on_notification)
+        except Exception as e:
+            if log_failure:
+                logger.warning(f"Could not LISTEN on {OUTBOX_CHANNEL}; falling back to polling: {e}")
+            if connection is not None:
+                with suppress(Exception):
+                    await connection.invalidate()
+            return None
+        self._listener = listener
+        logger.info(f"Listening on {OUTBOX_CHANNEL}")
+        return connection
+
+    async def _stop_listening(self, connection: AsyncConnection) -> None:
+        """LISTEN を解除して接続をプールに返す（切断済みの接続はプールから外す）"""
+        listener, self._listener = self._listener, None
+        if listener is None or listener.is_closed():
+            with suppress(Exception):
+                await connection.invalidate()
+            return
+        with suppress(Exception):
+            listener.remove_termination_listener(self._on_listener_terminated)
+            await listener.remove_listener(OUTBOX_CHANNEL, self._on_notification)
+        with suppress(Exception):
+            await connection.close()
+
+    def _on_notification(self, connection: Any, pid: int, channel: str, payload: str) -> None:
+        """asyncpg の通知コールバック"""
+        self._wakeup.set()
+
+    def _on_listener_terminated(self, connection: Any) -> None:
+        """asyncpg の切断コールバック（ワーカーを起こして LISTEN し直させる）"""
+        if connection is self._listener:
+            self._listener = None
+            self._wakeup.set()
+
+
+def _as_utc(value: datetime) -> datetime:
+    """タイムゾーンなしの日時（SQLite）をUTCとして扱う"""
+    return value if value.tzinfo is not None else value.replace(tzinfo=timezone.utc)
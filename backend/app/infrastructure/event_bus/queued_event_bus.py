@@ -0,0 +1,230 @@
+"""
+キュー付きイベントバス
+
+publish はイベントを有界キューに積んですぐに戻り、バックグラウンドのワーカーが
+内側のイベントバスでハンドラーを実行する（ドメインイベントの副作用をリクエストの
+レイテンシから切り離す）
+"""
+
+import asyncio
+import logging
+import time
+from enum import Enum
+from typing import List, Optional, Sequence, Tuple, Type
+
+from ...domain.events.base import DomainEvent
+from ..metrics import get_metrics_registry
+from .event_bus import EventBus
+from .handlers import EventHandler
+
+logger = logging.getLogger(__name__)
+
+# キュー滞留時間のバケット（秒）
+LAG_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+_metrics = get_metrics_registry()
+
+queue_depth = _metrics.gauge(
+    "event_queue_depth",
+    "Events waiting in the dispatch queue",
+    ("bus",),
+)
+queue_lag_seconds = _metrics.histogram(
+    "event_queue_lag_seconds",
+    "Time a batch of events spent in the dispatch queue before a worker picked it up",
+    ("bus",),
+    buckets=LAG_BUCKETS,
+)
+queue_overflows = _metrics.counter(
+    "event_queue_overflow_total",
+    "Batches of events dropped or rejected because the dispatch queue was full",
+    ("bus", "policy"),
+)
+
+# キューの要素（publish_many の1回分のイベントと積んだ時刻）
+QueueItem = Tuple[Tuple[DomainEvent, ...], float]
+
+
+class OverflowPolicy(Enum):
+    """キューが満杯のときの動作"""
+    BLOCK = "block"              # 空きができるまで publish を待機させる
+    DROP_OLDEST = "drop_oldest"  # 最も古いイベントを破棄して積む
+    REJECT = "reject"            # EventQueueFullError を送出する
+
+
+class EventQueueFullError(RuntimeError):
+    """キューが満杯でイベントを受け付けられない"""
+
+
+class QueuedEventBus(EventBus):
+    """
+    キュー付きイベントバス
+
+    ハンドラーの登録と実行は内側のイベントバスに委譲する。
+    start() でワーカーを起動し、stop() でキューに残ったイベントを処理してから停止する。
+    start() 前と stop() 後に配信されたイベントは内側のバスで同期的に配信する
+    （ライフスパンを経ないスクリプトやテストでキューが溜まり続けないようにする）。
+    publish_many のイベントはキューの1要素として積み、ワーカーがまとめて内側のバスに渡す
+    （DROP_OLDEST ではまとめて破棄される）。
+    """
+
+    def __init__(
+        self,
+        delegate: EventBus,
+        max_size: int = 1000,
+        workers: int = 4,
+        overflow_policy: OverflowPolicy = OverflowPolicy.BLOCK,
+        name: str = "events",
+    ):
+        """
+        初期化
+
+        Args:
+            delegate: ハンドラーを実行するイベントバス
+            max_size: キューの最大長
+            workers: ワーカー数
+            overflow_policy: キューが満杯のときの動作
+            name: メトリクスのラベル
+        """
+        self._delegate = delegate
+        self._queue: asyncio.Queue[QueueItem] = asyncio.Queue(maxsize=max_size)
+        self._worker_count = workers
+        self._overflow_policy = overflow_policy
+        self._name = name
+        self._workers: List[asyncio.Task] = []
+        # start() 前と stop() 以降は True（キューに積まずに同期的に配信する）
+        self._stopped = True
+        self._pending_events = 0
+
+    @property
+    def running(self) -> bool:
+        """ワーカーが起動している場合True"""
+        return bool(self._workers)
+
+    def qsize(self) -> int:
+        """キューに積まれているイベント数"""
+        return self._pending_events
+
+    async def publish(self, event: DomainEvent) -> None:
+        """
+        イベントをキューに積む
+
+        Args:
+            event: 配信するドメインイベント
+
+        Raises:
+            EventQueueFullError: REJECT ポリシーでキューが満杯の場合
+        """
+        await self._enqueue((event,))
+
+    async def publish_many(self, events: Sequence[DomainEvent]) -> None:
+        """
+        複数のイベントをキューの1要素として積む
+
+        Args:
+            events: 配信するドメインイベント（発生順）
+
+        Raises:
+            EventQueueFullError: REJECT ポリシーでキューが満杯の場合
+        """
+        if events:
+            await self._enqueue(tuple(events))
+
+    async def _enqueue(self, events: Tuple[DomainEvent, ...]) -> None:
+        """イベントをキューに積む（ワーカーが動いていなければ内側のバスで配信）"""
+        if self._stopped:
+            logger.warning(f"Event bus {self._name} is not running; dispatching {len(events)} events inline")
+            await self._delegate.publish_many(events)
+            return
+
+        item = (events, time.monotonic())
+        if self._queue.full():
+            self._handle_overflow(events)
+
+        if self._overflow_policy is OverflowPolicy.BLOCK:
+            await self._queue.put(item)
+        else:
+            self._queue.put_nowait(item)
+        self._pending_events += len(events)
+        queue_depth.set(self._pending_events, bus=self._name)
+
+    def _handle_overflow(self, events: Tuple[DomainEvent, ...]) -> None:
+        """満杯のキューにイベントを積む前の処理"""
+        policy = self._overflow_policy
+        if policy is OverflowPolicy.BLOCK:
+            logger.warning(f"Event queue {self._name} is full; waiting to enqueue {len(events)} events")
+            return
+
+        queue_overflows.inc(bus=self._name, policy=policy.value)
+        if policy is OverflowPolicy.REJECT:
+            raise EventQueueFullError(f"Event queue {self._name} is full ({self._queue.maxsize})")
+
+        dropped, _ = self._queue.get_nowait()
+        self._queue.task_done()
+        self._pending_events -= len(dropped)
+        logger.warning(
+            f"Event queue {self._name} is full; dropped oldest {len(dropped)} events "
+            f"({', '.join(f'{event.event_type} {event.event_id}' for event in dropped)})"
+        )
+
+    def subscribe(self, event_type: Type[DomainEvent], handler: EventHandler) -> None:
+        """イベントハンドラーを登録（内側のバスに委譲）"""
+        self._delegate.subscribe(event_type, handler)
+
+    def unsubscribe(self, event_type: Type[DomainEvent], handler: EventHandler) -> None:
+        """イベントハンドラーの登録を解除（内側のバスに委譲）"""
+        self._delegate.unsubscribe(event_type, handler)
+
+    async def start(self) -> None:
+        """ワーカーを起動"""
+        if self._workers:
+            return
+        self._stopped = False
+        self._workers = [
+            asyncio.create_task(self._work(), name=f"{self._name}-worker-{i}")
+            for i in range(self._worker_count)
+        ]
+        logger.info(f"Started {self._worker_count} workers for event queue {self._name}")
+
+    async def stop(self, timeout: Optional[float] = None) -> None:
+        """
+        キューに残ったイベントを処理してからワーカーを停止
+
+        Args:
+            timeout: 処理を待つ最大秒数（Noneなら無制限、超えた場合は残りを破棄）
+        """
+        self._stopped = True
+        if self._workers:
+            try:
+                await asyncio.wait_for(self._queue.join(), timeout)
+            except TimeoutError:
+                logger.error(
+                    f"Event queue {self._name} did not drain within {timeout}s; "
+                    f"discarding {self._pending_events} events"
+                )
+
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+        # キューは待機時にイベントループに紐付くため、再起動に備えて作り直す
+        self._queue = asyncio.Queue(maxsize=self._queue.maxsize)
+        self._pending_events = 0
+        queue_depth.set(0, bus=self._name)
+        # 内側のバスがバッファしているイベントも処理する
+        await self._delegate.stop(timeout)
+        logger.info(f"Stopped event queue {self._name}")
+
+    async def _work(self) -> None:
+        """キューからイベントを取り出して内側のバスで配信"""
+        while True:
+            events, enqueued_at = await self._queue.get()
+            try:
+                self._pending_events -= len(events)
+                queue_lag_seconds.observe(time.monotonic() - enqueued_at, bus=self._name)
+                queue_depth.set(self._pending_events, bus=self._name)
+                await self._delegate.publish_many(events)
+            except Exception as e:
+                logger.error(f"Error dispatching {len(events)} queued events: {e}", exc_info=True)
+            finally:
+                self._queue.task_done()
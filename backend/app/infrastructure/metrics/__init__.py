@@ -0,0 +1,9 @@
+"""
+メトリクス
+
+Prometheusテキスト形式で公開するアプリケーションメトリクス
+"""
+
+from .registry import Counter, Gauge, Histogram, MetricsRegistry, get_metrics_registry
+
+__all__ = ["Counter", "Gauge", "Histogram", "MetricsRegistry", "get_metrics_registry"]
@@ -0,0 +1,277 @@
+"""
+メトリクスレジストリ
+
+Counter / Gauge / Histogram を保持し、Prometheusテキスト形式（0.0.4）で出力する
+"""
+
+import bisect
+import math
+import threading
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+# ラベル値のタプル（labelnames と同じ順序）
+LabelValues = Tuple[str, ...]
+
+# Gauge のコールバックが返す (ラベル, 値) の列
+GaugeSamples = Iterable[Tuple[Dict[str, str], float]]
+
+DEFAULT_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+def _format_value(value: float) -> str:
+    """数値をPrometheus形式の文字列に変換"""
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _escape_label_value(value: str) -> str:
+    """ラベル値をエスケープ"""
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(labels: Dict[str, str]) -> str:
+    """ラベルをPrometheus形式の文字列に変換"""
+    if not labels:
+        return ""
+    pairs = (f'{name}="{_escape_label_value(str(value))}"' for name, value in labels.items())
+    return "{" + ",".join(pairs) + "}"
+
+
+class _Metric:
+    """メトリクス基底クラス"""
+    
+    type_name = ""
+    
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+    
+    def _label_values(self, labels: Dict[str, str]) -> LabelValues:
+        """ラベル辞書をラベル値タプルに変換"""
+        if set(labels) != set(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}, got {tuple(labels)}")
+        return tuple(str(labels[name]) for name in self.labelnames)
+    
+    def _labels_dict(self, values: LabelValues) -> Dict[str, str]:
+        """ラベル値タプルをラベル辞書に変換"""
+        return dict(zip(self.labelnames, values, strict=True))
+    
+    def samples(self) -> List[Tuple[str, Dict[str, str], float]]:
+        """(サンプル名, ラベル, 値) の一覧"""
+        raise NotImplementedError
+    
+    def render(self) -> List[str]:
+        """Prometheusテキスト形式の行を生成"""
+        lines = [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.type_name}",
+        ]
+        for sample_name, labels, value in self.samples():
+            lines.append(f"{sample_name}{_format_labels(labels)} {_format_value(value)}")
+        return lines
+
+
+class Counter(_Metric):
+    """単調増加するカウンター"""
+    
+    type_name = "counter"
+    
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[LabelValues, float] = {}
+    
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        """カウンターを増加"""
+        if amount < 0:
+            raise ValueError("Counter can only increase")
+        key = self._label_values(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+    
+    def value(self, **labels: str) -> float:
+        """現在値を取得"""
+        return self._values.get(self._label_values(labels), 0.0)
+    
+    def samples(self) -> List[Tuple[str, Dict[str, str], float]]:
+        with self._lock:
+            return [
+                (self.name, self._labels_dict(key), value)
+                for key, value in self._values.items()
+            ]
+
+
+class Gauge(_Metric):
+    """
+    増減する計測値
+    
+    collect を指定した場合は出力時にコールバックから値を取得する
+    """
+    
+    type_name = "gauge"
+    
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        collect: Optional[Callable[[], GaugeSamples]] = None,
+    ):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[LabelValues, float] = {}
+        self._collect = collect
+    
+    def set(self, value: float, **labels: str) -> None:
+        """値を設定"""
+        key = self._label_values(labels)
+        with self._lock:
+            self._values[key] = value
+    
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        """値を増加"""
+        key = self._label_values(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+    
+    def dec(self, amount: float = 1.0, **labels: str) -> None:
+        """値を減少"""
+        self.inc(-amount, **labels)
+    
+    def value(self, **labels: str) -> float:
+        """現在値を取得"""
+        expected = self._labels_dict(self._label_values(labels))
+        for _, sample_labels, value in self.samples():
+            if sample_labels == expected:
+                return value
+        return 0.0
+    
+    def samples(self) -> List[Tuple[str, Dict[str, str], float]]:
+        with self._lock:
+            samples = [
+                (self.name, self._labels_dict(key), value)
+                for key, value in self._values.items()
+            ]
+        if self._collect is not None:
+            samples.extend((self.name, labels, value) for labels, value in self._collect())
+        return samples
+
+
+class Histogram(_Metric):
+    """分布（累積バケット・合計・件数）"""
+    
+    type_name = "histogram"
+    
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # ラベルごとに (バケット別件数, 合計, 件数)
+        self._values: Dict[LabelValues, Tuple[List[int], float, int]] = {}
+    
+    def observe(self, value: float, **labels: str) -> None:
+        """値を記録"""
+        key = self._label_values(labels)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            counts, total, count = self._values.get(key, ([0] * len(self.buckets), 0.0, 0))
+            if index < len(counts):
+                counts[index] += 1
+            self._values[key] = (counts, total + value, count + 1)
+    
+    def count(self, **labels: str) -> int:
+        """記録件数を取得"""
+        return self._values.get(self._label_values(labels), ([], 0.0, 0))[2]
+    
+    def samples(self) -> List[Tuple[str, Dict[str, str], float]]:
+        samples = []
+        with self._lock:
+            for key, (counts, total, count) in self._values.items():
+                labels = self._labels_dict(key)
+                cumulative = 0
+                for bound, bucket_count in zip(self.buckets, counts, strict=True):
+                    cumulative += bucket_count
+                    samples.append((f"{self.name}_bucket", {**labels, "le": _format_value(bound)}, cumulative))
+                samples.append((f"{self.name}_bucket", {**labels, "le": "+Inf"}, count))
+                samples.append((f"{self.name}_sum", labels, total))
+                samples.append((f"{self.name}_count", labels, count))
+        return samples
+
+
+class MetricsRegistry:
+    """
+    メトリクスレジストリ
+    
+    同じ名前で再登録した場合は既存のメトリクスを返す
+    """
+    
+    def __init__(self):
+        """初期化"""
+        self._metrics: Dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+    
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        """Counterを取得（未登録なら作成）"""
+        return self._get_or_create(Counter, name, documentation, labelnames)
+    
+    def gauge(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        collect: Optional[Callable[[], GaugeSamples]] = None,
+    ) -> Gauge:
+        """Gaugeを取得（未登録なら作成）"""
+        return self._get_or_create(Gauge, name, documentation, labelnames, collect=collect)
+    
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        """Histogramを取得（未登録なら作成）"""
+        return self._get_or_create(Histogram, name, documentation, labelnames, buckets=buckets)
+    
+    def render(self) -> str:
+        """すべてのメトリクスをPrometheusテキスト形式で出力"""
+        with self._lock:
+            metrics = list(self._metrics.values())
+        lines: List[str] = []
+        for metric in metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+    
+    def _get_or_create(self, metric_class, name, documentation, labelnames, **kwargs):
+        """メトリクスを取得または作成"""
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = metric_class(name, documentation, labelnames, **kwargs)
+                self._metrics[name] = metric
+            elif not isinstance(metric, metric_class):
+                raise ValueError(f"Metric {name} is already registered as {metric.type_name}")
+            return metric
+
+
+# グローバルレジストリインスタンス
+_registry = MetricsRegistry()
+
+
+def get_metrics_registry() -> MetricsRegistry:
+    """
+    メトリクスレジストリを取得
+    
+    Returns:
+        MetricsRegistry: メトリクスレジストリ
+    """
+    return _registry
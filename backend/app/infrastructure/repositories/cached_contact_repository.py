@@ -0,0 +1,233 @@
+"""Read-through caching decorator for Contact repositories."""
+
+import copy
+from typing import AsyncIterator, Callable, Dict, Iterable, List, Optional
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ...config import get_settings
+from ...domain.entities.contact import Contact, ContactStatus, LessonType
+from ...domain.repositories.contact_repository import (
+    ContactFilter,
+    ContactPage,
+    ContactRepository,
+    CountMode,
+    PageKey,
+)
+from ...utils.lru_cache import LRUCache
+from ..database.unit_of_work import call_after_commit
+from ..metrics import get_metrics_registry
+
+# 存在しないIDを表すキャッシュ値（ネガティブキャッシュ）
+_MISSING = None
+
+
+class CachedContactRepository(ContactRepository):
+    """Caching decorator around any ContactRepository.
+    
+    find_by_id and find_by_ids are served from an in-process LRU cache;
+    unknown IDs are cached too (with negative_ttl). save, save_many and
+    delete invalidate the affected IDs instead of populating them, so an
+    uncommitted write is never cached. When the write session is given,
+    invalidation happens after that session commits; otherwise a
+    concurrent read between the write and the commit could re-cache the
+    old row for the full TTL. Reads pass the cache generation taken before
+    loading to the cache, so a read that started before an invalidation
+    does not put the old row back. Other workers' writes become visible once
+    the entry expires.
+    """
+
+    def __init__(
+        self,
+        repository: ContactRepository,
+        cache: LRUCache[UUID, Optional[Contact]],
+        negative_ttl: Optional[float] = None,
+        session: Optional[AsyncSession] = None,
+    ):
+        """Initialize the decorator.
+        
+        Args:
+            repository: The repository to delegate to
+            cache: Cache shared between repository instances
+            negative_ttl: Lifetime of not-found entries, defaults to the cache TTL
+            session: Session the repository writes through; invalidation
+                waits for its commit. Without it entries are invalidated
+                right after the write.
+        """
+        self._repository = repository
+        self._cache = cache
+        self._negative_ttl = negative_ttl
+        self._session = session
+
+    async def save(self, contact: Contact) -> Contact:
+        """Save a contact and invalidate its cache entry."""
+        saved = await self._repository.save(contact)
+        self._invalidate([contact.id])
+        return saved
+
+    async def save_many(self, contacts: Iterable[Contact]) -> int:
+        """Save contacts in bulk and invalidate their cache entries."""
+        contacts = list(contacts)
+        written = await self._repository.save_many(contacts)
+        self._invalidate([contact.id for contact in contacts])
+        return written
+
+    async def find_by_id(self, contact_id: UUID) -> Optional[Contact]:
+        """Find a contact by its ID, from the cache when possible."""
+        hit, contact = self._cache.get(contact_id)
+        if hit:
+            return self._clone(contact)
+
+        generation = self._cache.generation
+        contact = await self._repository.find_by_id(contact_id)
+        self._store(contact_id, contact, generation)
+        return self._clone(contact)
+
+    async def find_by_ids(self, contact_ids: Iterable[UUID]) -> List[Contact]:
+        """Find contacts by their IDs, fetching only cache misses."""
+        found: Dict[UUID, Contact] = {}
+        misses: List[UUID] = []
+        for contact_id in dict.fromkeys(contact_ids):
+            hit, contact = self._cache.get(contact_id)
+            if not hit:
+                misses.append(contact_id)
+            elif contact is not None:
+                found[contact_id] = contact
+
+        if misses:
+            generation = self._cache.generation
+            loaded = {contact.id: contact for contact in await self._repository.find_by_ids(misses)}
+            for contact_id in misses:
+                self._store(contact_id, loaded.get(contact_id), generation)
+            found.update(loaded)
+
+        return [self._clone(contact) for contact in found.values()]
+
+    async def find_by_email(self, email: str) -> Optional[Contact]:
+        """Find a contact by email address (not cached)."""
+        return await self._repository.find_by_email(email)
+
+    async def find_all(self, limit: int = 100, offset: int = 0) -> List[Contact]:
+        """Find all contacts with pagination (not cached)."""
+        return await self._repository.find_all(limit=limit, offset=offset)
+
+    async def find_page(
+        self, after: Optional[PageKey] = None, limit: int = 20
+    ) -> ContactPage:
+        """Find contacts with keyset pagination (not cached)."""
+        return await self._repository.find_page(after=after, limit=limit)
+
+    def iter_all(
+        self, batch_size: int = 1000, filters: Optional[ContactFilter] = None
+    ) -> AsyncIterator[Contact]:
+        """Stream contacts (not cached)."""
+        return self._repository.iter_all(batch_size=batch_size, filters=filters)
+
+    async def delete(self, contact_id: UUID) -> bool:
+        """Delete a contact and invalidate its cache entry."""
+        deleted = await self._repository.delete(contact_id)
+        self._invalidate([contact_id])
+        return deleted
+
+    async def count(self, mode: CountMode = CountMode.EXACT) -> int:
+        """Count total number of contacts (not cached)."""
+        return await self._repository.count(mode=mode)
+
+    async def count_by(
+        self,
+        status: Optional[ContactStatus] = None,
+        lesson_type: Optional[LessonType] = None,
+    ) -> int:
+        """Count contacts by status and/or lesson type (not cached)."""
+        return await self._repository.count_by(status=status, lesson_type=lesson_type)
+
+    def prime(self, contacts: Iterable[Contact]) -> None:
+        """Load already-committed contacts into the cache (used at start-up)."""
+        for contact in contacts:
+            self._store(contact.id, contact)
+
+    def _invalidate(self, contact_ids: List[UUID]) -> None:
+        """Invalidate written IDs, after the commit when the session is known."""
+        if self._session is None:
+            self._evict(contact_ids)
+        else:
+            call_after_commit(self._session, lambda: self._evict(contact_ids))
+
+    def _evict(self, contact_ids: List[UUID]) -> None:
+        """Remove IDs from the cache."""
+        for contact_id in contact_ids:
+            self._cache.invalidate(contact_id)
+
+    def _store(
+        self, contact_id: UUID, contact: Optional[Contact], generation: Optional[int] = None
+    ) -> None:
+        """Cache a lookup result, including not-found, unless invalidated since generation."""
+        if contact is None:
+            self._cache.set(contact_id, _MISSING, ttl=self._negative_ttl, generation=generation)
+        else:
+            self._cache.set(contact_id, self._clone(contact), generation=generation)
+
+    @staticmethod
+    def _clone(contact: Optional[Contact]) -> Optional[Contact]:
+        """Copy a contact so callers never mutate the cached instance."""
+        if contact is None:
+            return None
+        clone = copy.copy(contact)
+        clone._domain_events = None
+        return clone
+
+
+# グローバルキャッシュインスタンス（プロセス内の全リクエストで共有）
+_contact_cache: Optional[LRUCache[UUID, Optional[Contact]]] = None
+
+
+def get_contact_cache() -> LRUCache[UUID, Optional[Contact]]:
+    """
+    問い合わせキャッシュを取得
+    
+    Returns:
+        LRUCache: 設定値で初期化された共有キャッシュ
+    """
+    global _contact_cache
+    if _contact_cache is None:
+        settings = get_settings()
+        _contact_cache = LRUCache(
+            max_size=settings.contact_cache_max_size,
+            ttl=settings.contact_cache_ttl_seconds,
+        )
+    return _contact_cache
+
+
+def _cache_gauge(attribute: str) -> Callable[[], list]:
+    """共有キャッシュの統計値を収集するコールバックを作成（キャッシュ未作成なら出力しない）"""
+    def collect() -> list:
+        if _contact_cache is None:
+            return []
+        return [({}, getattr(_contact_cache.stats, attribute))]
+    return collect
+
+
+_metrics = get_metrics_registry()
+
+# 統計は clear() で0に戻るため、カウンターではなくゲージとして公開する
+_metrics.gauge(
+    "contact_cache_hits",
+    "Contact lookups served from the cache",
+    collect=_cache_gauge("hits"),
+)
+_metrics.gauge(
+    "contact_cache_misses",
+    "Contact lookups that had to load from the repository",
+    collect=_cache_gauge("misses"),
+)
+_metrics.gauge(
+    "contact_cache_evictions",
+    "Contact cache entries evicted by the size limit",
+    collect=_cache_gauge("evictions"),
+)
+_metrics.gauge(
+    "contact_cache_entries",
+    "Contact cache entries currently held",
+    collect=_cache_gauge("size"),
+)
@@ -1,38 +1,137 @@
 """SQLAlchemy implementation of Contact repository."""
 
-from typing import List, Optional
-from uuid import UUID
+from datetime import datetime, timezone
+from enum import Enum
+from itertools import islice
+from typing import Any, AsyncIterator, Dict, Iterable, Iterator, List, Optional
+from uuid import UUID, uuid4
 
-from sqlalchemy import select, func
+from sqlalchemy import Select, any_, bindparam, func, literal, select, text, tuple_
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from ...domain.entities.contact import Contact
-from ...domain.repositories.contact_repository import ContactRepository
+from ...domain.entities.contact import (
+    Contact,
+    ContactStatus,
+    LessonType,
+    PreferredContact,
+)
+from ...domain.repositories.contact_repository import (
+    ContactFilter,
+    ContactPage,
+    ContactRepository,
+    CountMode,
+    PageKey,
+)
 from ...domain.value_objects.email import Email
 from ...domain.value_objects.phone import Phone
 from ..database.models.contact import ContactModel
+from ..database.models.contact_count import ContactCountModel
+from ..database.unit_of_work import collect_domain_events
+
+
+class SaveMode(Enum):
+    """save() の書き込み方式"""
+    UPSERT = "upsert"  # INSERT ... ON CONFLICT (id) DO UPDATE ... RETURNING（1往復）
+    LEGACY = "legacy"  # session.get → flush → refresh（3往復）
+
+
+class HydrationMode(Enum):
+    """読み込んだ行からエンティティを組み立てる方式"""
+    TRUSTED = "trusted"  # 書き込み時に検証済みとみなし、検証・正規化を省略
+    STRICT = "strict"    # 値オブジェクト・Enum・エンティティの検証をすべて実行（整合性監査用）
+
+
+# 保存値からEnumへの変換表（Enum(value) の呼び出しより速い）
+_LESSON_TYPES = {member.value: member for member in LessonType}
+_PREFERRED_CONTACTS = {member.value: member for member in PreferredContact}
+_STATUSES = {member.value: member for member in ContactStatus}
+
+# TRUSTED で読むカラム（すべてロード済みならインスタンス辞書から直接読む）
+_COLUMN_KEYS = frozenset(column.key for column in ContactModel.__mapper__.column_attrs)
+
+# ON CONFLICT をサポートする方言ごとの insert 構築関数
+_UPSERT_INSERTS = {
+    "postgresql": postgresql.insert,
+    "sqlite": sqlite.insert,
+}
+
+# 既存行の更新時に上書きしないカラム
+_IMMUTABLE_COLUMNS = ("id", "created_at")
+
+# save_many / insert_many の1チャンクあたりの行数
+DEFAULT_CHUNK_SIZE = 500
 
 
 class SQLAlchemyContactRepository(ContactRepository):
     """SQLAlchemy implementation of ContactRepository."""
 
-    def __init__(self, session: AsyncSession):
+    def __init__(
+        self,
+        session: AsyncSession,
+        save_mode: SaveMode = SaveMode.UPSERT,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        hydration: HydrationMode = HydrationMode.TRUSTED,
+    ):
         """Initialize repository with database session.
         
         Args:
             session: SQLAlchemy async session
+            save_mode: Write strategy used by save()
+            chunk_size: Rows per statement for save_many() and insert_many()
+            hydration: How loaded rows are turned into entities
         """
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be positive")
         self._session = session
+        self._save_mode = save_mode
+        self._chunk_size = chunk_size
+        self._hydration = hydration
 
     async def save(self, contact: Contact) -> Contact:
         """Save a contact entity to database.
         
+        Uses a single upsert statement when the dialect supports
+        ON CONFLICT ... RETURNING, otherwise falls back to the legacy
+        get/flush/refresh path.
+        
+        When a unit of work is active on the session, the contact's pending
+        domain events move to the session and are published once the
+        transaction commits.
+        
         Args:
             contact: The contact entity to save
             
         Returns:
             The saved contact entity with updated fields
         """
+        if self._save_mode is SaveMode.UPSERT and self._supports_upsert():
+            saved = await self._upsert(contact)
+        else:
+            saved = await self._save_legacy(contact)
+        collect_domain_events(self._session, contact)
+        return saved
+
+    async def _upsert(self, contact: Contact) -> Contact:
+        """Save with one INSERT ... ON CONFLICT (id) DO UPDATE ... RETURNING."""
+        insert = _UPSERT_INSERTS[self._dialect_name()]
+        values = self._entity_to_values(contact)
+        stmt = insert(ContactModel).values(**values)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[ContactModel.id],
+            set_={
+                name: stmt.excluded[name]
+                for name in values
+                if name not in _IMMUTABLE_COLUMNS
+            },
+        )
+        # populate_existing でセッション内の既存インスタンスも返却行で更新する
+        stmt = stmt.returning(ContactModel).execution_options(populate_existing=True)
+        result = await self._session.execute(stmt)
+        return self._model_to_entity(result.scalar_one())
+
+    async def _save_legacy(self, contact: Contact) -> Contact:
+        """Save with session.get, flush and refresh."""
         # Check if contact already exists
         existing = await self._session.get(ContactModel, contact.id)
         
@@ -67,11 +166,133 @@ class SQLAlchemyContactRepository(ContactRepository):
         await self._session.refresh(contact_model)
         return self._model_to_entity(contact_model)
 
+    async def save_many(
+        self, contacts: Iterable[Contact], chunk_size: Optional[int] = None
+    ) -> int:
+        """Save multiple contacts with chunked executemany upserts.
+        
+        Each chunk is sent as one INSERT ... ON CONFLICT (id) DO UPDATE
+        executed over all of its rows. Instances already loaded in the
+        session are not refreshed.
+        
+        Args:
+            contacts: The contact entities to save
+            chunk_size: Rows per statement, defaults to the repository setting
+            
+        Returns:
+            Number of contacts written
+
+        Raises:
+            ValueError: If chunk_size is less than 1
+        """
+        if not self._supports_upsert():
+            written = 0
+            for contact in contacts:
+                await self._save_legacy(contact)
+                collect_domain_events(self._session, contact)
+                written += 1
+            return written
+
+        table = ContactModel.__table__
+        stmt = _UPSERT_INSERTS[self._dialect_name()](table)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[table.c.id],
+            set_={
+                column.name: stmt.excluded[column.name]
+                for column in table.columns
+                if column.name not in _IMMUTABLE_COLUMNS
+            },
+        )
+
+        written = 0
+        for chunk in self._chunked(contacts, chunk_size):
+            await self._session.execute(
+                stmt, [self._entity_to_values(contact) for contact in chunk]
+            )
+            self._collect_events(chunk)
+            written += len(chunk)
+        return written
+
+    async def insert_many(
+        self, contacts: Iterable[Contact], chunk_size: Optional[int] = None
+    ) -> int:
+        """Insert new contacts in bulk.
+        
+        Uses asyncpg's COPY (copy_records_to_table) on PostgreSQL and
+        chunked executemany INSERTs elsewhere. Unlike save_many() existing
+        IDs are not updated; a duplicate ID fails the whole call.
+        
+        Args:
+            contacts: The contact entities to insert
+            chunk_size: Rows per COPY/INSERT, defaults to the repository setting
+            
+        Returns:
+            Number of contacts inserted
+
+        Raises:
+            ValueError: If chunk_size is less than 1
+        """
+        table = ContactModel.__table__
+        columns = [column.name for column in table.columns]
+        connection = await self._session.connection()
+
+        if connection.dialect.driver == "asyncpg":
+            raw_connection = await connection.get_raw_connection()
+            driver_connection = raw_connection.driver_connection
+            written = 0
+            for chunk in self._chunked(contacts, chunk_size):
+                records = [
+                    tuple(self._entity_to_values(contact)[name] for name in columns)
+                    for contact in chunk
+                ]
+                await driver_connection.copy_records_to_table(
+                    table.name, records=records, columns=columns
+                )
+                self._collect_events(chunk)
+                written += len(records)
+            return written
+
+        written = 0
+        for chunk in self._chunked(contacts, chunk_size):
+            await self._session.execute(
+                table.insert(), [self._entity_to_values(contact) for contact in chunk]
+            )
+            self._collect_events(chunk)
+            written += len(chunk)
+        return written
+
+    def _collect_events(self, contacts: Iterable[Contact]) -> None:
+        """Move the domain events of written contacts to the session."""
+        for contact in contacts:
+            collect_domain_events(self._session, contact)
+
     async def find_by_id(self, contact_id: UUID) -> Optional[Contact]:
         """Find a contact by its ID."""
         contact_model = await self._session.get(ContactModel, contact_id)
         return self._model_to_entity(contact_model) if contact_model else None
 
+    async def find_by_ids(self, contact_ids: Iterable[UUID]) -> List[Contact]:
+        """Find contacts by their IDs in a single query.
+        
+        PostgreSQL binds the IDs as one uuid[] parameter (id = ANY(:ids)) so
+        the statement text does not change with the number of IDs; other
+        dialects use an expanding IN.
+        """
+        ids = list(dict.fromkeys(contact_ids))
+        if not ids:
+            return []
+
+        if self._dialect_name() == "postgresql":
+            ids_param = bindparam(
+                "ids", ids, type_=postgresql.ARRAY(postgresql.UUID(as_uuid=True))
+            )
+            condition = ContactModel.id == any_(ids_param)
+        else:
+            condition = ContactModel.id.in_(ids)
+
+        result = await self._session.execute(select(ContactModel).where(condition))
+        return [self._model_to_entity(model) for model in result.scalars().all()]
+
     async def find_by_email(self, email: str) -> Optional[Contact]:
         """Find a contact by email address."""
         stmt = select(ContactModel).where(ContactModel.email == email)
@@ -91,6 +312,61 @@ class SQLAlchemyContactRepository(ContactRepository):
         contact_models = result.scalars().all()
         return [self._model_to_entity(model) for model in contact_models]
 
+    async def find_page(
+        self, after: Optional[PageKey] = None, limit: int = 20
+    ) -> ContactPage:
+        """Find contacts with keyset pagination.
+        
+        Seeks past the (created_at, id) key using ix_contacts_created_at_id,
+        so every page costs the same regardless of its depth.
+        """
+        stmt = (
+            select(ContactModel)
+            .order_by(ContactModel.created_at.desc(), ContactModel.id.desc())
+            .limit(limit + 1)
+        )
+        if after is not None:
+            created_at, contact_id = after
+            # 列の型でバインドしないとSQLiteでGUIDの文字列表現が一致しない
+            stmt = stmt.where(
+                tuple_(ContactModel.created_at, ContactModel.id)
+                < tuple_(
+                    literal(created_at, ContactModel.created_at.type),
+                    literal(contact_id, ContactModel.id.type),
+                )
+            )
+        result = await self._session.execute(stmt)
+        contact_models = result.scalars().all()
+
+        items = [self._model_to_entity(model) for model in contact_models[:limit]]
+        next_key = None
+        if len(contact_models) > limit and items:
+            next_key = (items[-1].created_at, items[-1].id)
+        return ContactPage(items=items, next_key=next_key)
+
+    async def iter_all(
+        self, batch_size: int = 1000, filters: Optional[ContactFilter] = None
+    ) -> AsyncIterator[Contact]:
+        """Stream contacts from a server-side cursor.
+        
+        Rows are fetched batch_size at a time via session.stream() with
+        yield_per and converted to entities one by one, so memory use does
+        not depend on table size. The session is busy until the iterator
+        is exhausted or closed.
+        """
+        stmt = (
+            self._apply_filter(select(ContactModel), filters)
+            .order_by(ContactModel.created_at.desc(), ContactModel.id.desc())
+            .execution_options(yield_per=batch_size)
+        )
+        result = await self._session.stream(stmt)
+        try:
+            async for partition in result.scalars().partitions():
+                for model in partition:
+                    yield self._model_to_entity(model)
+        finally:
+            await result.close()
+
     async def delete(self, contact_id: UUID) -> bool:
         """Delete a contact by its ID."""
         contact_model = await self._session.get(ContactModel, contact_id)
@@ -99,27 +375,164 @@ class SQLAlchemyContactRepository(ContactRepository):
             return True
         return False
 
-    async def count(self) -> int:
-        """Count total number of contacts."""
-        stmt = select(func.count(ContactModel.id))
+    async def count(self, mode: CountMode = CountMode.EXACT) -> int:
+        """Count total number of contacts.
+        
+        EXACT sums the trigger-maintained contact_counts rows instead of
+        scanning contacts. ESTIMATED reads pg_class.reltuples on PostgreSQL
+        and falls back to EXACT when the table has never been analyzed or
+        on other dialects.
+        """
+        if mode is CountMode.ESTIMATED and self._dialect_name() == "postgresql":
+            result = await self._session.execute(
+                text("SELECT reltuples::bigint FROM pg_class WHERE oid = 'contacts'::regclass")
+            )
+            estimate = result.scalar()
+            if estimate is not None and estimate >= 0:
+                return estimate
+        return await self.count_by()
+
+    async def count_by(
+        self,
+        status: Optional[ContactStatus] = None,
+        lesson_type: Optional[LessonType] = None,
+    ) -> int:
+        """Count contacts by status and/or lesson type from contact_counts.
+        
+        contact_counts holds +1/-1 rows written by the contacts triggers, so
+        the count is their sum (ContactCountCompactor periodically rolls
+        them up into one row per key).
+        """
+        stmt = select(func.sum(ContactCountModel.count))
+        if status is not None:
+            stmt = stmt.where(ContactCountModel.status == status.value)
+        if lesson_type is not None:
+            stmt = stmt.where(ContactCountModel.lesson_type == lesson_type.value)
         result = await self._session.execute(stmt)
-        return result.scalar() or 0
+        return int(result.scalar() or 0)
 
-    def _model_to_entity(self, model: ContactModel) -> Contact:
-        """Convert ContactModel to Contact entity."""
-        from ...domain.entities.contact import LessonType, PreferredContact, ContactStatus
+    async def warm_up(self) -> None:
+        """Run each hot read query once with parameters that match nothing.
         
-        phone = Phone(model.phone) if model.phone else None
+        This fills the engine's compiled-statement cache and, on asyncpg,
+        prepares the statements on the session's connection. Writes are not
+        executed, so this is safe on a read-only transaction.
+        """
+        probe_id = uuid4()
+        await self.find_by_id(probe_id)
+        await self.find_by_ids([probe_id, uuid4()])
+        await self.find_by_email("warm-up@example.invalid")
+        await self.find_page(limit=1)
+        await self.find_page(after=(datetime(1970, 1, 1, tzinfo=timezone.utc), probe_id), limit=1)
+        await self.count_by()
+
+    def _model_to_entity(self, model: ContactModel) -> Contact:
+        """Convert ContactModel to Contact entity.
         
+        TRUSTED (the default) rebuilds value objects and enums from the
+        stored, already-normalized values without re-running validation.
+        STRICT validates every field and raises ValueError on rows that
+        would no longer be accepted, which is what integrity audits want.
+        """
+        if self._hydration is HydrationMode.STRICT:
+            return self._model_to_entity_strict(model)
+
+        # ロード済みのカラム値はインスタンス辞書から直接読む（属性ディスクリプタを経由しない）
+        row = model.__dict__
+        if not row.keys() >= _COLUMN_KEYS:
+            row = {key: getattr(model, key) for key in _COLUMN_KEYS}
+
+        phone = row["phone"]
+        lesson_type = row["lesson_type"]
+        preferred_contact = row["preferred_contact"]
+        status = row["status"]
+        return Contact._from_trusted_row(
+            id=row["id"],
+            name=row["name"],
+            email=Email._from_trusted(row["email"]),
+            phone=Phone._from_trusted(phone) if phone else None,
+            message=row["message"],
+            lesson_type=_LESSON_TYPES.get(lesson_type) or LessonType(lesson_type),
+            preferred_contact=(
+                _PREFERRED_CONTACTS.get(preferred_contact) or PreferredContact(preferred_contact)
+            ),
+            status=_STATUSES.get(status) or ContactStatus(status),
+            created_at=row["created_at"],
+            updated_at=row["updated_at"],
+            processed_at=row["processed_at"],
+            processed_by=row["processed_by"],
+            processing_notes=row["processing_notes"],
+        )
+
+    @staticmethod
+    def _model_to_entity_strict(model: ContactModel) -> Contact:
+        """Convert ContactModel to Contact entity, validating every field."""
         return Contact(
             id=model.id,
             name=model.name,
             email=Email(model.email),
-            phone=phone,
+            phone=Phone(model.phone) if model.phone else None,
             message=model.message,
             lesson_type=LessonType(model.lesson_type),
             preferred_contact=PreferredContact(model.preferred_contact),
             status=ContactStatus(model.status),
             created_at=model.created_at,
-            updated_at=model.updated_at
-        )
\ No newline at end of file
+            updated_at=model.updated_at,
+            processed_at=model.processed_at,
+            processed_by=model.processed_by,
+            processing_notes=model.processing_notes,
+        )
+
+    @staticmethod
+    def _apply_filter(stmt: Select, filters: Optional[ContactFilter]) -> Select:
+        """Add WHERE clauses for the given filter."""
+        if filters is None:
+            return stmt
+        if filters.status is not None:
+            stmt = stmt.where(ContactModel.status == filters.status.value)
+        if filters.lesson_type is not None:
+            stmt = stmt.where(ContactModel.lesson_type == filters.lesson_type.value)
+        if filters.created_from is not None:
+            stmt = stmt.where(ContactModel.created_at >= filters.created_from)
+        if filters.created_to is not None:
+            stmt = stmt.where(ContactModel.created_at < filters.created_to)
+        return stmt
+
+    def _dialect_name(self) -> str:
+        """Return the dialect name of the bound engine."""
+        return self._session.get_bind().dialect.name
+
+    def _supports_upsert(self) -> bool:
+        """Check whether the dialect can run the single-statement upsert."""
+        dialect = self._session.get_bind().dialect
+        return dialect.name in _UPSERT_INSERTS and dialect.insert_returning
+
+    @staticmethod
+    def _entity_to_values(contact: Contact) -> Dict[str, Any]:
+        """Convert Contact entity to column values."""
+        return {
+            "id": contact.id,
+            "name": contact.name,
+            "email": contact.email.value,
+            "phone": contact.phone.value if contact.phone else None,
+            "message": contact.message,
+            "lesson_type": contact.lesson_type.value,
+            "preferred_contact": contact.preferred_contact.value,
+            "status": contact.status.value,
+            "processed_at": contact.processed_at,
+            "processed_by": contact.processed_by,
+            "processing_notes": contact.processing_notes,
+            "created_at": contact.created_at,
+            "updated_at": contact.updated_at,
+        }
+
+    def _chunked(
+        self, contacts: Iterable[Contact], chunk_size: Optional[int]
+    ) -> Iterator[List[Contact]]:
+        """Split contacts into lists of at most chunk_size entities."""
+        size = self._chunk_size if chunk_size is None else chunk_size
+        if size < 1:
+            raise ValueError("chunk_size must be positive")
+        iterator = iter(contacts)
+        while chunk := list(islice(iterator, size)):
+            yield chunk
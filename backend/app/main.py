@@ -1,13 +1,20 @@
+import asyncio
 import logging
 import os
-from contextlib import asynccontextmanager
+from contextlib import asynccontextmanager, suppress
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, PlainTextResponse
 
-from .infrastructure.di.container import get_container
+from .api.endpoints.admin import router as admin_router
 from .api.endpoints.contact import router as contact_router
+from .infrastructure.database.connection import get_engine_registry
+from .infrastructure.database.contact_counts import ContactCountCompactor
+from .infrastructure.di.container import get_container
+from .infrastructure.event_bus import EventBus, InMemoryEventBus, OutboxRelay
+from .infrastructure.metrics import get_metrics_registry
+from .warmup import get_warmup_state, warm_up
 
 # ログ設定
 logging.basicConfig(
@@ -27,12 +34,65 @@ async def lifespan(app: FastAPI):
     # DIコンテナの初期化
     container = get_container()
     logger.info("Dependency injection container initialized")
+    event_bus = container.get(EventBus)
+    await event_bus.start()
     logger.info("Domain layer initialized with event bus")
     
+    # アウトボックスのリレーワーカー（PgBouncer 経由では LISTEN が使えないためポーリングのみ）
+    app_settings = get_settings()
+    outbox_relay = None
+    if app_settings.event_outbox_enabled:
+        outbox_relay = OutboxRelay(
+            get_engine_registry().async_engine,
+            container.get(InMemoryEventBus),
+            batch_size=app_settings.event_outbox_batch_size,
+            poll_interval=app_settings.event_outbox_poll_interval_seconds,
+            max_attempts=app_settings.event_outbox_max_attempts,
+            retry_delay=app_settings.event_outbox_retry_delay_seconds,
+            lease_duration=app_settings.event_outbox_lease_seconds,
+            listen=app_settings.database_connection_mode == "direct",
+        )
+        await outbox_relay.start()
+    
+    # 問い合わせ件数カウンターの増減の行を定期的に集約
+    count_compactor = ContactCountCompactor(
+        get_engine_registry().async_engine,
+        interval=app_settings.contact_counts_compact_interval_seconds,
+    )
+    await count_compactor.start()
+    
+    # ウォームアップ（完了まで /health/ready は 503 を返す）
+    warmup_state = get_warmup_state()
+    warmup_task = None
+    if app_settings.warmup_enabled:
+        warmup_task = asyncio.create_task(
+            warm_up(get_engine_registry(), app_settings, warmup_state, app=app)
+        )
+    else:
+        warmup_state.mark_skipped()
+    
     yield
     
     # 終了時の処理
     logger.info("英会話カフェ API shutting down...")
+    
+    if warmup_task is not None and not warmup_task.done():
+        warmup_task.cancel()
+        with suppress(asyncio.CancelledError):
+            await warmup_task
+    
+    # 処理中のアウトボックスのバッチを終えてから停止（未配信の行は次回起動時に配信される）
+    if outbox_relay is not None:
+        await outbox_relay.stop(timeout=app_settings.event_queue_drain_timeout_seconds)
+    
+    await count_compactor.stop()
+    
+    # キューに残ったドメインイベントを処理してから停止（ハンドラーがDBを使うためプールより先）
+    await event_bus.stop(timeout=app_settings.event_queue_drain_timeout_seconds)
+    
+    # 作成済みのコネクションプールを閉じる
+    await get_engine_registry().dispose()
+    logger.info("Database engines disposed")
 
 
 # アプリケーション初期化
@@ -45,6 +105,7 @@ app = FastAPI(
 
 # CORS設定
 from .config import get_settings
+
 settings = get_settings()
 
 # 開発環境用のCORS設定
@@ -82,6 +143,34 @@ async def health_check():
     )
 
 
+# レディネスチェックエンドポイント（ウォームアップ完了後に 200、コネクションを開けなかった場合は 503）
+@app.get("/health/ready")
+async def readiness_check():
+    warmup_state = get_warmup_state()
+    if warmup_state.ready:
+        status = "ready"
+    elif warmup_state.finished:
+        status = "warmup_failed"
+    else:
+        status = "warming_up"
+    return JSONResponse(
+        status_code=200 if warmup_state.ready else 503,
+        content={
+            "status": status,
+            "warmup": warmup_state.to_dict(),
+        },
+    )
+
+
+# メトリクスエンドポイント（Prometheusテキスト形式）
+@app.get("/metrics", include_in_schema=False)
+async def metrics():
+    return PlainTextResponse(
+        content=get_metrics_registry().render(),
+        media_type="text/plain; version=0.0.4",
+    )
+
+
 # ルートエンドポイント
 @app.get("/")
 async def root():
@@ -111,6 +200,7 @@ async def options_handler(path: str):
 
 # APIルーターの登録
 app.include_router(contact_router, prefix="/api/v1")
+app.include_router(admin_router, prefix="/api/v1")
 
 
 
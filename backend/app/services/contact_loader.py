@@ -0,0 +1,91 @@
+"""Request-scoped batching loader for contacts."""
+import asyncio
+import logging
+from typing import Dict, Iterable, List, Optional, Set
+from uuid import UUID
+
+from app.domain.entities.contact import Contact
+from app.domain.repositories.contact_repository import ContactRepository
+
+logger = logging.getLogger(__name__)
+
+
+class ContactLoader:
+    """
+    問い合わせのバッチローダー（DataLoader）
+    
+    同じイベントループのティック内に発生した load() をまとめて
+    1回の find_by_ids() で取得する。結果はリクエスト中キャッシュされるため、
+    リクエストごとに生成すること。
+    リポジトリのセッションは同時に1つのクエリしか実行できないため、
+    バッチの取得は常に1つずつ行う。
+    """
+    
+    def __init__(self, contact_repository: ContactRepository, max_batch_size: int = 500):
+        self.contact_repository = contact_repository
+        self.max_batch_size = max_batch_size
+        self._futures: Dict[UUID, asyncio.Future] = {}
+        self._queue: List[UUID] = []
+        self._tasks: Set[asyncio.Task] = set()
+        # 別々のティックで開始した取得が同じセッションを同時に使わないようにする
+        self._lock = asyncio.Lock()
+    
+    async def load(self, contact_id: UUID) -> Optional[Contact]:
+        """IDで問い合わせを取得（同一ティック内の呼び出しはまとめて取得）"""
+        future = self._futures.get(contact_id)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            future = loop.create_future()
+            self._futures[contact_id] = future
+            if not self._queue:
+                # 現在実行可能なタスクがすべて load() を呼び終えてからまとめて取得
+                loop.call_soon(self._dispatch)
+            self._queue.append(contact_id)
+        # 一人の呼び出し元のキャンセルで他の待機者の結果が失われないようにする
+        return await asyncio.shield(future)
+    
+    async def load_many(self, contact_ids: Iterable[UUID]) -> List[Optional[Contact]]:
+        """複数IDの問い合わせを取得（見つからないIDはNone）"""
+        return list(await asyncio.gather(*(self.load(contact_id) for contact_id in contact_ids)))
+    
+    def clear(self, contact_id: UUID) -> None:
+        """キャッシュ済みの結果を破棄（更新後に呼び出す）"""
+        future = self._futures.get(contact_id)
+        if future is not None and future.done():
+            del self._futures[contact_id]
+    
+    def _dispatch(self) -> None:
+        """溜まったIDの取得を開始"""
+        queue, self._queue = self._queue, []
+        task = asyncio.ensure_future(self._load_batches(queue))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+    
+    async def _load_batches(self, contact_ids: List[UUID]) -> None:
+        """IDをバッチに分けて順に取得"""
+        for start in range(0, len(contact_ids), self.max_batch_size):
+            async with self._lock:
+                await self._load_batch(contact_ids[start:start + self.max_batch_size])
+    
+    async def _load_batch(self, contact_ids: List[UUID]) -> None:
+        """1バッチ分の問い合わせを取得して待機者に結果を渡す"""
+        try:
+            if len(contact_ids) == 1:
+                # 1件だけならセッションのIDマップを使える find_by_id を使う
+                contact = await self.contact_repository.find_by_id(contact_ids[0])
+                found = {contact_ids[0]: contact}
+            else:
+                contacts = await self.contact_repository.find_by_ids(contact_ids)
+                found = {contact.id: contact for contact in contacts}
+        except Exception as e:
+            logger.error(f"Failed to load contacts {contact_ids}: {e}")
+            for contact_id in contact_ids:
+                future = self._futures.pop(contact_id)
+                if not future.done():
+                    future.set_exception(e)
+            return
+        
+        for contact_id in contact_ids:
+            future = self._futures[contact_id]
+            if not future.done():
+                future.set_result(found.get(contact_id))
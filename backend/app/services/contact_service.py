@@ -1,12 +1,22 @@
 """Contact application service."""
 import logging
-from typing import Optional
+from typing import Iterable, List, Optional
 from uuid import UUID
 
-from app.domain.entities.contact import Contact, ContactStatus, LessonType, PreferredContact
-from app.domain.repositories.contact_repository import ContactRepository
+from app.domain.entities.contact import (
+    Contact,
+    ContactStatus,
+    LessonType,
+    PreferredContact,
+)
+from app.domain.repositories.contact_repository import (
+    ContactPage,
+    ContactRepository,
+    PageKey,
+)
 from app.domain.value_objects.email import Email
 from app.domain.value_objects.phone import Phone
+from app.services.contact_loader import ContactLoader
 from app.services.email_service import EmailService
 
 logger = logging.getLogger(__name__)
@@ -22,33 +32,30 @@ class ContactService:
     ):
         self.contact_repository = contact_repository
         self.email_service = email_service
+        self.contact_loader = ContactLoader(contact_repository)
     
     async def create_contact(
         self,
         name: str,
-        email: str,
-        phone: Optional[str],
-        lesson_type: str,
-        preferred_contact: str,
+        email: Email | str,
+        phone: Optional[Phone | str],
+        lesson_type: LessonType | str,
+        preferred_contact: PreferredContact | str,
         message: str
     ) -> Contact:
-        """新しい問い合わせを作成"""
+        """
+        新しい問い合わせを作成
+        
+        APIスキーマで検証済みの値オブジェクト・Enumはそのまま使い、
+        文字列が渡された場合のみここで検証する。
+        """
         try:
-            # 値オブジェクトの作成
-            email_vo = Email(email)
-            phone_vo = Phone(phone) if phone else None
-            
-            # Enumの変換
-            lesson_type_enum = LessonType(lesson_type)
-            preferred_contact_enum = PreferredContact(preferred_contact)
-            
-            # Contactエンティティの作成
-            contact = Contact(
+            contact = self._new_contact(
                 name=name,
-                email=email_vo,
-                phone=phone_vo,
-                lesson_type=lesson_type_enum,
-                preferred_contact=preferred_contact_enum,
+                email=email,
+                phone=phone,
+                lesson_type=lesson_type,
+                preferred_contact=preferred_contact,
                 message=message
             )
             
@@ -71,14 +78,53 @@ class ContactService:
             logger.error(f"Failed to create contact: {e}")
             raise
     
+    @staticmethod
+    def _new_contact(
+        name: str,
+        email: Email | str,
+        phone: Optional[Phone | str],
+        lesson_type: LessonType | str,
+        preferred_contact: PreferredContact | str,
+        message: str
+    ) -> Contact:
+        """Contactエンティティを組み立てる（未検証の値のみ値オブジェクト・Enumに変換）"""
+        return Contact.create(
+            name=name,
+            email=email,
+            phone=phone,
+            lesson_type=lesson_type,
+            preferred_contact=preferred_contact,
+            message=message
+        )
+    
     async def get_contact_by_id(self, contact_id: UUID) -> Optional[Contact]:
         """IDで問い合わせを取得"""
         try:
-            return await self.contact_repository.find_by_id(contact_id)
+            return await self.contact_loader.load(contact_id)
         except Exception as e:
             logger.error(f"Failed to get contact {contact_id}: {e}")
             raise
     
+    async def get_contacts_by_ids(self, contact_ids: Iterable[UUID]) -> List[Optional[Contact]]:
+        """複数IDで問い合わせを一括取得（見つからないIDはNone）"""
+        try:
+            return await self.contact_loader.load_many(contact_ids)
+        except Exception as e:
+            logger.error(f"Failed to get contacts: {e}")
+            raise
+    
+    async def get_contacts_page(
+        self,
+        after: Optional[PageKey] = None,
+        limit: int = 20
+    ) -> ContactPage:
+        """問い合わせ一覧をキーセットページネーションで取得"""
+        try:
+            return await self.contact_repository.find_page(after=after, limit=limit)
+        except Exception as e:
+            logger.error(f"Failed to get contacts page: {e}")
+            raise
+    
     async def update_contact_status(
         self,
         contact_id: UUID,
@@ -106,6 +152,7 @@ class ContactService:
             
             # 保存
             updated_contact = await self.contact_repository.save(contact)
+            self.contact_loader.clear(contact_id)
             
             logger.info(f"Contact status updated: {contact_id} -> {status}")
             return updated_contact
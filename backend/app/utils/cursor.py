@@ -0,0 +1,48 @@
+"""
+ページネーションカーソル
+
+キーセットページネーションの位置（created_at, id）を不透明な文字列に変換する
+"""
+
+import base64
+import json
+from datetime import datetime
+from uuid import UUID
+
+from app.domain.repositories.contact_repository import PageKey
+
+
+def encode_cursor(key: PageKey) -> str:
+    """
+    ページ位置をカーソル文字列に変換
+    
+    Args:
+        key: 前ページ最後の (created_at, id)
+        
+    Returns:
+        str: URLセーフなカーソル文字列
+    """
+    created_at, contact_id = key
+    payload = json.dumps([created_at.isoformat(), str(contact_id)], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> PageKey:
+    """
+    カーソル文字列をページ位置に変換
+    
+    Args:
+        cursor: encode_cursor で生成されたカーソル文字列
+        
+    Returns:
+        PageKey: (created_at, id)
+        
+    Raises:
+        ValueError: カーソルが不正な場合
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, contact_id = json.loads(base64.urlsafe_b64decode(padded))
+        return datetime.fromisoformat(created_at), UUID(contact_id)
+    except (ValueError, TypeError) as e:
+        raise ValueError(f"無効なカーソルです: {cursor}") from e
@@ -0,0 +1,162 @@
+"""
+LRUキャッシュ
+
+TTLとサイズ上限付きのインプロセスLRUキャッシュ
+"""
+
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, Generic, Hashable, Optional, Tuple, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    """キャッシュ統計"""
+    
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+    
+    @property
+    def hit_ratio(self) -> float:
+        """ヒット率"""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class LRUCache(Generic[K, V]):
+    """
+    TTL付きLRUキャッシュ
+    
+    上限を超えると最も古く使われたエントリを追い出す。
+    期限切れのエントリは参照時に破棄する（ミスとして数える）。
+    invalidate ごとに世代を進め、読み込み開始時の世代を set に渡すと、
+    読み込み中に破棄されたキーへ古い値を書き戻さない。
+    スレッドセーフではないため、単一のイベントループ内で使用すること。
+    """
+    
+    def __init__(
+        self,
+        max_size: int,
+        ttl: float,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        初期化
+        
+        Args:
+            max_size: 最大エントリ数
+            ttl: 既定の有効期間（秒）
+            clock: 現在時刻（秒）を返す関数
+        """
+        if max_size < 1:
+            raise ValueError("max_size must be positive")
+        self._max_size = max_size
+        self._ttl = ttl
+        self._clock = clock
+        self._entries: "OrderedDict[K, Tuple[float, V]]" = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        # キーごとの最後に破棄した世代（max_size件まで。溢れた分は _invalidated_floor にまとめる）
+        self._generation = 0
+        self._invalidated: "OrderedDict[K, int]" = OrderedDict()
+        self._invalidated_floor = 0
+    
+    @property
+    def generation(self) -> int:
+        """現在の世代（読み込みの開始前に取得して set に渡す）"""
+        return self._generation
+    
+    def get(self, key: K) -> Tuple[bool, Optional[V]]:
+        """
+        値を取得
+        
+        Args:
+            key: キー
+            
+        Returns:
+            Tuple[bool, Optional[V]]: (ヒットしたか, 値)。値がNoneでもヒットはあり得る
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            self._misses += 1
+            return False, None
+        
+        expires_at, value = entry
+        if expires_at <= self._clock():
+            del self._entries[key]
+            self._misses += 1
+            return False, None
+        
+        self._entries.move_to_end(key)
+        self._hits += 1
+        return True, value
+    
+    def set(
+        self,
+        key: K,
+        value: V,
+        ttl: Optional[float] = None,
+        generation: Optional[int] = None,
+    ) -> bool:
+        """
+        値を設定
+        
+        Args:
+            key: キー
+            value: 値
+            ttl: 有効期間（秒）。省略時は既定値
+            generation: 値を読み込む前に取得した世代。その後にキーが破棄されていれば設定しない
+            
+        Returns:
+            bool: 設定した場合True
+        """
+        if generation is not None and self._invalidated_since(key, generation):
+            return False
+        self._entries[key] = (self._clock() + (self._ttl if ttl is None else ttl), value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+            self._evictions += 1
+        return True
+    
+    def invalidate(self, key: K) -> None:
+        """エントリを破棄し、読み込み中の古い値が書き戻されないよう世代を進める"""
+        self._entries.pop(key, None)
+        self._generation += 1
+        self._invalidated[key] = self._generation
+        self._invalidated.move_to_end(key)
+        if len(self._invalidated) > self._max_size:
+            _, generation = self._invalidated.popitem(last=False)
+            self._invalidated_floor = generation
+    
+    def clear(self) -> None:
+        """すべてのエントリと統計をクリア"""
+        self._entries.clear()
+        self._hits = self._misses = self._evictions = 0
+        self._generation += 1
+        self._invalidated.clear()
+        self._invalidated_floor = self._generation
+    
+    def _invalidated_since(self, key: K, generation: int) -> bool:
+        """指定した世代より後にキーが破棄された（可能性がある）場合True"""
+        return max(self._invalidated.get(key, 0), self._invalidated_floor) > generation
+    
+    @property
+    def stats(self) -> CacheStats:
+        """キャッシュ統計を取得"""
+        return CacheStats(
+            hits=self._hits,
+            misses=self._misses,
+            evictions=self._evictions,
+            size=len(self._entries),
+        )
+    
+    def __len__(self) -> int:
+        return len(self._entries)
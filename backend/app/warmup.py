@@ -0,0 +1,203 @@
+"""
+起動時ウォームアップ
+
+デプロイやスケールアウト直後の最初のリクエストが、コネクション確立・SQLのコンパイル・
+モジュールの読み込みのコストを負担しないよう、起動時にまとめて実行する。
+完了までは /health/ready が 503 を返す。コネクションを開くステップが失敗・タイムアウトした場合も
+（warmup_fail_open を有効にしない限り）準備完了にしない。
+"""
+
+import asyncio
+import importlib
+import logging
+import pkgutil
+import time
+from contextlib import AsyncExitStack
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from fastapi import FastAPI
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+from sqlalchemy.pool import QueuePool
+
+from .config import Settings
+from .infrastructure.database.connection import EngineRegistry
+from .infrastructure.repositories.cached_contact_repository import (
+    CachedContactRepository,
+    get_contact_cache,
+)
+from .infrastructure.repositories.sqlalchemy_contact_repository import (
+    SQLAlchemyContactRepository,
+)
+
+logger = logging.getLogger(__name__)
+
+# 成功しないと準備完了にしないステップ（失敗したままではプールが冷えているか接続できない）
+REQUIRED_STEPS = ("open_connections",)
+
+
+@dataclass
+class WarmupState:
+    """ウォームアップの進捗"""
+    
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+    completed_steps: List[str] = field(default_factory=list)
+    errors: Dict[str, str] = field(default_factory=dict)
+    # 必須のステップが失敗しても終了すれば準備完了とする場合True
+    fail_open: bool = False
+    skipped: bool = False
+    
+    @property
+    def finished(self) -> bool:
+        """ウォームアップが終了したか（失敗したステップがあっても終了とみなす）"""
+        return self.finished_at is not None
+    
+    @property
+    def ready(self) -> bool:
+        """準備完了か（終了し、必須のステップがすべて成功した場合。fail_open なら終了した時点）"""
+        if not self.finished:
+            return False
+        return self.skipped or self.fail_open or all(step in self.completed_steps for step in REQUIRED_STEPS)
+    
+    def mark_skipped(self) -> None:
+        """ウォームアップなしで準備完了とする"""
+        self.skipped = True
+        self.started_at = self.finished_at = time.monotonic()
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """レスポンス用の辞書に変換"""
+        duration = None
+        if self.started_at is not None and self.finished_at is not None:
+            duration = round(self.finished_at - self.started_at, 3)
+        return {
+            "ready": self.ready,
+            "finished": self.finished,
+            "duration_seconds": duration,
+            "completed_steps": list(self.completed_steps),
+            "errors": dict(self.errors),
+        }
+
+
+async def _import_endpoints(app: Optional[FastAPI]) -> None:
+    """エンドポイントモジュールを読み込み、OpenAPIスキーマを生成"""
+    from .api import endpoints
+    
+    for module in pkgutil.iter_modules(endpoints.__path__, f"{endpoints.__name__}."):
+        importlib.import_module(module.name)
+    if app is not None:
+        app.openapi()
+
+
+async def _warm_engine(engine: AsyncEngine, connections: int) -> None:
+    """コネクションを開き、それぞれでホットなクエリを実行してからプールに戻す"""
+    pool = engine.sync_engine.pool
+    if isinstance(pool, QueuePool):
+        # pool_size を超えた分はプールに戻さず閉じられるため開かない
+        connections = min(connections, pool.size())
+    else:
+        # NullPool（pgbouncer モード）ではコネクションを保持できないため、
+        # コンパイル済みSQLキャッシュのために1本だけ使う
+        connections = min(connections, 1)
+    
+    async with AsyncExitStack() as stack:
+        opened = await asyncio.gather(
+            *(stack.enter_async_context(engine.connect()) for _ in range(connections))
+        )
+        for connection in opened:
+            async with AsyncSession(bind=connection) as session:
+                await SQLAlchemyContactRepository(session).warm_up()
+
+
+async def _warm_pools(registry: EngineRegistry, connections: int) -> None:
+    """プライマリと各レプリカのプールを温める"""
+    await asyncio.gather(
+        *(
+            _warm_engine(engine, connections)
+            for engine in (registry.async_engine, *registry.replica_engines)
+        )
+    )
+
+
+async def _prime_caches(registry: EngineRegistry, settings: Settings) -> None:
+    """最新の問い合わせを問い合わせキャッシュに載せる"""
+    if not settings.contact_cache_enabled or settings.warmup_cache_contacts <= 0:
+        return
+    
+    async with registry.read_only_session_factory() as session:
+        repository = SQLAlchemyContactRepository(session)
+        page = await repository.find_page(limit=settings.warmup_cache_contacts)
+    CachedContactRepository(repository, get_contact_cache()).prime(page.items)
+
+
+async def warm_up(
+    registry: EngineRegistry,
+    settings: Settings,
+    state: WarmupState,
+    app: Optional[FastAPI] = None,
+) -> WarmupState:
+    """
+    ウォームアップを実行
+    
+    各ステップの失敗はログに記録して次のステップへ進む。
+    全体が warmup_timeout_seconds を超えた場合は打ち切る。
+    REQUIRED_STEPS が失敗した場合、warmup_fail_open が無効なら準備完了にしない。
+    
+    Args:
+        registry: エンジンレジストリ
+        settings: アプリケーション設定
+        state: 進捗を記録するウォームアップ状態
+        app: OpenAPIスキーマを事前生成するアプリケーション
+        
+    Returns:
+        WarmupState: 更新したウォームアップ状態
+    """
+    steps: List[tuple[str, Callable[[], Awaitable[None]]]] = [
+        ("import_endpoints", lambda: _import_endpoints(app)),
+        ("open_connections", lambda: _warm_pools(registry, settings.warmup_pool_connections)),
+        ("prime_caches", lambda: _prime_caches(registry, settings)),
+    ]
+    
+    async def run_steps() -> None:
+        for name, step in steps:
+            try:
+                await step()
+                state.completed_steps.append(name)
+            except Exception as e:
+                state.errors[name] = str(e)
+                logger.warning(f"Warm-up step {name} failed: {e}")
+    
+    state.fail_open = settings.warmup_fail_open
+    state.started_at = time.monotonic()
+    try:
+        await asyncio.wait_for(run_steps(), timeout=settings.warmup_timeout_seconds)
+    except asyncio.TimeoutError:
+        state.errors["timeout"] = f"exceeded {settings.warmup_timeout_seconds}s"
+        logger.warning(f"Warm-up timed out after {settings.warmup_timeout_seconds}s")
+    finally:
+        state.finished_at = time.monotonic()
+    
+    logger.info(
+        f"Warm-up finished in {state.finished_at - state.started_at:.3f}s "
+        f"(completed: {', '.join(state.completed_steps) or 'none'})"
+    )
+    if not state.ready:
+        logger.error(
+            f"Warm-up did not complete {', '.join(REQUIRED_STEPS)}; reporting not ready "
+            "(set WARMUP_FAIL_OPEN=true to report ready anyway)"
+        )
+    return state
+
+
+# グローバルウォームアップ状態
+_state = WarmupState()
+
+
+def get_warmup_state() -> WarmupState:
+    """
+    ウォームアップ状態を取得
+    
+    Returns:
+        WarmupState: ウォームアップ状態
+    """
+    return _state
@@ -0,0 +1,5 @@
+"""
+ベンチマーク
+
+`python -m benchmarks.<name>` でbackendディレクトリから実行する
+"""
@@ -0,0 +1,83 @@
+"""
+接続モードのベンチマーク
+
+direct（アプリ側プール + 準備済みステートメントキャッシュ）と
+pgbouncer（NullPool + 名前なしステートメント）で、リポジトリのホットなクエリの
+スループットを比較する
+
+    python -m benchmarks.bench_connection_modes [同時実行数]
+
+BENCH_DATABASE_URL が未指定の場合は一時ディレクトリのSQLiteファイルを使用する。
+BENCH_PGBOUNCER_URL を指定すると pgbouncer モードはそのURL（PgBouncer経由）に接続する
+"""
+
+import asyncio
+import os
+import random
+import sys
+import tempfile
+from typing import List
+from uuid import UUID
+
+from app.config import get_settings
+from app.infrastructure.database.connection import EngineRegistry
+from app.infrastructure.database.models.base import Base
+from app.infrastructure.repositories.sqlalchemy_contact_repository import (
+    SQLAlchemyContactRepository,
+)
+
+from .common import make_contacts, report, timer
+
+ROWS = 1_000
+ITERATIONS_PER_WORKER = 50
+
+
+async def worker(registry: EngineRegistry, ids: List[UUID]) -> None:
+    """リクエストごとにセッションを開いてホットなクエリを実行"""
+    for _ in range(ITERATIONS_PER_WORKER):
+        async with registry.read_only_session_factory() as session:
+            repository = SQLAlchemyContactRepository(session)
+            await repository.find_by_id(random.choice(ids))
+            await repository.find_page(limit=20)
+            await repository.count_by()
+
+
+async def run_mode(mode: str, url: str, concurrency: int) -> None:
+    """1モードを実行して結果を出力"""
+    settings = get_settings()
+    settings.database_connection_mode = mode
+    settings.database_url = url
+    registry = EngineRegistry()
+
+    async with registry.async_engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
+    contacts = make_contacts(ROWS)
+    async with registry.session_factory() as session:
+        await SQLAlchemyContactRepository(session).insert_many(contacts)
+        await session.commit()
+    ids = [contact.id for contact in contacts]
+
+    try:
+        await worker(registry, ids)  # コンパイル済みSQLキャッシュを温める
+        with timer() as elapsed:
+            await asyncio.gather(*(worker(registry, ids) for _ in range(concurrency)))
+        requests = concurrency * ITERATIONS_PER_WORKER
+        report(f"{mode} sessions", requests / elapsed[0], "req/s")
+        report(f"{mode} queries", requests * 3 / elapsed[0], "queries/s")
+    finally:
+        async with registry.async_engine.begin() as conn:
+            await conn.run_sync(Base.metadata.drop_all)
+        await registry.dispose()
+
+
+async def run(concurrency: int) -> None:
+    """ベンチマークを実行"""
+    with tempfile.TemporaryDirectory() as directory:
+        url = os.getenv("BENCH_DATABASE_URL", f"sqlite+aiosqlite:///{directory}/bench.db")
+        await run_mode("direct", url, concurrency)
+        await run_mode("pgbouncer", os.getenv("BENCH_PGBOUNCER_URL", url), concurrency)
+
+
+if __name__ == "__main__":
+    asyncio.run(run(int(sys.argv[1]) if len(sys.argv) > 1 else 10))
@@ -0,0 +1,113 @@
+"""
+Contact エンティティのベンチマーク
+
+DBの行から Contact を組み立てるコストを、1エンティティあたりのメモリ（tracemalloc）と
+1秒あたりの生成数（timeit）で計測する
+
+    python -m benchmarks.bench_contact_entity [件数]
+"""
+
+import sys
+import timeit
+import tracemalloc
+from datetime import UTC, datetime
+from typing import Callable, List, Tuple
+from uuid import uuid4
+
+from app.domain.entities.contact import (
+    Contact,
+    ContactStatus,
+    LessonType,
+    PreferredContact,
+)
+from app.domain.value_objects.email import Email
+from app.domain.value_objects.phone import Phone
+
+from .common import report
+
+Row = Tuple
+
+
+def make_rows(count: int) -> List[Row]:
+    """DBから読み込んだ行に相当するタプルを生成"""
+    now = datetime.now(UTC)
+    return [
+        (
+            uuid4(),
+            f"ベンチマーク{i}",
+            f"bench{i}@example.com",
+            "09012345678" if i % 2 else None,
+            "ベンチマーク用のメッセージです。",
+            "group",
+            "email",
+            "pending",
+            now,
+            now,
+        )
+        for i in range(count)
+    ]
+
+
+def build_validated(row: Row) -> Contact:
+    """通常のコンストラクター（__init__ / __post_init__ を経由）"""
+    return Contact(
+        id=row[0],
+        name=row[1],
+        email=Email(row[2]),
+        phone=Phone(row[3]) if row[3] else None,
+        message=row[4],
+        lesson_type=LessonType(row[5]),
+        preferred_contact=PreferredContact(row[6]),
+        status=ContactStatus(row[7]),
+        created_at=row[8],
+        updated_at=row[9],
+    )
+
+
+def build_trusted(row: Row) -> Contact:
+    """Contact._from_trusted_row（検証なし、イベントリストは遅延生成）"""
+    return Contact._from_trusted_row(
+        id=row[0],
+        name=row[1],
+        email=Email(row[2]),
+        phone=Phone(row[3]) if row[3] else None,
+        message=row[4],
+        lesson_type=LessonType(row[5]),
+        preferred_contact=PreferredContact(row[6]),
+        status=ContactStatus(row[7]),
+        created_at=row[8],
+        updated_at=row[9],
+    )
+
+
+def bytes_per_entity(build: Callable[[Row], Contact], rows: List[Row]) -> float:
+    """1エンティティあたりの確保バイト数（値オブジェクト・Enum参照を含む）"""
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    entities = [build(row) for row in rows]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del entities
+    return (after - before) / len(rows)
+
+
+def entities_per_second(build: Callable[[Row], Contact], rows: List[Row], repeat: int = 5) -> float:
+    """1秒あたりの生成数（repeat 回の最良値）"""
+    best = min(timeit.repeat(lambda: [build(row) for row in rows], number=1, repeat=repeat))
+    return len(rows) / best
+
+
+def run(count: int) -> None:
+    """ベンチマークを実行"""
+    rows = make_rows(count)
+    builders = [("Contact()", build_validated)]
+    if hasattr(Contact, "_from_trusted_row"):
+        builders.append(("_from_trusted_row()", build_trusted))
+
+    for label, build in builders:
+        report(f"{label} memory", bytes_per_entity(build, rows), "bytes/entity")
+        report(f"{label} throughput", entities_per_second(build, rows), "entities/s")
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 10_000)
@@ -0,0 +1,60 @@
+"""
+問い合わせ作成リクエストの検証ステージのベンチマーク
+
+JSONボディの ContactCreateRequest への検証から、ContactService が Contact を
+組み立てるまで（DB保存・メール送信の手前）の1リクエストあたりの時間を計測する
+
+    python -m benchmarks.bench_contact_validation [件数]
+"""
+
+import json
+import sys
+import timeit
+from typing import List
+
+from app.api.schemas.contact import ContactCreateRequest
+from app.services.contact_service import ContactService
+
+from .common import report
+
+REPEAT = 5
+
+
+def make_bodies(count: int) -> List[bytes]:
+    """POST /api/v1/contacts/ のリクエストボディを生成"""
+    return [
+        json.dumps({
+            "name": f"ベンチマーク{i}",
+            "email": f"Bench{i}@Example.com",
+            "phone": "090-1234-5678" if i % 2 else None,
+            "lesson_type": "trial",
+            "preferred_contact": "email",
+            "message": "体験レッスンを受けたいです。",
+        }).encode()
+        for i in range(count)
+    ]
+
+
+def validate(body: bytes) -> None:
+    """リクエストの検証からエンティティの組み立てまで"""
+    request = ContactCreateRequest.model_validate_json(body)
+    ContactService._new_contact(
+        name=request.name,
+        email=request.email,
+        phone=request.phone,
+        lesson_type=request.lesson_type,
+        preferred_contact=request.preferred_contact,
+        message=request.message,
+    )
+
+
+def run(count: int) -> None:
+    """ベンチマークを実行"""
+    bodies = make_bodies(count)
+    best = min(timeit.repeat(lambda: [validate(body) for body in bodies], number=1, repeat=REPEAT))
+    report("validation stage throughput", count / best, "req/s")
+    report("validation stage latency", best / count * 1_000_000, "us/req")
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 10_000)
@@ -0,0 +1,79 @@
+"""
+バッチ対応イベントハンドラーのベンチマーク
+
+1回の呼び出しごとに一定のレイテンシ（DBや外部APIへの往復を模した asyncio.sleep）がかかる
+ハンドラーで、handle で1件ずつ処理する場合と handle_batch でまとめて処理する場合の
+全イベントの処理が終わるまでの時間を比較する
+
+    python -m benchmarks.bench_event_batch [イベント数] [1回あたりのレイテンシ(ms)]
+"""
+
+import asyncio
+import sys
+from typing import Sequence
+
+from app.domain.events.base import DomainEvent
+from app.domain.events.contact_events import ContactCreated
+from app.infrastructure.event_bus.handlers import EventHandler
+from app.infrastructure.event_bus.in_memory_event_bus import InMemoryEventBus
+
+from .bench_event_dispatch import make_event
+from .common import report, timer
+
+# publish_many 1回あたりのイベント数（リクエストごとのユニットオブワークを模す）
+EVENTS_PER_PUBLISH = 10
+
+
+class RoundTripHandler(EventHandler):
+    """呼び出しごとに一定時間待機するハンドラー"""
+
+    def __init__(self, latency: float):
+        self.latency = latency
+        self.handled = 0
+
+    async def handle(self, event: DomainEvent) -> None:
+        await asyncio.sleep(self.latency)
+        self.handled += 1
+
+    @property
+    def event_type(self) -> type:
+        return ContactCreated
+
+
+class BatchRoundTripHandler(RoundTripHandler):
+    """まとめて1回の往復で処理するハンドラー"""
+
+    async def handle_batch(self, events: Sequence[DomainEvent]) -> None:
+        await asyncio.sleep(self.latency)
+        self.handled += len(events)
+
+
+async def measure(handler: RoundTripHandler, count: int) -> float:
+    """全イベントの処理が終わるまでの秒数"""
+    event_bus = InMemoryEventBus()
+    event_bus.subscribe(ContactCreated, handler)
+    events = [make_event() for _ in range(EVENTS_PER_PUBLISH)]
+    with timer() as elapsed:
+        for _ in range(count // EVENTS_PER_PUBLISH):
+            await event_bus.publish_many(events)
+        await event_bus.stop()
+    assert handler.handled == count
+    return elapsed[0]
+
+
+async def run(count: int, latency_ms: float) -> None:
+    """ベンチマークを実行"""
+    latency = latency_ms / 1000
+    for label, handler in (
+        ("handle (per event)", RoundTripHandler(latency)),
+        ("handle_batch (micro-batches)", BatchRoundTripHandler(latency)),
+    ):
+        elapsed = await measure(handler, count)
+        report(f"{label} throughput", count / elapsed, "events/s")
+
+
+if __name__ == "__main__":
+    asyncio.run(run(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 2_000,
+        float(sys.argv[2]) if len(sys.argv) > 2 else 1.0,
+    ))
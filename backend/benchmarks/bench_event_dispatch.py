@@ -0,0 +1,78 @@
+"""
+イベント配信のベンチマーク
+
+レイテンシの異なる N 個のハンドラー（外部通知などを模した asyncio.sleep）を登録し、
+SEQUENTIAL と CONCURRENT で publish の所要時間を比較する。
+CONCURRENT では合計ではなく最も遅いハンドラーに近い値になる
+
+    python -m benchmarks.bench_event_dispatch [ハンドラー数]
+"""
+
+import asyncio
+import sys
+from typing import List
+
+from app.domain.events.contact_events import ContactCreated
+from app.infrastructure.event_bus.handlers import EventHandler
+from app.infrastructure.event_bus.in_memory_event_bus import (
+    DispatchMode,
+    InMemoryEventBus,
+)
+
+from .common import report, timer
+
+PUBLISHES = 20
+
+
+class SleepingHandler(EventHandler):
+    """一定時間待機するハンドラー"""
+
+    def __init__(self, latency: float):
+        self.latency = latency
+
+    async def handle(self, event: ContactCreated) -> None:
+        await asyncio.sleep(self.latency)
+
+    @property
+    def event_type(self) -> type:
+        return ContactCreated
+
+
+def make_latencies(count: int) -> List[float]:
+    """ハンドラーごとのレイテンシ（1ms〜count ms）"""
+    return [(i + 1) / 1000 for i in range(count)]
+
+
+def make_event() -> ContactCreated:
+    """配信するイベント"""
+    return ContactCreated(
+        contact_id="12345678-1234-1234-1234-123456789012",
+        name="ベンチマーク",
+        email="bench@example.com",
+        phone=None,
+        message="ベンチマーク用のメッセージです。",
+        lesson_type="group",
+        preferred_contact="email",
+    )
+
+
+async def run(count: int) -> None:
+    """ベンチマークを実行"""
+    latencies = make_latencies(count)
+    report("sum of handler latencies", sum(latencies) * 1000, "ms")
+    report("slowest handler latency", max(latencies) * 1000, "ms")
+
+    event = make_event()
+    for mode in DispatchMode:
+        event_bus = InMemoryEventBus(mode=mode)
+        for latency in latencies:
+            event_bus.subscribe(ContactCreated, SleepingHandler(latency))
+
+        with timer() as elapsed:
+            for _ in range(PUBLISHES):
+                await event_bus.publish(event)
+        report(f"{mode.name} publish latency", elapsed[0] / PUBLISHES * 1000, "ms")
+
+
+if __name__ == "__main__":
+    asyncio.run(run(int(sys.argv[1]) if len(sys.argv) > 1 else 10))
@@ -0,0 +1,69 @@
+"""
+イベント配信先の解決コストのベンチマーク
+
+何もしないハンドラーを具体的なクラスと DomainEvent（監査用のワイルドカード）に登録し、
+publish 1回あたりの時間を、配信先をキャッシュする場合と毎回 MRO から求める場合で比較する
+
+    python -m benchmarks.bench_event_lookup [publish回数]
+"""
+
+import asyncio
+import sys
+
+from app.domain.events.base import DomainEvent
+from app.domain.events.contact_events import ContactCreated
+from app.infrastructure.event_bus.handlers import EventHandler
+from app.infrastructure.event_bus.in_memory_event_bus import InMemoryEventBus
+
+from .bench_event_dispatch import make_event
+from .common import report, timer
+
+HANDLERS = 3
+
+
+class NoopHandler(EventHandler):
+    """何もしないハンドラー"""
+
+    async def handle(self, event: DomainEvent) -> None:
+        pass
+
+    @property
+    def event_type(self) -> type:
+        return DomainEvent
+
+
+class UncachedEventBus(InMemoryEventBus):
+    """配信のたびに配信先を求め直すイベントバス（比較用）"""
+
+    async def dispatch(self, event: DomainEvent) -> bool:
+        self._dispatch_table.clear()
+        return await super().dispatch(event)
+
+
+def make_bus(cls: type, wildcard: bool) -> InMemoryEventBus:
+    """ハンドラーを登録したイベントバス"""
+    event_bus = cls()
+    for _ in range(HANDLERS):
+        event_bus.subscribe(ContactCreated, NoopHandler())
+    if wildcard:
+        event_bus.subscribe(DomainEvent, NoopHandler())
+    return event_bus
+
+
+async def run(count: int) -> None:
+    """ベンチマークを実行"""
+    event = make_event()
+    for label, cls, wildcard in (
+        ("exact type only", InMemoryEventBus, False),
+        ("with wildcard, cached table", InMemoryEventBus, True),
+        ("with wildcard, resolved per publish", UncachedEventBus, True),
+    ):
+        event_bus = make_bus(cls, wildcard)
+        with timer() as elapsed:
+            for _ in range(count):
+                await event_bus.publish(event)
+        report(label, elapsed[0] / count * 1_000_000, "us/publish")
+
+
+if __name__ == "__main__":
+    asyncio.run(run(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000))
@@ -0,0 +1,63 @@
+"""
+キュー付きイベント配信のベンチマーク
+
+外部通知を模した遅いハンドラー（asyncio.sleep）を登録し、リクエストから見た
+publish のレイテンシを、ハンドラーを同期的に実行する場合とキューに積む場合で比較する
+
+    python -m benchmarks.bench_event_queue [ハンドラーのレイテンシ(ms)]
+"""
+
+import asyncio
+import sys
+
+from app.domain.events.contact_events import ContactCreated
+from app.infrastructure.event_bus.in_memory_event_bus import (
+    DispatchMode,
+    InMemoryEventBus,
+)
+from app.infrastructure.event_bus.queued_event_bus import (
+    QueuedEventBus,
+    queue_lag_seconds,
+)
+
+from .bench_event_dispatch import SleepingHandler, make_event
+from .common import report, timer
+
+PUBLISHES = 200
+HANDLERS = 3
+
+
+def make_inner_bus(latency: float) -> InMemoryEventBus:
+    """遅いハンドラーを登録したイベントバス"""
+    event_bus = InMemoryEventBus(mode=DispatchMode.CONCURRENT)
+    for _ in range(HANDLERS):
+        event_bus.subscribe(ContactCreated, SleepingHandler(latency))
+    return event_bus
+
+
+async def run(latency_ms: float) -> None:
+    """ベンチマークを実行"""
+    latency = latency_ms / 1000
+    event = make_event()
+
+    inline = make_inner_bus(latency)
+    with timer() as elapsed:
+        for _ in range(PUBLISHES // 10):
+            await inline.publish(event)
+    report("inline publish latency", elapsed[0] / (PUBLISHES // 10) * 1000, "ms")
+
+    queued = QueuedEventBus(make_inner_bus(latency), max_size=PUBLISHES, workers=16, name="bench")
+    await queued.start()
+    with timer() as elapsed:
+        for _ in range(PUBLISHES):
+            await queued.publish(event)
+    report("queued publish latency", elapsed[0] / PUBLISHES * 1_000_000, "us")
+
+    with timer() as elapsed:
+        await queued.stop()
+    report("queued drain time", elapsed[0] * 1000, "ms")
+    report("queued events processed", queue_lag_seconds.count(bus="bench"), "events")
+
+
+if __name__ == "__main__":
+    asyncio.run(run(float(sys.argv[1]) if len(sys.argv) > 1 else 20))
@@ -0,0 +1,47 @@
+"""
+ページネーションベンチマーク
+
+find_all()（OFFSET）と find_page()（キーセット）で浅いページと深いページの取得時間を比較する
+
+    python -m benchmarks.bench_find_page [行数]
+"""
+
+import asyncio
+import sys
+
+from app.infrastructure.repositories.sqlalchemy_contact_repository import (
+    SQLAlchemyContactRepository,
+)
+
+from .common import bench_session, make_contacts, report, timer
+
+PAGE_SIZE = 20
+REPEAT = 50
+
+
+async def run(rows: int) -> None:
+    """ベンチマークを実行"""
+    async with bench_session() as session:
+        repository = SQLAlchemyContactRepository(session)
+        await repository.insert_many(make_contacts(rows))
+        await session.commit()
+
+        deep_offset = rows - PAGE_SIZE
+        deep_page = await repository.find_all(limit=1, offset=deep_offset - 1)
+        deep_key = (deep_page[0].created_at, deep_page[0].id)
+
+        for label, offset in (("first", 0), ("deep", deep_offset)):
+            with timer() as elapsed:
+                for _ in range(REPEAT):
+                    await repository.find_all(limit=PAGE_SIZE, offset=offset)
+            report(f"find_all() {label} page (offset={offset})", elapsed[0] / REPEAT * 1000, "ms")
+
+        for label, after in (("first", None), ("deep", deep_key)):
+            with timer() as elapsed:
+                for _ in range(REPEAT):
+                    await repository.find_page(after=after, limit=PAGE_SIZE)
+            report(f"find_page() {label} page", elapsed[0] / REPEAT * 1000, "ms")
+
+
+if __name__ == "__main__":
+    asyncio.run(run(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000))
@@ -0,0 +1,55 @@
+"""
+行→エンティティ変換（ハイドレーション）のベンチマーク
+
+10k行の find_all() 全体と、_model_to_entity() 単体の時間を
+TRUSTED（検証なし）と STRICT（全検証）で比較する
+
+    python -m benchmarks.bench_hydration [行数]
+"""
+
+import asyncio
+import sys
+
+from sqlalchemy import select
+
+from app.infrastructure.database.models.contact import ContactModel
+from app.infrastructure.repositories.sqlalchemy_contact_repository import (
+    HydrationMode,
+    SQLAlchemyContactRepository,
+)
+
+from .common import bench_session, make_contacts, report, timer
+
+REPEAT = 5
+
+
+async def run(rows: int) -> None:
+    """ベンチマークを実行"""
+    async with bench_session() as session:
+        await SQLAlchemyContactRepository(session).insert_many(make_contacts(rows))
+        await session.commit()
+
+        for mode in HydrationMode:
+            label = mode.name
+            repository = SQLAlchemyContactRepository(session, hydration=mode)
+
+            best = float("inf")
+            for _ in range(REPEAT):
+                session.expunge_all()
+                with timer() as elapsed:
+                    await repository.find_all(limit=rows)
+                best = min(best, elapsed[0])
+            report(f"find_all({rows}) {label}", best * 1000, "ms")
+
+            models = (await session.execute(select(ContactModel))).scalars().all()
+            best = float("inf")
+            for _ in range(REPEAT):
+                with timer() as elapsed:
+                    for model in models:
+                        repository._model_to_entity(model)
+                best = min(best, elapsed[0])
+            report(f"_model_to_entity x{len(models)} {label}", best * 1000, "ms")
+
+
+if __name__ == "__main__":
+    asyncio.run(run(int(sys.argv[1]) if len(sys.argv) > 1 else 10_000))
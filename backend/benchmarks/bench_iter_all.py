@@ -0,0 +1,50 @@
+"""
+ストリーミング読み出しベンチマーク
+
+find_all() と iter_all() で全件を走査したときのピークメモリ（tracemalloc）を比較する
+iter_all() はテーブルの行数に関わらずピークがほぼ一定になる
+
+    python -m benchmarks.bench_iter_all [行数...]
+"""
+
+import asyncio
+import sys
+import tracemalloc
+
+from app.infrastructure.repositories.sqlalchemy_contact_repository import (
+    SQLAlchemyContactRepository,
+)
+
+from .common import bench_session, make_contacts, report
+
+BATCH_SIZE = 1000
+
+
+async def run(sizes: list[int]) -> None:
+    """ベンチマークを実行"""
+    for rows in sizes:
+        async with bench_session() as session:
+            repository = SQLAlchemyContactRepository(session)
+            for start in range(0, rows, 10_000):
+                await repository.insert_many(make_contacts(min(10_000, rows - start)))
+            await session.commit()
+            session.expunge_all()
+
+            tracemalloc.start()
+            contacts = await repository.find_all(limit=rows)
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            del contacts
+            session.expunge_all()
+            report(f"find_all() peak, {rows:,} rows", peak / 1024 / 1024, "MiB")
+
+            tracemalloc.start()
+            async for _ in repository.iter_all(batch_size=BATCH_SIZE):
+                pass
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            report(f"iter_all() peak, {rows:,} rows", peak / 1024 / 1024, "MiB")
+
+
+if __name__ == "__main__":
+    asyncio.run(run([int(arg) for arg in sys.argv[1:]] or [10_000, 100_000]))
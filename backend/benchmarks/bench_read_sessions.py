@@ -0,0 +1,131 @@
+"""
+読み取り専用セッションのベンチマーク
+
+同時GETリクエストを get_session()（コミットあり）と get_read_only_session() で処理し、
+スループット、プールの使用中コネクション数（平均・最大）、
+1チェックアウトあたりのコネクション保持時間を比較する
+
+    python -m benchmarks.bench_read_sessions [同時リクエスト数]
+
+BENCH_DATABASE_URL が未指定の場合は一時ディレクトリのSQLiteファイルを使用する
+"""
+
+import asyncio
+import os
+import sys
+import tempfile
+import time
+from typing import List
+
+from httpx import AsyncClient
+from sqlalchemy import event
+
+from app.config import get_settings
+from app.infrastructure.database import connection
+from app.infrastructure.database.connection import (
+    EngineRegistry,
+    get_read_only_session,
+    get_session,
+)
+from app.infrastructure.database.models.base import Base
+from app.infrastructure.repositories.sqlalchemy_contact_repository import (
+    SQLAlchemyContactRepository,
+)
+from app.main import app
+
+from .common import make_contacts, report, timer
+
+ROWS = 1_000
+REQUESTS_PER_CLIENT = 20
+POOL_SIZE = 10
+
+
+async def sample_pool(pool, samples: List[int], stop: asyncio.Event) -> None:
+    """使用中コネクション数を定期的に記録"""
+    while not stop.is_set():
+        samples.append(pool.checkedout())
+        await asyncio.sleep(0.0005)
+
+
+async def client_loop(client: AsyncClient, ids: List[str]) -> None:
+    """詳細取得と一覧取得を交互に実行"""
+    for i in range(REQUESTS_PER_CLIENT):
+        if i % 2:
+            response = await client.get("/api/v1/contacts/", params={"limit": 20})
+        else:
+            response = await client.get(f"/api/v1/contacts/{ids[i % len(ids)]}")
+        response.raise_for_status()
+
+
+async def run_scenario(label: str, registry: EngineRegistry, ids: List[str], concurrency: int) -> None:
+    """1シナリオを実行して結果を出力"""
+    pool = registry.async_engine.pool
+    samples: List[int] = []
+    held: List[float] = []
+
+    def on_checkout(dbapi_connection, connection_record, connection_proxy):
+        connection_record.info["checked_out_at"] = time.perf_counter()
+
+    def on_checkin(dbapi_connection, connection_record):
+        held.append(time.perf_counter() - connection_record.info.pop("checked_out_at"))
+
+    sync_engine = registry.async_engine.sync_engine
+    event.listen(sync_engine, "checkout", on_checkout)
+    event.listen(sync_engine, "checkin", on_checkin)
+    stop = asyncio.Event()
+    sampler = asyncio.create_task(sample_pool(pool, samples, stop))
+
+    async with AsyncClient(app=app, base_url="http://bench") as client:
+        with timer() as elapsed:
+            await asyncio.gather(*(client_loop(client, ids) for _ in range(concurrency)))
+
+    stop.set()
+    await sampler
+    event.remove(sync_engine, "checkout", on_checkout)
+    event.remove(sync_engine, "checkin", on_checkin)
+    total = concurrency * REQUESTS_PER_CLIENT
+    report(f"{label} throughput", total / elapsed[0], "req/s")
+    report(f"{label} connections in use (mean)", sum(samples) / len(samples), "conns")
+    report(f"{label} connections in use (peak)", max(samples), "conns")
+    report(f"{label} connection held per checkout", sum(held) / len(held) * 1000, "ms")
+
+
+async def run(concurrency: int) -> None:
+    """ベンチマークを実行"""
+    settings = get_settings()
+    with tempfile.TemporaryDirectory() as directory:
+        settings.database_url = os.getenv(
+            "BENCH_DATABASE_URL", f"sqlite+aiosqlite:///{directory}/bench.db"
+        )
+        # リポジトリのキャッシュを無効にして毎回DBを参照させる
+        settings.contact_cache_enabled = False
+        os.environ["DATABASE_POOL_SIZE"] = str(POOL_SIZE)
+        os.environ["DATABASE_MAX_OVERFLOW"] = "0"
+
+        registry = EngineRegistry()
+        connection._registry = registry
+        async with registry.async_engine.begin() as conn:
+            await conn.run_sync(Base.metadata.drop_all)
+            await conn.run_sync(Base.metadata.create_all)
+
+        contacts = make_contacts(ROWS)
+        async with registry.session_factory() as session:
+            await SQLAlchemyContactRepository(session).insert_many(contacts)
+            await session.commit()
+        ids = [str(contact.id) for contact in contacts]
+
+        try:
+            # 変更前: GETも get_session()（リクエスト終了時にコミット）
+            app.dependency_overrides[get_read_only_session] = get_session
+            await run_scenario("read-write", registry, ids, concurrency)
+
+            app.dependency_overrides.clear()
+            await run_scenario("read-only", registry, ids, concurrency)
+        finally:
+            async with registry.async_engine.begin() as conn:
+                await conn.run_sync(Base.metadata.drop_all)
+            await registry.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(run(int(sys.argv[1]) if len(sys.argv) > 1 else 50))
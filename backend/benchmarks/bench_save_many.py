@@ -0,0 +1,45 @@
+"""
+一括保存ベンチマーク
+
+save() の1行ずつの保存と save_many() / insert_many() のスループット（行/秒）を比較する
+
+    python -m benchmarks.bench_save_many [行数]
+"""
+
+import asyncio
+import sys
+
+from app.infrastructure.repositories.sqlalchemy_contact_repository import (
+    SQLAlchemyContactRepository,
+)
+
+from .common import bench_session, make_contacts, report, timer
+
+
+async def run(rows: int) -> None:
+    """ベンチマークを実行"""
+    async with bench_session() as session:
+        repository = SQLAlchemyContactRepository(session)
+        with timer() as elapsed:
+            for contact in make_contacts(rows):
+                await repository.save(contact)
+            await session.commit()
+        report("save() per row", rows / elapsed[0], "rows/s")
+
+    async with bench_session() as session:
+        repository = SQLAlchemyContactRepository(session)
+        with timer() as elapsed:
+            await repository.save_many(make_contacts(rows))
+            await session.commit()
+        report("save_many() executemany upsert", rows / elapsed[0], "rows/s")
+
+    async with bench_session() as session:
+        repository = SQLAlchemyContactRepository(session)
+        with timer() as elapsed:
+            await repository.insert_many(make_contacts(rows))
+            await session.commit()
+        report("insert_many() COPY / executemany INSERT", rows / elapsed[0], "rows/s")
+
+
+if __name__ == "__main__":
+    asyncio.run(run(int(sys.argv[1]) if len(sys.argv) > 1 else 10_000))
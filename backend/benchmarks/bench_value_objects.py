@@ -0,0 +1,61 @@
+"""
+値オブジェクトの一括検証のベンチマーク
+
+1件ずつの Email() / Phone()（無効な行は例外を捕捉）と、
+Email.validate_many() / Phone.normalize_many() のスループットを比較する
+
+    python -m benchmarks.bench_value_objects [行数]
+"""
+
+import sys
+import timeit
+from typing import Callable, List, Sequence
+
+from app.domain.value_objects.email import Email
+from app.domain.value_objects.phone import Phone
+
+from .common import report
+
+REPEAT = 3
+
+
+def make_emails(count: int) -> List[str]:
+    """メールアドレスの列（10行に1行は無効）"""
+    return [f"User{i}@Example.com" if i % 10 else f"broken{i}" for i in range(count)]
+
+
+def make_phones(count: int) -> List[str]:
+    """電話番号の列（正規化済み・ハイフン区切り・国際番号形式が混在、10行に1行は無効）"""
+    formats = ["09012345678", "090-1234-5678", "+81 3 1234 5678"]
+    return [formats[i % 3] if i % 10 else "12-34" for i in range(count)]
+
+
+def one_by_one(cls: type, values: Sequence[str]) -> list:
+    """1件ずつ作成（無効な行は例外を捕捉）"""
+    results = []
+    for value in values:
+        try:
+            results.append(cls(value))
+        except ValueError as e:
+            results.append(str(e))
+    return results
+
+
+def rows_per_second(func: Callable[[], object], count: int) -> float:
+    """1秒あたりの処理行数（REPEAT 回の最良値）"""
+    return count / min(timeit.repeat(func, number=1, repeat=REPEAT))
+
+
+def run(count: int) -> None:
+    """ベンチマークを実行"""
+    emails = make_emails(count)
+    phones = make_phones(count)
+
+    report("Email() one by one", rows_per_second(lambda: one_by_one(Email, emails), count), "rows/s")
+    report("Email.validate_many", rows_per_second(lambda: Email.validate_many(emails), count), "rows/s")
+    report("Phone() one by one", rows_per_second(lambda: one_by_one(Phone, phones), count), "rows/s")
+    report("Phone.normalize_many", rows_per_second(lambda: Phone.normalize_many(phones), count), "rows/s")
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
@@ -0,0 +1,86 @@
+"""
+ベンチマーク共通ユーティリティ
+
+BENCH_DATABASE_URL が指定されていればそのDBを、なければインメモリSQLiteを使用する
+"""
+
+import os
+import time
+from contextlib import asynccontextmanager, contextmanager
+from typing import AsyncIterator, Iterator, List
+from uuid import uuid4
+
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+from sqlalchemy.pool import StaticPool
+
+from app.domain.entities.contact import Contact, LessonType, PreferredContact
+from app.domain.value_objects.email import Email
+from app.domain.value_objects.phone import Phone
+from app.infrastructure.database.models.base import Base
+
+SQLITE_URL = "sqlite+aiosqlite:///:memory:"
+
+
+def create_bench_engine() -> AsyncEngine:
+    """ベンチマーク用のエンジンを作成"""
+    url = os.getenv("BENCH_DATABASE_URL", SQLITE_URL)
+    if url.startswith("sqlite"):
+        return create_async_engine(
+            url, poolclass=StaticPool, connect_args={"check_same_thread": False}
+        )
+    return create_async_engine(url.replace("postgresql://", "postgresql+asyncpg://"))
+
+
+@asynccontextmanager
+async def bench_session() -> AsyncIterator[AsyncSession]:
+    """テーブルを作り直したセッションを提供"""
+    engine = create_bench_engine()
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
+
+    session_maker = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    try:
+        async with session_maker() as session:
+            yield session
+    finally:
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.drop_all)
+        await engine.dispose()
+
+
+def make_contacts(count: int) -> List[Contact]:
+    """ベンチマーク用の問い合わせを生成"""
+    return [
+        Contact(
+            id=uuid4(),
+            name=f"ベンチマーク{i}",
+            email=Email(f"bench{i}@example.com"),
+            phone=Phone("090-1234-5678") if i % 2 else None,
+            message="ベンチマーク用のメッセージです。",
+            lesson_type=LessonType.GROUP,
+            preferred_contact=PreferredContact.EMAIL,
+        )
+        for i in range(count)
+    ]
+
+
+@contextmanager
+def timer() -> Iterator[List[float]]:
+    """経過秒数を計測（終了時に結果リストへ追加）"""
+    elapsed: List[float] = []
+    start = time.perf_counter()
+    try:
+        yield elapsed
+    finally:
+        elapsed.append(time.perf_counter() - start)
+
+
+def report(label: str, value: float, unit: str) -> None:
+    """計測結果を出力"""
+    print(f"{label:<40} {value:>14,.1f} {unit}")
@@ -0,0 +1,62 @@
+"""Tests for Admin API endpoints."""
+import pytest
+from fastapi import FastAPI
+from httpx import AsyncClient
+from sqlalchemy import create_engine
+
+from app.config import get_settings
+from app.infrastructure.database import slow_query
+from app.infrastructure.database.slow_query import SlowQueryLog
+
+
+class TestAdminAPI:
+    """Admin API のテストケース"""
+    
+    @pytest.fixture
+    async def client(self, app: FastAPI) -> AsyncClient:
+        """テスト用HTTPクライアント"""
+        async with AsyncClient(app=app, base_url="http://test") as client:
+            yield client
+    
+    @pytest.fixture
+    def slow_query_log(self, monkeypatch) -> SlowQueryLog:
+        """管理APIを有効にしたスロークエリログ"""
+        monkeypatch.setattr(get_settings(), "admin_api_token", "test-token")
+        log = SlowQueryLog(threshold_ms=0)
+        monkeypatch.setattr(slow_query, "_slow_query_log", log)
+        return log
+    
+    async def test_list_slow_queries(self, client: AsyncClient, slow_query_log: SlowQueryLog):
+        """スロークエリ一覧取得テスト"""
+        engine = create_engine("sqlite://")
+        slow_query_log.instrument(engine)
+        with engine.connect() as connection:
+            connection.exec_driver_sql("SELECT 1 WHERE 'secret' = ?", ("secret",))
+        engine.dispose()
+        
+        response = await client.get(
+            "/api/v1/admin/slow-queries",
+            headers={"X-Admin-Token": "test-token"}
+        )
+        
+        assert response.status_code == 200
+        data = response.json()
+        assert data["threshold_ms"] == 0
+        assert data["items"][0]["statement"] == "SELECT ? WHERE ? = ?"
+        assert data["items"][0]["parameters_shape"] == "(str)"
+        assert "secret" not in response.text
+    
+    async def test_invalid_token(self, client: AsyncClient, slow_query_log: SlowQueryLog):
+        """無効なトークンでの取得テスト"""
+        response = await client.get(
+            "/api/v1/admin/slow-queries",
+            headers={"X-Admin-Token": "wrong"}
+        )
+        
+        assert response.status_code == 403
+    
+    async def test_disabled_without_token_setting(self, client: AsyncClient):
+        """トークン未設定時は管理APIが無効になるテスト"""
+        response = await client.get("/api/v1/admin/slow-queries")
+        
+        assert response.status_code == 404
@@ -1,13 +1,30 @@
 """Tests for Contact API endpoints."""
 import pytest
-from httpx import AsyncClient
 from fastapi import FastAPI
+from httpx import AsyncClient
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.domain.entities.contact import LessonType, PreferredContact
+from app.domain.events.contact_events import ContactCreated
+from app.infrastructure.di.container import get_container
+from app.infrastructure.event_bus import EventBus, EventHandler
 from app.services.contact_service import ContactService
 
 
+class RecordingHandler(EventHandler):
+    """受け取ったイベントを記録するテスト用ハンドラー"""
+    
+    def __init__(self):
+        self.handled = []
+    
+    async def handle(self, event):
+        self.handled.append(event)
+    
+    @property
+    def event_type(self):
+        return ContactCreated
+
+
 class TestContactAPI:
     """Contact API のテストケース"""
     
@@ -63,6 +80,35 @@ class TestContactAPI:
         data = response.json()
         assert data["message"] == "お問い合わせを受け付けました。"
     
+    async def test_create_contact_publishes_event_after_commit(
+        self,
+        client: AsyncClient,
+        async_session: AsyncSession
+    ):
+        """問い合わせ作成のコミット後に ContactCreated が配信されるテスト"""
+        event_bus = get_container().get(EventBus)
+        handler = RecordingHandler()
+        event_bus.subscribe(ContactCreated, handler)
+        try:
+            contact_data = {
+                "name": "イベント太郎",
+                "email": "event@example.com",
+                "lesson_type": "group",
+                "preferred_contact": "email",
+                "message": "イベント配信のテストです。"
+            }
+            
+            response = await client.post("/api/v1/contacts/", json=contact_data)
+            assert response.status_code == 201
+            
+            # キューに残ったイベントを処理させる
+            await event_bus.stop()
+            await event_bus.start()
+        finally:
+            event_bus.unsubscribe(ContactCreated, handler)
+        
+        assert [str(event.contact_id) for event in handler.handled] == [response.json()["contact_id"]]
+    
     async def test_create_contact_invalid_email(
         self,
         client: AsyncClient,
@@ -81,6 +127,48 @@ class TestContactAPI:
         
         assert response.status_code == 422  # Validation error
     
+    async def test_create_contact_invalid_phone(
+        self,
+        client: AsyncClient,
+        async_session: AsyncSession
+    ):
+        """無効な電話番号での問い合わせ作成テスト"""
+        contact_data = {
+            "name": "電話太郎",
+            "email": "phone@example.com",
+            "phone": "12-34",
+            "lesson_type": "group",
+            "preferred_contact": "phone",
+            "message": "電話で連絡をお願いします。"
+        }
+        
+        response = await client.post("/api/v1/contacts/", json=contact_data)
+        
+        assert response.status_code == 422  # Validation error
+    
+    async def test_create_contact_normalizes_email_and_phone(
+        self,
+        client: AsyncClient,
+        async_session: AsyncSession
+    ):
+        """リクエスト検証時の正規化結果が保存されるテスト"""
+        contact_data = {
+            "name": "正規化花子",
+            "email": "Normalize@Example.com",
+            "phone": "+81 90-1234-5678",
+            "lesson_type": "toeic",
+            "preferred_contact": "email",
+            "message": "TOEIC対策を希望します。"
+        }
+        
+        create_response = await client.post("/api/v1/contacts/", json=contact_data)
+        assert create_response.status_code == 201
+        contact_id = create_response.json()["contact_id"]
+        
+        data = (await client.get(f"/api/v1/contacts/{contact_id}")).json()
+        assert data["email"] == "normalize@example.com"
+        assert data["phone"] == "09012345678"
+    
     async def test_create_contact_empty_name(
         self,
         client: AsyncClient,
@@ -174,4 +262,53 @@ class TestContactAPI:
         
         response = await client.get(f"/api/v1/contacts/{invalid_id}")
         
-        assert response.status_code == 422  # Validation error
\ No newline at end of file
+        assert response.status_code == 422  # Validation error
+    
+    async def test_list_contacts_pagination(
+        self,
+        client: AsyncClient,
+        async_session: AsyncSession
+    ):
+        """問い合わせ一覧のカーソルページネーションテスト"""
+        for i in range(3):
+            contact_data = {
+                "name": f"一覧テスト{i}",
+                "email": f"list{i}@example.com",
+                "lesson_type": "group",
+                "preferred_contact": "email",
+                "message": "一覧テスト用の問い合わせです。"
+            }
+            response = await client.post("/api/v1/contacts/", json=contact_data)
+            assert response.status_code == 201
+        
+        # 1ページ目
+        first_response = await client.get("/api/v1/contacts/", params={"limit": 2})
+        
+        assert first_response.status_code == 200
+        first_page = first_response.json()
+        assert len(first_page["items"]) == 2
+        assert first_page["next_cursor"] is not None
+        
+        # 2ページ目
+        second_response = await client.get(
+            "/api/v1/contacts/",
+            params={"limit": 2, "cursor": first_page["next_cursor"]}
+        )
+        
+        assert second_response.status_code == 200
+        second_page = second_response.json()
+        assert len(second_page["items"]) == 1
+        assert second_page["next_cursor"] is None
+        
+        ids = [item["id"] for item in first_page["items"] + second_page["items"]]
+        assert len(set(ids)) == 3
+    
+    async def test_list_contacts_invalid_cursor(
+        self,
+        client: AsyncClient,
+        async_session: AsyncSession
+    ):
+        """無効なカーソルでの一覧取得テスト"""
+        response = await client.get("/api/v1/contacts/", params={"cursor": "invalid"})
+        
+        assert response.status_code == 400
@@ -3,14 +3,20 @@ import os
 from typing import AsyncGenerator
 
 import pytest
+from fastapi import FastAPI
 from httpx import AsyncClient
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.pool import StaticPool
-from fastapi import FastAPI
 
-from app.main import app as main_app
+from app.infrastructure.database.connection import (
+    get_async_session,
+    get_read_only_session,
+)
 from app.infrastructure.database.models.base import Base
 from app.infrastructure.di.container import get_container
+from app.infrastructure.event_bus import EventBus
+from app.infrastructure.repositories.cached_contact_repository import get_contact_cache
+from app.main import app as main_app
 
 
 @pytest.fixture(scope="session")
@@ -27,8 +33,18 @@ async def app(async_session: AsyncSession) -> FastAPI:
     # DIコンテナにテスト用のデータベースセッションを設定
     container = get_container()
     await container.setup_database_services(async_session)
+    event_bus = container.get(EventBus)
+    await event_bus.start()
+    
+    # エンドポイントのセッション依存性もテスト用セッションに差し替える
+    main_app.dependency_overrides[get_async_session] = lambda: async_session
+    main_app.dependency_overrides[get_read_only_session] = lambda: async_session
+    
+    yield main_app
     
-    return main_app
+    main_app.dependency_overrides.clear()
+    get_contact_cache().clear()
+    await event_bus.stop()
 
 
 @pytest.fixture
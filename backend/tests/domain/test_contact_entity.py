@@ -1,11 +1,22 @@
 """Contactエンティティのテスト"""
 
-import pytest
 from datetime import datetime
-from uuid import UUID
+from uuid import UUID, uuid4
+
+import pytest
 
-from app.domain.entities.contact import Contact, ContactStatus, LessonType, PreferredContact
-from app.domain.events.contact_events import ContactCreated, ContactProcessed, ContactUpdated
+from app.domain.entities.contact import (
+    Contact,
+    ContactStatus,
+    LessonType,
+    PreferredContact,
+)
+from app.domain.events.contact_events import (
+    ContactCreated,
+    ContactProcessed,
+    ContactUpdated,
+)
+from app.domain.value_objects.email import Email
 
 
 class TestContact:
@@ -189,6 +200,48 @@ class TestContact:
         events = contact.get_domain_events()
         assert len(events) == 0
     
+    def test_from_trusted_row(self):
+        """保存済みの行からの復元テスト（検証なし、イベントなし）"""
+        now = datetime.now()
+        contact = Contact._from_trusted_row(
+            id=uuid4(),
+            name="テスト太郎",
+            email=Email("test@example.com"),
+            phone=None,
+            message="テストメッセージです。",
+            lesson_type=LessonType.GROUP,
+            preferred_contact=PreferredContact.EMAIL,
+            status=ContactStatus.COMPLETED,
+            created_at=now,
+            updated_at=now,
+            processed_by="管理者",
+        )
+        
+        assert contact.is_completed()
+        assert contact.processed_by == "管理者"
+        assert contact.processed_at is None
+        assert contact.get_domain_events() == []
+        
+        # イベントリストは最初のイベント追加時に作成される
+        contact.update_status(ContactStatus.PENDING)
+        assert len(contact.get_domain_events()) == 1
+    
+    def test_no_instance_dict(self):
+        """エンティティと値オブジェクトがインスタンス辞書を持たないテスト"""
+        contact = Contact.create(
+            name="テスト太郎",
+            email="test@example.com",
+            message="テストメッセージです。",
+            lesson_type="group",
+            preferred_contact="email",
+            phone="090-1234-5678"
+        )
+        
+        for obj in (contact, contact.email, contact.phone):
+            assert not hasattr(obj, "__dict__")
+        with pytest.raises(AttributeError):
+            contact.unknown_attribute = "x"
+    
     def test_contact_string_representation(self):
         """文字列表現のテスト"""
         contact = Contact.create(
@@ -0,0 +1,126 @@
+"""ドメインイベントのシリアライズのテスト"""
+
+import inspect
+import json
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from enum import Enum
+from typing import Any, Dict, Optional
+from uuid import UUID, uuid4
+
+import pytest
+
+from app.domain.events import contact_events
+from app.domain.events.base import DomainEvent
+from app.domain.events.contact_events import (
+    ContactCreated,
+    ContactProcessed,
+    ContactUpdated,
+)
+
+
+class Priority(Enum):
+    """テスト用の列挙型"""
+
+    HIGH = "high"
+    LOW = "low"
+
+
+@dataclass(frozen=True)
+class ScheduledForTest(DomainEvent):
+    """UUID・日時・列挙型の Optional フィールドを持つテスト用イベント"""
+
+    contact_id: UUID
+    scheduled_at: datetime
+    priority: Priority
+    reviewer_id: Optional[UUID]
+    reminded_at: Optional[datetime]
+
+    def _get_event_data(self) -> Dict[str, Any]:
+        return {
+            'contact_id': str(self.contact_id),
+            'scheduled_at': self.scheduled_at.isoformat(),
+            'priority': self.priority.value,
+            'reviewer_id': str(self.reviewer_id) if self.reviewer_id else None,
+            'reminded_at': self.reminded_at.isoformat() if self.reminded_at else None,
+        }
+
+
+# contact_events の全イベントクラスのサンプル
+CONTACT_EVENTS = [
+    ContactCreated(
+        contact_id=uuid4(),
+        name="テスト太郎",
+        email="test@example.com",
+        phone=None,
+        message="テストメッセージ",
+        lesson_type="group",
+        preferred_contact="email",
+    ),
+    ContactUpdated(contact_id=uuid4(), updated_fields={"status": "in_progress", "tags": ["a", "b"]}),
+    ContactProcessed(contact_id=uuid4(), processed_by="admin", processing_notes="対応済み"),
+]
+
+
+def round_trip(event: DomainEvent) -> DomainEvent:
+    """アウトボックスと同じく JSON を経由して復元"""
+    return DomainEvent.from_dict(json.loads(json.dumps(event.to_dict())))
+
+
+class TestFromDict:
+    """DomainEvent.from_dict のテスト"""
+
+    def test_samples_cover_every_contact_event(self):
+        """サンプルが contact_events の全イベントクラスを網羅しているテスト"""
+        event_classes = {
+            cls
+            for _, cls in inspect.getmembers(contact_events, inspect.isclass)
+            if issubclass(cls, DomainEvent) and cls is not DomainEvent
+        }
+        assert {type(event) for event in CONTACT_EVENTS} == event_classes
+
+    @pytest.mark.parametrize("event", CONTACT_EVENTS, ids=lambda event: type(event).__name__)
+    def test_contact_event_round_trip(self, event):
+        """contact_events の各イベントが元と同じ値に復元されるテスト"""
+        restored = round_trip(event)
+
+        assert type(restored) is type(event)
+        assert restored == event
+        assert isinstance(restored.contact_id, UUID)
+
+    def test_converts_datetime_enum_and_optional_fields(self):
+        """日時・列挙型・Optional のフィールドが型ヒントの型に戻るテスト"""
+        event = ScheduledForTest(
+            contact_id=uuid4(),
+            scheduled_at=datetime(2024, 4, 1, 10, 30, tzinfo=UTC),
+            priority=Priority.HIGH,
+            reviewer_id=uuid4(),
+            reminded_at=datetime(2024, 3, 31, 9, 0, tzinfo=UTC),
+        )
+
+        restored = round_trip(event)
+
+        assert restored == event
+        assert restored.priority is Priority.HIGH
+        assert isinstance(restored.reviewer_id, UUID)
+        assert isinstance(restored.reminded_at, datetime)
+
+    def test_optional_fields_keep_none(self):
+        """None の Optional フィールドは None のまま復元されるテスト"""
+        event = ScheduledForTest(
+            contact_id=uuid4(),
+            scheduled_at=datetime(2024, 4, 1, 10, 30, tzinfo=UTC),
+            priority=Priority.LOW,
+            reviewer_id=None,
+            reminded_at=None,
+        )
+
+        assert round_trip(event) == event
+
+    def test_unknown_event_type_is_rejected(self):
+        """未知のイベントタイプは ValueError になるテスト"""
+        data = CONTACT_EVENTS[0].to_dict()
+        data['event_type'] = "NoSuchEvent"
+
+        with pytest.raises(ValueError):
+            DomainEvent.from_dict(data)
@@ -6,6 +6,14 @@ from app.domain.value_objects.email import Email
 from app.domain.value_objects.phone import Phone
 
 
+def _single(cls, raw):
+    """1件ずつ作成した場合の結果（値またはエラーメッセージ）"""
+    try:
+        return cls(raw), None
+    except ValueError as e:
+        return None, str(e)
+
+
 class TestEmail:
     """Email値オブジェクトのテスト"""
     
@@ -53,6 +61,30 @@ class TestEmail:
         
         assert email1 == email2
         assert email1 != email3
+    
+    def test_validate_many_matches_single(self):
+        """一括検証が1件ずつの作成と同じ結果になるテスト"""
+        values = ["Test@Example.com", "invalid-email", "", "a.b+c@sub.example.co.jp", "test@", "x@y.z"]
+        
+        results = Email.validate_many(values)
+        
+        assert [result.index for result in results] == list(range(len(values)))
+        assert [result.raw for result in results] == values
+        assert [(result.value, result.error) for result in results] == [
+            _single(Email, value) for value in values
+        ]
+        assert [result.ok for result in results] == [True, False, False, True, False, False]
+        assert not results.ok
+        assert results.valid() == [Email("test@example.com"), Email("a.b+c@sub.example.co.jp")]
+        assert sorted(results.errors) == [1, 2, 4, 5]
+    
+    def test_validate_many_does_not_raise(self):
+        """文字列以外や None を含んでも例外を送出しないテスト"""
+        results = Email.validate_many([None, 123, "ok@example.com"])
+        
+        assert [result.ok for result in results] == [False, False, True]
+        assert results[0].error == "メールアドレスは必須です"
+        assert results[2].value == Email("ok@example.com")
 
 
 class TestPhone:
@@ -135,4 +167,25 @@ class TestPhone:
         phone3 = Phone.create("080-1234-5678")
         
         assert phone1 == phone2  # 正規化後は同じ
-        assert phone1 != phone3
\ No newline at end of file
+        assert phone1 != phone3
+    
+    def test_normalize_many_matches_single(self):
+        """一括正規化が1件ずつの作成と同じ結果になるテスト"""
+        values = [
+            "090-1234-5678", "(03) 1234-5678", "+81-90-1234-5678", "81 90 1234 5678",
+            "0120-123-456", "0800-123-4567", "050-1234-5678", "123-456-789", "abc-defg-hijk", "",
+        ]
+        
+        results = Phone.normalize_many(values)
+        
+        assert [result.raw for result in results] == values
+        assert [(result.value, result.error) for result in results] == [
+            _single(Phone, value) for value in values
+        ]
+    
+    def test_normalize_many_does_not_raise(self):
+        """文字列以外や None を含んでも例外を送出しないテスト"""
+        results = Phone.normalize_many([None, 9012345678, "09012345678"])
+        
+        assert [result.ok for result in results] == [False, False, True]
+        assert results[2].value.value == "09012345678"
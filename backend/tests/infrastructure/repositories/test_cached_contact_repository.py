@@ -0,0 +1,253 @@
+"""Tests for Cached Contact Repository."""
+
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+import pytest
+
+from app.domain.entities.contact import (
+    Contact,
+    ContactStatus,
+    LessonType,
+    PreferredContact,
+)
+from app.domain.repositories.contact_repository import ContactRepository
+from app.domain.value_objects.email import Email
+from app.infrastructure.metrics import get_metrics_registry
+from app.infrastructure.repositories import cached_contact_repository
+from app.infrastructure.repositories.cached_contact_repository import (
+    CachedContactRepository,
+)
+from app.infrastructure.repositories.sqlalchemy_contact_repository import (
+    SQLAlchemyContactRepository,
+)
+from app.utils.lru_cache import LRUCache
+
+
+class TestCachedContactRepository:
+    """Test cases for Cached Contact Repository."""
+
+    @pytest.fixture
+    def inner(self):
+        """Create the wrapped repository mock."""
+        return AsyncMock(spec=ContactRepository)
+
+    @pytest.fixture
+    def cache(self):
+        """Create the cache instance."""
+        return LRUCache(max_size=10, ttl=60.0)
+
+    @pytest.fixture
+    def repository(self, inner, cache):
+        """Create repository instance for testing."""
+        return CachedContactRepository(inner, cache)
+
+    @pytest.fixture
+    def sample_contact(self):
+        """Create a sample contact for testing."""
+        return Contact(
+            id=uuid4(),
+            name="田中太郎",
+            email=Email("tanaka@example.com"),
+            message="英会話レッスンについて質問があります。",
+            lesson_type=LessonType.TRIAL,
+            preferred_contact=PreferredContact.EMAIL
+        )
+
+    async def test_find_by_id_is_cached(self, repository, inner, cache, sample_contact):
+        """Test that the second lookup is served from the cache."""
+        # Arrange
+        inner.find_by_id.return_value = sample_contact
+
+        # Act
+        first = await repository.find_by_id(sample_contact.id)
+        second = await repository.find_by_id(sample_contact.id)
+
+        # Assert
+        assert first.id == second.id == sample_contact.id
+        inner.find_by_id.assert_called_once_with(sample_contact.id)
+        assert cache.stats.hits == 1
+        assert cache.stats.misses == 1
+
+    async def test_returned_contacts_are_copies(self, repository, inner, sample_contact):
+        """Test that mutating a returned contact does not change the cache."""
+        # Arrange
+        inner.find_by_id.return_value = sample_contact
+        first = await repository.find_by_id(sample_contact.id)
+
+        # Act
+        first.update_status(ContactStatus.COMPLETED)
+        second = await repository.find_by_id(sample_contact.id)
+
+        # Assert
+        assert second.status == ContactStatus.PENDING
+        assert second.get_domain_events() == []
+
+    async def test_not_found_is_cached(self, repository, inner):
+        """Test negative caching of unknown IDs."""
+        # Arrange
+        inner.find_by_id.return_value = None
+        contact_id = uuid4()
+
+        # Act
+        assert await repository.find_by_id(contact_id) is None
+        assert await repository.find_by_id(contact_id) is None
+
+        # Assert
+        inner.find_by_id.assert_called_once_with(contact_id)
+
+    async def test_save_and_delete_invalidate(self, repository, inner, sample_contact):
+        """Test that writes invalidate the cached entry."""
+        # Arrange
+        inner.find_by_id.return_value = sample_contact
+        inner.save.return_value = sample_contact
+        inner.delete.return_value = True
+        await repository.find_by_id(sample_contact.id)
+
+        # Act & Assert
+        await repository.save(sample_contact)
+        await repository.find_by_id(sample_contact.id)
+        assert inner.find_by_id.call_count == 2
+
+        await repository.delete(sample_contact.id)
+        await repository.find_by_id(sample_contact.id)
+        assert inner.find_by_id.call_count == 3
+
+        await repository.save_many([sample_contact])
+        await repository.find_by_id(sample_contact.id)
+        assert inner.find_by_id.call_count == 4
+
+    @pytest.mark.parametrize("write", ["save", "save_many", "delete"])
+    async def test_invalidation_waits_for_commit(self, async_session, inner, cache, sample_contact, write):
+        """Test that a read between the write and the commit cannot keep a stale entry."""
+        # Arrange - the writer's session and a concurrent reader that still sees the old row
+        writer = CachedContactRepository(
+            SQLAlchemyContactRepository(async_session), cache, session=async_session
+        )
+        await writer.save(sample_contact)
+        await async_session.commit()
+        reader = CachedContactRepository(inner, cache)
+        inner.find_by_id.return_value = sample_contact
+
+        # Act - write, let the reader re-cache the pre-commit row, then commit
+        sample_contact.name = "田中花子"
+        if write == "save":
+            await writer.save(sample_contact)
+        elif write == "save_many":
+            await writer.save_many([sample_contact])
+        else:
+            await writer.delete(sample_contact.id)
+        await reader.find_by_id(sample_contact.id)
+        assert cache.get(sample_contact.id)[0]
+        await async_session.commit()
+
+        # Assert
+        hit, _ = cache.get(sample_contact.id)
+        assert not hit
+
+    @pytest.mark.parametrize("lookup", ["find_by_id", "find_by_ids"])
+    async def test_read_started_before_invalidation_is_not_cached(self, inner, cache, sample_contact, lookup):
+        """Test that a load that began before a write's invalidation cannot re-cache the old row."""
+        # Arrange - the write (and its invalidation) lands while the reader is loading the old row
+        repository = CachedContactRepository(inner, cache)
+
+        async def load_during_write(*args):
+            await repository.save(sample_contact)
+            return sample_contact if lookup == "find_by_id" else [sample_contact]
+
+        getattr(inner, lookup).side_effect = load_during_write
+
+        # Act
+        if lookup == "find_by_id":
+            found = [await repository.find_by_id(sample_contact.id)]
+        else:
+            found = await repository.find_by_ids([sample_contact.id])
+
+        # Assert - the caller still gets what it read, but the cache stays empty
+        assert [contact.id for contact in found] == [sample_contact.id]
+        hit, _ = cache.get(sample_contact.id)
+        assert not hit
+
+    async def test_rollback_keeps_cached_entry(self, async_session, inner, cache, sample_contact):
+        """Test that a rolled-back write does not invalidate the committed entry."""
+        # Arrange
+        writer = CachedContactRepository(
+            SQLAlchemyContactRepository(async_session), cache, session=async_session
+        )
+        await writer.save(sample_contact)
+        await async_session.commit()
+        await writer.find_by_id(sample_contact.id)
+
+        # Act
+        await writer.save(sample_contact)
+        await async_session.rollback()
+
+        # Assert
+        hit, cached = cache.get(sample_contact.id)
+        assert hit and cached.id == sample_contact.id
+
+    async def test_find_by_ids_fetches_only_misses(self, repository, inner, sample_contact):
+        """Test that bulk lookups only query uncached IDs."""
+        # Arrange
+        inner.find_by_id.return_value = sample_contact
+        await repository.find_by_id(sample_contact.id)
+        missing_id = uuid4()
+        inner.find_by_ids.return_value = []
+
+        # Act
+        found = await repository.find_by_ids([sample_contact.id, missing_id])
+        found_again = await repository.find_by_ids([sample_contact.id, missing_id])
+
+        # Assert
+        assert [contact.id for contact in found] == [sample_contact.id]
+        assert [contact.id for contact in found_again] == [sample_contact.id]
+        inner.find_by_ids.assert_called_once_with([missing_id])
+
+    async def test_negative_ttl(self, inner):
+        """Test that not-found entries use their own lifetime."""
+        # Arrange
+        now = [0.0]
+        cache = LRUCache(max_size=10, ttl=60.0, clock=lambda: now[0])
+        repository = CachedContactRepository(inner, cache, negative_ttl=1.0)
+        inner.find_by_id.return_value = None
+        contact_id = uuid4()
+
+        # Act
+        await repository.find_by_id(contact_id)
+        now[0] = 2.0
+        await repository.find_by_id(contact_id)
+
+        # Assert
+        assert inner.find_by_id.call_count == 2
+
+    async def test_cache_stats_are_exported(self, inner, sample_contact, monkeypatch):
+        """Test that the shared cache's stats appear in the metrics registry."""
+        # Arrange
+        cache = LRUCache(max_size=1, ttl=60.0)
+        monkeypatch.setattr(cached_contact_repository, "_contact_cache", cache)
+        repository = CachedContactRepository(inner, cache)
+        inner.find_by_id.return_value = sample_contact
+
+        # Act
+        await repository.find_by_id(sample_contact.id)
+        await repository.find_by_id(sample_contact.id)
+        inner.find_by_id.return_value = None
+        await repository.find_by_id(uuid4())
+
+        # Assert
+        registry = get_metrics_registry()
+        assert registry.gauge("contact_cache_hits", "").value() == 1
+        assert registry.gauge("contact_cache_misses", "").value() == 2
+        assert registry.gauge("contact_cache_evictions", "").value() == 1
+        assert registry.gauge("contact_cache_entries", "").value() == 1
+        assert "contact_cache_hits 1" in registry.render()
+
+    async def test_uncached_reads_delegate(self, repository, inner):
+        """Test that other queries pass straight through."""
+        # Arrange
+        inner.count.return_value = 3
+
+        # Act & Assert
+        assert await repository.count() == 3
+        await repository.find_by_email("tanaka@example.com")
+        inner.find_by_email.assert_called_once_with("tanaka@example.com")
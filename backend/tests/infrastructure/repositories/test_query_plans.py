@@ -0,0 +1,233 @@
+"""Query-plan regression tests for SQLAlchemy Contact Repository.
+
+Every SELECT issued by a repository method is re-run under EXPLAIN on a
+large seeded table; the test fails if the plan contains a sequential scan
+of the contacts table. Runs on in-memory SQLite by default, or against
+PostgreSQL when TEST_DATABASE_URL is set.
+"""
+
+import json
+import os
+from contextlib import contextmanager
+from datetime import UTC, datetime, timedelta
+from typing import Iterator, List, Set, Tuple
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import event, text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.domain.entities.contact import (
+    Contact,
+    ContactStatus,
+    LessonType,
+    PreferredContact,
+)
+from app.domain.repositories.contact_repository import ContactFilter
+from app.domain.value_objects.email import Email
+from app.infrastructure.database.models.base import Base
+from app.infrastructure.repositories.sqlalchemy_contact_repository import (
+    SQLAlchemyContactRepository,
+)
+
+SEED_ROWS = 5_000
+
+
+@pytest.fixture
+async def seeded_session(async_session: AsyncSession):
+    """Session on a contacts table seeded with SEED_ROWS rows and analyzed."""
+    database_url = os.getenv("TEST_DATABASE_URL")
+    if not database_url:
+        session = async_session
+        engine = None
+    else:
+        engine = create_async_engine(
+            database_url.replace("postgresql://", "postgresql+asyncpg://")
+        )
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.drop_all)
+            await conn.run_sync(Base.metadata.create_all)
+        session = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)()
+
+    base_time = datetime(2024, 1, 1, tzinfo=UTC)
+    contacts = [
+        Contact(
+            id=uuid4(),
+            name=f"シード{i}",
+            email=Email(f"seed{i}@example.com"),
+            message="クエリプラン検証用",
+            lesson_type=LessonType.GROUP,
+            preferred_contact=PreferredContact.EMAIL,
+            # 未処理は全体の2%程度
+            status=ContactStatus.PENDING if i % 50 == 0 else ContactStatus.COMPLETED,
+            created_at=base_time + timedelta(minutes=i),
+            updated_at=base_time + timedelta(minutes=i),
+        )
+        for i in range(SEED_ROWS)
+    ]
+    await SQLAlchemyContactRepository(session).insert_many(contacts)
+    await session.commit()
+    await session.execute(text("ANALYZE"))
+
+    try:
+        yield session
+    finally:
+        if engine is not None:
+            await session.close()
+            async with engine.begin() as conn:
+                await conn.run_sync(Base.metadata.drop_all)
+            await engine.dispose()
+
+
+@contextmanager
+def explain_selects(session: AsyncSession) -> Iterator[List[Tuple[str, list]]]:
+    """Capture the EXPLAIN output of every SELECT executed in the block."""
+    plans: List[Tuple[str, list]] = []
+    engine = session.get_bind()
+    prefix = (
+        "EXPLAIN QUERY PLAN "
+        if engine.dialect.name == "sqlite"
+        else "EXPLAIN (FORMAT JSON) "
+    )
+
+    def explain(conn, cursor, statement, parameters, context, executemany):
+        if not statement.lstrip().upper().startswith("SELECT"):
+            return
+        explain_cursor = conn.connection.dbapi_connection.cursor()
+        explain_cursor.execute(prefix + statement, parameters)
+        plans.append((statement, explain_cursor.fetchall()))
+        explain_cursor.close()
+
+    event.listen(engine, "before_cursor_execute", explain)
+    try:
+        yield plans
+    finally:
+        event.remove(engine, "before_cursor_execute", explain)
+
+
+def seq_scans(dialect_name: str, plan: list) -> List[str]:
+    """Return descriptions of sequential scans over contacts in a plan."""
+    if dialect_name == "postgresql":
+        # EXPLAIN (FORMAT JSON): asyncpg returns the document as text
+        document = plan[0][0]
+        if isinstance(document, str):
+            document = json.loads(document)
+        found = []
+        nodes = [document[0]["Plan"]]
+        while nodes:
+            node = nodes.pop()
+            if node["Node Type"] == "Seq Scan" and node.get("Relation Name") == "contacts":
+                found.append(f"Seq Scan on {node['Relation Name']}")
+            nodes.extend(node.get("Plans", []))
+        return found
+    # SQLite: EXPLAIN QUERY PLAN rows are (id, parent, notused, detail)
+    return [
+        row[3] for row in plan
+        if row[3].startswith("SCAN contacts") and "INDEX" not in row[3]
+    ]
+
+
+def scanned(dialect_name: str, plan: list) -> Tuple[Set[str], Set[str]]:
+    """Return the relations and the indexes a plan reads."""
+    relations: Set[str] = set()
+    indexes: Set[str] = set()
+    if dialect_name == "postgresql":
+        document = plan[0][0]
+        if isinstance(document, str):
+            document = json.loads(document)
+        nodes = [document[0]["Plan"]]
+        while nodes:
+            node = nodes.pop()
+            if "Relation Name" in node:
+                relations.add(node["Relation Name"])
+            if "Index Name" in node:
+                indexes.add(node["Index Name"])
+            nodes.extend(node.get("Plans", []))
+        return relations, indexes
+    # SQLite: "SCAN t", "SEARCH t USING INDEX i (...)", "SCAN t USING COVERING INDEX i"
+    for row in plan:
+        words = row[3].split()
+        if words[0] in ("SCAN", "SEARCH"):
+            relations.add(words[1])
+            if "INDEX" in words:
+                indexes.add(words[words.index("INDEX") + 1])
+    return relations, indexes
+
+
+class TestContactQueryPlans:
+    """Every repository read must be served by an index."""
+
+    @pytest.fixture
+    def repository(self, seeded_session):
+        """Create repository instance on the seeded table."""
+        return SQLAlchemyContactRepository(seeded_session)
+
+    async def assert_indexed(self, session, call):
+        """Run the repository call and fail on any seq scan of contacts."""
+        with explain_selects(session) as plans:
+            await call()
+        assert plans, "repository call issued no SELECT"
+        dialect_name = session.get_bind().dialect.name
+        for statement, plan in plans:
+            assert not seq_scans(dialect_name, plan), f"sequential scan for: {statement}\n{plan}"
+
+    async def test_find_by_id(self, repository, seeded_session):
+        """find_by_id uses the primary key."""
+        await self.assert_indexed(seeded_session, lambda: repository.find_by_id(uuid4()))
+
+    async def test_find_by_ids(self, repository, seeded_session):
+        """find_by_ids probes the primary key for each ID."""
+        await self.assert_indexed(
+            seeded_session, lambda: repository.find_by_ids([uuid4() for _ in range(10)])
+        )
+
+    async def test_find_by_email(self, repository, seeded_session):
+        """find_by_email uses ix_contacts_email."""
+        await self.assert_indexed(
+            seeded_session, lambda: repository.find_by_email("seed12345@example.com")
+        )
+
+    async def test_find_all(self, repository, seeded_session):
+        """find_all walks the created_at index."""
+        await self.assert_indexed(seeded_session, lambda: repository.find_all(limit=20))
+
+    async def test_find_page_deep(self, repository, seeded_session):
+        """find_page seeks into ix_contacts_created_at_id."""
+        after = (datetime(2024, 1, 5, tzinfo=UTC), uuid4())
+        await self.assert_indexed(
+            seeded_session, lambda: repository.find_page(after=after, limit=20)
+        )
+
+    async def test_iter_all_by_status(self, repository, seeded_session):
+        """iter_all with a status filter seeks into ix_contacts_status_created_at."""
+        async def stream_pending():
+            stream = repository.iter_all(
+                batch_size=20, filters=ContactFilter(status=ContactStatus.PENDING)
+            )
+            await anext(stream)
+            await stream.aclose()
+
+        with explain_selects(seeded_session) as plans:
+            await stream_pending()
+        dialect_name = seeded_session.get_bind().dialect.name
+        [(statement, plan)] = plans
+        # the status is bound as a parameter, as the repository always issues it
+        assert "pending" not in statement
+        assert not seq_scans(dialect_name, plan), f"sequential scan for: {statement}\n{plan}"
+        _, indexes = scanned(dialect_name, plan)
+        assert "ix_contacts_status_created_at" in indexes, plan
+
+    async def test_count_by_reads_counters_only(self, repository, seeded_session):
+        """count_by sums contact_counts and never reads contacts."""
+        with explain_selects(seeded_session) as plans:
+            await repository.count_by(status=ContactStatus.PENDING)
+            await repository.count_by(lesson_type=LessonType.GROUP)
+        dialect_name = seeded_session.get_bind().dialect.name
+        assert len(plans) == 2
+        for statement, plan in plans:
+            relations, _ = scanned(dialect_name, plan)
+            assert relations == {"contact_counts"}, f"{statement}\n{plan}"
+
+    async def test_delete_lookup(self, repository, seeded_session):
+        """delete looks the row up by primary key."""
+        await self.assert_indexed(seeded_session, lambda: repository.delete(uuid4()))
@@ -1,16 +1,27 @@
 """Tests for SQLAlchemy Contact Repository."""
 
-import pytest
-from uuid import uuid4
 from datetime import datetime
+from uuid import uuid4
 
+import pytest
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.domain.entities.contact import Contact, ContactStatus, LessonType, PreferredContact
+from app.domain.entities.contact import (
+    Contact,
+    ContactStatus,
+    LessonType,
+    PreferredContact,
+)
+from app.domain.repositories.contact_repository import ContactFilter, CountMode
 from app.domain.value_objects.email import Email
 from app.domain.value_objects.phone import Phone
-from app.infrastructure.repositories.sqlalchemy_contact_repository import SQLAlchemyContactRepository
 from app.infrastructure.database.models.contact import ContactModel
+from app.infrastructure.repositories.sqlalchemy_contact_repository import (
+    HydrationMode,
+    SaveMode,
+    SQLAlchemyContactRepository,
+)
 
 
 class TestSQLAlchemyContactRepository:
@@ -101,6 +112,61 @@ class TestSQLAlchemyContactRepository:
         # Assert
         assert found_contact is None
 
+    async def test_find_by_id_restores_processing_fields(self, repository, sample_contact, async_session):
+        """Test that processed_* columns survive a round trip."""
+        sample_contact.process("管理者", "対応済み")
+        await repository.save(sample_contact)
+        await async_session.commit()
+
+        found_contact = await repository.find_by_id(sample_contact.id)
+
+        assert found_contact.is_completed()
+        assert found_contact.processed_by == "管理者"
+        assert found_contact.processing_notes == "対応済み"
+        assert found_contact.processed_at is not None
+        assert found_contact.get_domain_events() == []
+
+    async def test_trusted_hydration_skips_validation(self, async_session):
+        """Test that TRUSTED reads stored values as-is and STRICT rejects invalid rows."""
+        contact_id = uuid4()
+        async_session.add(ContactModel(
+            id=contact_id,
+            name="監査対象",
+            email="not-an-email",
+            phone="12345",
+            message="不正なデータです。",
+            lesson_type="group",
+            preferred_contact="line",
+            status="processing",
+        ))
+        await async_session.commit()
+
+        trusted = await SQLAlchemyContactRepository(async_session).find_by_id(contact_id)
+
+        assert trusted.email.value == "not-an-email"
+        assert trusted.phone.value == "12345"
+        assert trusted.lesson_type is LessonType.GROUP
+        assert trusted.preferred_contact is PreferredContact.LINE
+        assert trusted.status is ContactStatus.PROCESSING
+
+        strict = SQLAlchemyContactRepository(async_session, hydration=HydrationMode.STRICT)
+        with pytest.raises(ValueError):
+            await strict.find_by_id(contact_id)
+
+    async def test_trusted_hydration_matches_strict(self, repository, sample_contact, async_session):
+        """Test that both hydration modes build equal entities from valid rows."""
+        await repository.save(sample_contact)
+        await async_session.commit()
+        async_session.expunge_all()
+
+        trusted = await repository.find_by_id(sample_contact.id)
+        async_session.expunge_all()
+        strict = await SQLAlchemyContactRepository(
+            async_session, hydration=HydrationMode.STRICT
+        ).find_by_id(sample_contact.id)
+
+        assert trusted == strict
+
     async def test_find_by_email_existing(self, repository, sample_contact, async_session):
         """Test finding an existing contact by email."""
         # Arrange
@@ -217,4 +283,333 @@ class TestSQLAlchemyContactRepository:
 
         # Verify in database
         db_contact = await async_session.get(ContactModel, contact.id)
-        assert db_contact.phone is None
\ No newline at end of file
+        assert db_contact.phone is None
+
+    async def test_save_issues_single_statement(self, repository, sample_contact, async_session):
+        """Test that insert and update each cost exactly one statement."""
+        # Arrange
+        statements = []
+        engine = async_session.get_bind()
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        event.listen(engine, "before_cursor_execute", record)
+        try:
+            # Act - insert
+            await repository.save(sample_contact)
+            inserted = len(statements)
+
+            # Act - update
+            sample_contact.update_status(ContactStatus.PROCESSING)
+            updated_contact = await repository.save(sample_contact)
+        finally:
+            event.remove(engine, "before_cursor_execute", record)
+
+        # Assert
+        assert inserted == 1
+        assert len(statements) == 2
+        assert all("ON CONFLICT" in statement for statement in statements)
+        assert updated_contact.status == ContactStatus.PROCESSING
+
+    async def test_save_upsert_refreshes_loaded_instance(self, repository, sample_contact, async_session):
+        """Test that upsert updates an instance already in the identity map."""
+        # Arrange
+        await repository.save(sample_contact)
+        await async_session.commit()
+        loaded = await async_session.get(ContactModel, sample_contact.id)
+
+        # Act
+        sample_contact.name = "田中花子"
+        await repository.save(sample_contact)
+
+        # Assert
+        assert loaded.name == "田中花子"
+
+    async def test_save_legacy_mode(self, async_session, sample_contact):
+        """Test saving with the legacy get/flush/refresh mode."""
+        # Arrange
+        repository = SQLAlchemyContactRepository(async_session, save_mode=SaveMode.LEGACY)
+        await repository.save(sample_contact)
+        await async_session.commit()
+        sample_contact.name = "田中花子"
+
+        # Act
+        updated_contact = await repository.save(sample_contact)
+        await async_session.commit()
+
+        # Assert
+        assert updated_contact.name == "田中花子"
+        db_contact = await async_session.get(ContactModel, sample_contact.id)
+        assert db_contact.name == "田中花子"
+
+    async def test_save_many_inserts_and_updates(self, async_session):
+        """Test bulk saving new and existing contacts in chunks."""
+        # Arrange
+        repository = SQLAlchemyContactRepository(async_session, chunk_size=2)
+        contacts = [
+            Contact(
+                id=uuid4(),
+                name=f"一括ユーザー{i}",
+                email=Email(f"bulk{i}@example.com"),
+                message="一括登録テスト",
+                lesson_type=LessonType.GROUP,
+                preferred_contact=PreferredContact.EMAIL
+            )
+            for i in range(5)
+        ]
+        await repository.save(contacts[0])
+        contacts[0].name = "更新済みユーザー"
+
+        # Act
+        written = await repository.save_many(iter(contacts))
+        await async_session.commit()
+
+        # Assert
+        assert written == 5
+        assert await repository.count() == 5
+        found_contact = await repository.find_by_email("bulk0@example.com")
+        assert found_contact.name == "更新済みユーザー"
+
+    async def test_save_many_empty(self, repository):
+        """Test bulk saving no contacts."""
+        assert await repository.save_many([]) == 0
+
+    async def test_insert_many(self, repository, async_session):
+        """Test bulk inserting new contacts."""
+        # Arrange
+        contacts = [
+            Contact(
+                id=uuid4(),
+                name=f"インポート{i}",
+                email=Email(f"import{i}@example.com"),
+                phone=Phone("03-1234-5678"),
+                message="CSVインポート",
+                lesson_type=LessonType.ONLINE,
+                preferred_contact=PreferredContact.PHONE
+            )
+            for i in range(3)
+        ]
+
+        # Act
+        written = await repository.insert_many(contacts, chunk_size=2)
+        await async_session.commit()
+
+        # Assert
+        assert written == 3
+        found_contact = await repository.find_by_id(contacts[2].id)
+        assert found_contact.phone.value == "0312345678"
+        assert found_contact.lesson_type == LessonType.ONLINE
+
+    def test_invalid_chunk_size(self, async_session):
+        """Test that a non-positive chunk size is rejected."""
+        with pytest.raises(ValueError):
+            SQLAlchemyContactRepository(async_session, chunk_size=0)
+
+    @pytest.mark.parametrize("method", ["save_many", "insert_many"])
+    async def test_explicit_zero_chunk_size_is_rejected(self, repository, sample_contact, method):
+        """Test that chunk_size=0 is rejected instead of using the default."""
+        with pytest.raises(ValueError):
+            await getattr(repository, method)([sample_contact], chunk_size=0)
+
+    async def test_find_page_walks_all_contacts(self, repository, async_session):
+        """Test keyset pagination visits every contact once in order."""
+        # Arrange - identical created_at forces the id tie-breaker
+        created_at = datetime(2024, 1, 1, 10, 0, 0)
+        contacts = [
+            Contact(
+                id=uuid4(),
+                name=f"ページ{i}",
+                email=Email(f"page{i}@example.com"),
+                message="ページネーションテスト",
+                lesson_type=LessonType.GROUP,
+                preferred_contact=PreferredContact.EMAIL,
+                created_at=created_at if i < 3 else datetime(2024, 1, 2, 10, 0, 0)
+            )
+            for i in range(5)
+        ]
+        await repository.save_many(contacts)
+        await async_session.commit()
+
+        # Act
+        seen = []
+        page = await repository.find_page(limit=2)
+        seen.extend(page.items)
+        while page.has_next:
+            page = await repository.find_page(after=page.next_key, limit=2)
+            seen.extend(page.items)
+
+        # Assert
+        assert len(seen) == 5
+        assert {contact.id for contact in seen} == {contact.id for contact in contacts}
+        keys = [(contact.created_at, str(contact.id)) for contact in seen]
+        assert keys == sorted(keys, reverse=True)
+
+    async def test_find_page_last_page_has_no_next(self, repository, sample_contact, async_session):
+        """Test that an exactly filled last page has no next key."""
+        # Arrange
+        await repository.save(sample_contact)
+        await async_session.commit()
+
+        # Act
+        page = await repository.find_page(limit=1)
+
+        # Assert
+        assert len(page.items) == 1
+        assert page.next_key is None
+        assert not page.has_next
+
+    async def test_find_by_ids(self, repository, async_session):
+        """Test finding several contacts with one query."""
+        # Arrange
+        contacts = [
+            Contact(
+                id=uuid4(),
+                name=f"一括取得{i}",
+                email=Email(f"ids{i}@example.com"),
+                message="一括取得テスト",
+                lesson_type=LessonType.GROUP,
+                preferred_contact=PreferredContact.EMAIL
+            )
+            for i in range(3)
+        ]
+        await repository.save_many(contacts)
+        await async_session.commit()
+        async_session.expunge_all()
+
+        statements = []
+        engine = async_session.get_bind()
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        # Act
+        event.listen(engine, "before_cursor_execute", record)
+        try:
+            found_contacts = await repository.find_by_ids(
+                [contacts[0].id, contacts[2].id, contacts[0].id, uuid4()]
+            )
+        finally:
+            event.remove(engine, "before_cursor_execute", record)
+
+        # Assert
+        assert len(statements) == 1
+        assert {contact.id for contact in found_contacts} == {contacts[0].id, contacts[2].id}
+
+    async def test_find_by_ids_empty(self, repository):
+        """Test finding contacts with no IDs."""
+        assert await repository.find_by_ids([]) == []
+
+    async def test_iter_all_streams_in_batches(self, repository, async_session):
+        """Test streaming contacts with a filter and a small batch size."""
+        # Arrange
+        contacts = [
+            Contact(
+                id=uuid4(),
+                name=f"ストリーム{i}",
+                email=Email(f"stream{i}@example.com"),
+                message="ストリームテスト",
+                lesson_type=LessonType.GROUP,
+                preferred_contact=PreferredContact.EMAIL,
+                status=ContactStatus.PENDING if i % 2 else ContactStatus.COMPLETED
+            )
+            for i in range(7)
+        ]
+        await repository.save_many(contacts)
+        await async_session.commit()
+
+        # Act
+        streamed = [contact async for contact in repository.iter_all(batch_size=2)]
+        pending = [
+            contact
+            async for contact in repository.iter_all(
+                batch_size=2, filters=ContactFilter(status=ContactStatus.PENDING)
+            )
+        ]
+
+        # Assert
+        assert {contact.id for contact in streamed} == {contact.id for contact in contacts}
+        assert len(pending) == 3
+        assert all(contact.is_pending() for contact in pending)
+
+    async def test_iter_all_can_stop_early(self, repository, async_session):
+        """Test that an abandoned stream releases the session."""
+        # Arrange
+        for i in range(3):
+            await repository.save(
+                Contact(
+                    id=uuid4(),
+                    name=f"中断{i}",
+                    email=Email(f"stop{i}@example.com"),
+                    message="中断テスト",
+                    lesson_type=LessonType.GROUP,
+                    preferred_contact=PreferredContact.EMAIL
+                )
+            )
+        await async_session.commit()
+
+        # Act
+        stream = repository.iter_all(batch_size=1)
+        first = await anext(stream)
+        await stream.aclose()
+
+        # Assert
+        assert first is not None
+        assert await repository.count() == 3
+
+    async def test_count_by_follows_writes(self, repository, async_session):
+        """Test that counters follow inserts, status changes and deletes."""
+        # Arrange
+        contacts = [
+            Contact(
+                id=uuid4(),
+                name=f"集計{i}",
+                email=Email(f"tally{i}@example.com"),
+                message="集計テスト",
+                lesson_type=LessonType.TRIAL if i < 3 else LessonType.ONLINE,
+                preferred_contact=PreferredContact.EMAIL
+            )
+            for i in range(5)
+        ]
+        await repository.save_many(contacts)
+
+        # Act
+        contacts[0].update_status(ContactStatus.COMPLETED)
+        await repository.save(contacts[0])
+        await repository.save(contacts[1])  # 変更なしの再保存
+        await repository.delete(contacts[4].id)
+        await async_session.commit()
+
+        # Assert
+        assert await repository.count() == 4
+        assert await repository.count_by(status=ContactStatus.PENDING) == 3
+        assert await repository.count_by(status=ContactStatus.COMPLETED) == 1
+        assert await repository.count_by(lesson_type=LessonType.TRIAL) == 3
+        assert await repository.count_by(
+            status=ContactStatus.PENDING, lesson_type=LessonType.TRIAL
+        ) == 2
+        assert await repository.count_by(status=ContactStatus.CANCELLED) == 0
+
+    async def test_count_by_matches_table_after_legacy_save(self, async_session, sample_contact):
+        """Test that counters also follow ORM flushes of the legacy save."""
+        # Arrange
+        repository = SQLAlchemyContactRepository(async_session, save_mode=SaveMode.LEGACY)
+
+        # Act
+        await repository.save(sample_contact)
+        sample_contact.update_status(ContactStatus.CANCELLED)
+        await repository.save(sample_contact)
+        await async_session.commit()
+
+        # Assert
+        assert await repository.count_by(status=ContactStatus.PENDING) == 0
+        assert await repository.count_by(status=ContactStatus.CANCELLED) == 1
+
+    async def test_count_estimated_falls_back_to_exact(self, repository, sample_contact, async_session):
+        """Test that the estimated count is exact where no estimate exists."""
+        # Arrange
+        await repository.save(sample_contact)
+        await async_session.commit()
+
+        # Act & Assert
+        assert await repository.count(mode=CountMode.ESTIMATED) == 1
@@ -0,0 +1,92 @@
+"""問い合わせ件数カウンターの集約のテスト"""
+
+from uuid import uuid4
+
+from sqlalchemy import func, select
+
+from app.domain.entities.contact import (
+    Contact,
+    ContactStatus,
+    LessonType,
+    PreferredContact,
+)
+from app.domain.value_objects.email import Email
+from app.infrastructure.database.contact_counts import ContactCountCompactor
+from app.infrastructure.database.models.contact_count import ContactCountModel
+from app.infrastructure.repositories.sqlalchemy_contact_repository import (
+    SQLAlchemyContactRepository,
+)
+
+
+def make_contacts(count: int, lesson_type: LessonType = LessonType.GROUP):
+    """テスト用の問い合わせを作成"""
+    return [
+        Contact(
+            id=uuid4(),
+            name=f"集約{i}",
+            email=Email(f"compact{i}@example.com"),
+            message="集約テスト",
+            lesson_type=lesson_type,
+            preferred_contact=PreferredContact.EMAIL
+        )
+        for i in range(count)
+    ]
+
+
+async def count_rows(session) -> int:
+    """contact_counts の行数"""
+    return await session.scalar(select(func.count()).select_from(ContactCountModel))
+
+
+class TestContactCountCompactor:
+    """ContactCountCompactorのテスト"""
+
+    async def test_writes_append_delta_rows(self, async_session):
+        """問い合わせの書き込みごとにカウンターの行を更新せず増減の行を追加するテスト"""
+        repository = SQLAlchemyContactRepository(async_session)
+        contacts = make_contacts(3)
+        await repository.save_many(contacts)
+        contacts[0].update_status(ContactStatus.COMPLETED)
+        await repository.save(contacts[0])
+        await async_session.commit()
+
+        # 挿入3行 + ステータス変更の -1/+1
+        assert await count_rows(async_session) == 5
+        assert await repository.count_by(status=ContactStatus.PENDING) == 2
+        assert await repository.count_by(status=ContactStatus.COMPLETED) == 1
+
+    async def test_compaction_keeps_counts(self, async_session):
+        """集約後は1キー1行になり、件数は変わらないテスト"""
+        repository = SQLAlchemyContactRepository(async_session)
+        group, trial = make_contacts(3), make_contacts(2, LessonType.TRIAL)
+        await repository.save_many(group + trial)
+        await repository.delete(trial[0].id)
+        await repository.delete(trial[1].id)
+        await async_session.commit()
+        compactor = ContactCountCompactor(async_session.bind)
+
+        assert await compactor.compact_once() == 7
+
+        # 合計が0になったキーの行は残さない
+        assert await count_rows(async_session) == 1
+        assert await repository.count() == 3
+        assert await repository.count_by(lesson_type=LessonType.GROUP) == 3
+        assert await repository.count_by(lesson_type=LessonType.TRIAL) == 0
+
+        await repository.save_many(make_contacts(1))
+        await async_session.commit()
+        assert await compactor.compact_once() == 2
+        assert await count_rows(async_session) == 1
+        assert await repository.count() == 4
+
+    async def test_worker_compacts_and_stops(self, async_session):
+        """起動したワーカーが集約し、stop で停止するテスト"""
+        await SQLAlchemyContactRepository(async_session).save_many(make_contacts(2))
+        await async_session.commit()
+        compactor = ContactCountCompactor(async_session.bind, interval=60.0)
+
+        await compactor.start()
+        await compactor.stop()
+
+        assert not compactor.running
+        assert await count_rows(async_session) == 1
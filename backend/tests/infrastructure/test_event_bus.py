@@ -1,11 +1,17 @@
 """イベントバスのテスト"""
 
-import pytest
+import asyncio
 from unittest.mock import AsyncMock
 
-from app.domain.events.contact_events import ContactCreated
-from app.infrastructure.event_bus.in_memory_event_bus import InMemoryEventBus
+import pytest
+
+from app.domain.events.base import DomainEvent
+from app.domain.events.contact_events import ContactCreated, ContactUpdated
 from app.infrastructure.event_bus.handlers import EventHandler
+from app.infrastructure.event_bus.in_memory_event_bus import (
+    DispatchMode,
+    InMemoryEventBus,
+)
 
 
 class MockEventHandler(EventHandler):
@@ -20,6 +26,33 @@ class MockEventHandler(EventHandler):
         return self._event_type
 
 
+class RecordingHandler(EventHandler):
+    """呼び出しを記録するテスト用ハンドラー"""
+    
+    def __init__(self, delay: float = 0.0, error: Exception | None = None, tracker: dict | None = None):
+        self.delay = delay
+        self.error = error
+        self.tracker = tracker
+        self.handled = []
+    
+    async def handle(self, event):
+        if self.tracker is not None:
+            self.tracker["running"] += 1
+            self.tracker["peak"] = max(self.tracker["peak"], self.tracker["running"])
+        try:
+            await asyncio.sleep(self.delay)
+            if self.error:
+                raise self.error
+            self.handled.append(event)
+        finally:
+            if self.tracker is not None:
+                self.tracker["running"] -= 1
+    
+    @property
+    def event_type(self):
+        return ContactCreated
+
+
 class TestInMemoryEventBus:
     """InMemoryEventBusのテスト"""
     
@@ -143,4 +176,306 @@ class TestInMemoryEventBus:
         event_bus.subscribe(ContactCreated, mock_handler)
         event_types = event_bus.get_registered_event_types()
         assert len(event_types) == 1
-        assert ContactCreated in event_types
\ No newline at end of file
+        assert ContactCreated in event_types
+
+
+class TestConcurrentDispatch:
+    """CONCURRENT モードのテスト"""
+    
+    @pytest.fixture
+    def sample_event(self):
+        """サンプルイベントのフィクスチャ"""
+        return ContactCreated(
+            contact_id="12345678-1234-1234-1234-123456789012",
+            name="テスト太郎",
+            email="test@example.com",
+            phone=None,
+            message="テストメッセージ",
+            lesson_type="group",
+            preferred_contact="email"
+        )
+    
+    async def test_handlers_run_concurrently(self, sample_event):
+        """先に登録したハンドラーが後のハンドラーを待てるテスト（逐次実行ではデッドロック）"""
+        released = asyncio.Event()
+        
+        class WaitingHandler(RecordingHandler):
+            async def handle(self, event):
+                await released.wait()
+                self.handled.append(event)
+        
+        class ReleasingHandler(RecordingHandler):
+            async def handle(self, event):
+                released.set()
+                self.handled.append(event)
+        
+        waiting, releasing = WaitingHandler(), ReleasingHandler()
+        event_bus = InMemoryEventBus(mode=DispatchMode.CONCURRENT)
+        event_bus.subscribe(ContactCreated, waiting)
+        event_bus.subscribe(ContactCreated, releasing)
+        
+        await asyncio.wait_for(event_bus.publish(sample_event), timeout=1)
+        
+        assert waiting.handled == [sample_event]
+        assert releasing.handled == [sample_event]
+    
+    async def test_error_is_isolated(self, sample_event):
+        """1つのハンドラーの例外がほかのハンドラーを中断しないテスト"""
+        failing = RecordingHandler(error=RuntimeError("Handler error"))
+        slow = RecordingHandler(delay=0.05)
+        event_bus = InMemoryEventBus(mode=DispatchMode.CONCURRENT)
+        event_bus.subscribe(ContactCreated, failing)
+        event_bus.subscribe(ContactCreated, slow)
+        
+        await event_bus.publish(sample_event)
+        
+        assert failing.handled == []
+        assert slow.handled == [sample_event]
+    
+    @pytest.mark.parametrize("mode", list(DispatchMode))
+    async def test_handler_timeout(self, mode, sample_event):
+        """タイムアウトしたハンドラーを打ち切り、ほかのハンドラーは処理されるテスト"""
+        stuck = RecordingHandler(delay=10)
+        working = RecordingHandler()
+        event_bus = InMemoryEventBus(mode=mode, handler_timeout=0.05)
+        event_bus.subscribe(ContactCreated, stuck)
+        event_bus.subscribe(ContactCreated, working)
+        
+        await asyncio.wait_for(event_bus.publish(sample_event), timeout=1)
+        
+        assert stuck.handled == []
+        assert working.handled == [sample_event]
+    
+    async def test_max_concurrency(self, sample_event):
+        """同時に実行するハンドラー数が上限を超えないテスト"""
+        tracker = {"running": 0, "peak": 0}
+        handlers = [RecordingHandler(delay=0.01, tracker=tracker) for _ in range(5)]
+        event_bus = InMemoryEventBus(mode=DispatchMode.CONCURRENT, max_concurrency=2)
+        for handler in handlers:
+            event_bus.subscribe(ContactCreated, handler)
+        
+        await asyncio.gather(event_bus.publish(sample_event), event_bus.publish(sample_event))
+        
+        assert tracker["peak"] == 2
+        assert all(len(handler.handled) == 2 for handler in handlers)
+
+
+class TestTypeHierarchySubscription:
+    """祖先クラスへの登録のテスト"""
+    
+    @pytest.fixture
+    def created_event(self):
+        """ContactCreated イベントのフィクスチャ"""
+        return ContactCreated(
+            contact_id="12345678-1234-1234-1234-123456789012",
+            name="テスト太郎",
+            email="test@example.com",
+            phone=None,
+            message="テストメッセージ",
+            lesson_type="group",
+            preferred_contact="email"
+        )
+    
+    @pytest.fixture
+    def updated_event(self):
+        """ContactUpdated イベントのフィクスチャ"""
+        return ContactUpdated(
+            contact_id="12345678-1234-1234-1234-123456789012",
+            updated_fields={"status": "processing"}
+        )
+    
+    async def test_base_class_handler_receives_all_events(self, created_event, updated_event):
+        """DomainEvent に登録したハンドラーがすべてのイベントを受け取るテスト"""
+        audit = RecordingHandler()
+        specific = RecordingHandler()
+        event_bus = InMemoryEventBus()
+        event_bus.subscribe(DomainEvent, audit)
+        event_bus.subscribe(ContactCreated, specific)
+        
+        await event_bus.publish(created_event)
+        await event_bus.publish(updated_event)
+        
+        assert audit.handled == [created_event, updated_event]
+        assert specific.handled == [created_event]
+    
+    def test_resolution_order_and_deduplication(self):
+        """具体的なクラスのハンドラーが先に並び、重複登録は1回にまとめるテスト"""
+        audit, specific, both = RecordingHandler(), RecordingHandler(), RecordingHandler()
+        event_bus = InMemoryEventBus()
+        event_bus.subscribe(DomainEvent, audit)
+        event_bus.subscribe(DomainEvent, both)
+        event_bus.subscribe(ContactCreated, specific)
+        event_bus.subscribe(ContactCreated, both)
+        
+        assert event_bus.resolve_handlers(ContactCreated) == (specific, both, audit)
+        assert event_bus.get_handlers(ContactCreated) == [specific, both]
+    
+    async def test_publish_many_keeps_order_across_types(self, created_event, updated_event):
+        """publish_many の種類が混在したイベントを1件ずつのハンドラーに発生順に渡すテスト"""
+        audit = RecordingHandler()
+        batch = BatchRecordingHandler(batch_window=10)
+        event_bus = InMemoryEventBus()
+        event_bus.subscribe(DomainEvent, audit)
+        event_bus.subscribe(DomainEvent, batch)
+        events = [created_event, updated_event, created_event, updated_event]
+        
+        await event_bus.publish_many(events)
+        await event_bus.stop()
+        
+        assert audit.handled == events
+        assert batch.batches == [events]
+    
+    async def test_dispatch_table_is_invalidated(self, created_event):
+        """登録・解除のたびに配信先が作り直されるテスト"""
+        first, second = RecordingHandler(), RecordingHandler()
+        event_bus = InMemoryEventBus()
+        event_bus.subscribe(ContactCreated, first)
+        await event_bus.publish(created_event)
+        
+        event_bus.subscribe(DomainEvent, second)
+        await event_bus.publish(created_event)
+        event_bus.unsubscribe(ContactCreated, first)
+        await event_bus.publish(created_event)
+        event_bus.clear_handlers()
+        await event_bus.publish(created_event)
+        
+        assert first.handled == [created_event, created_event]
+        assert second.handled == [created_event, created_event]
+
+
+class BatchRecordingHandler(RecordingHandler):
+    """handle_batch の呼び出しを記録するテスト用ハンドラー"""
+    
+    def __init__(self, max_batch_size: int = 100, batch_window: float = 0.01, **kwargs):
+        super().__init__(**kwargs)
+        self.max_batch_size = max_batch_size
+        self.batch_window = batch_window
+        self.batches = []
+        self.flushed = asyncio.Event()
+    
+    async def handle_batch(self, events):
+        self.batches.append(list(events))
+        self.flushed.set()
+        if self.error:
+            raise self.error
+
+
+class SlowBatchHandler(BatchRecordingHandler):
+    """release がセットされるまで handle_batch を終えず、同時実行数を記録するテスト用ハンドラー"""
+    
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.started = asyncio.Event()
+        self.release = asyncio.Event()
+        self.active = 0
+        self.peak = 0
+    
+    async def handle_batch(self, events):
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        self.started.set()
+        try:
+            await self.release.wait()
+            await super().handle_batch(events)
+        finally:
+            self.active -= 1
+
+
+class TestBatchHandlers:
+    """バッチ対応ハンドラーのテスト"""
+    
+    @staticmethod
+    def make_events(count: int):
+        """ContactCreated イベントを生成"""
+        return [
+            ContactCreated(
+                contact_id="12345678-1234-1234-1234-123456789012",
+                name=f"テスト{i}",
+                email="test@example.com",
+                phone=None,
+                message="テストメッセージ",
+                lesson_type="group",
+                preferred_contact="email"
+            )
+            for i in range(count)
+        ]
+    
+    def test_supports_batch(self):
+        """handle_batch をオーバーライドしたハンドラーだけがバッチ対応になるテスト"""
+        assert BatchRecordingHandler().supports_batch
+        assert not RecordingHandler().supports_batch
+    
+    async def test_publish_many_splits_by_size(self):
+        """publish_many のイベントを max_batch_size 件ごとに渡し、1件ずつのハンドラーは変わらないテスト"""
+        batch = BatchRecordingHandler(max_batch_size=2, batch_window=10)
+        single = RecordingHandler()
+        event_bus = InMemoryEventBus()
+        event_bus.subscribe(ContactCreated, batch)
+        event_bus.subscribe(ContactCreated, single)
+        events = self.make_events(5)
+        
+        await event_bus.publish_many(events)
+        
+        assert single.handled == events
+        assert batch.batches == [events[0:2], events[2:4]]
+        
+        await event_bus.stop()
+        assert batch.batches[-1] == events[4:]
+    
+    async def test_publish_is_flushed_after_window(self):
+        """1件ずつ配信したイベントを時間経過後にまとめて渡すテスト"""
+        batch = BatchRecordingHandler(batch_window=0.01)
+        event_bus = InMemoryEventBus()
+        event_bus.subscribe(DomainEvent, batch)
+        events = self.make_events(3)
+        
+        for event in events:
+            await event_bus.publish(event)
+        assert batch.batches == []
+        
+        await asyncio.wait_for(batch.flushed.wait(), timeout=1)
+        assert batch.batches == [events]
+    
+    @pytest.mark.parametrize("mode", list(DispatchMode))
+    async def test_batch_error_is_isolated(self, mode):
+        """handle_batch の例外がほかのハンドラーを中断しないテスト"""
+        failing = BatchRecordingHandler(max_batch_size=2, error=RuntimeError("batch error"))
+        working = BatchRecordingHandler(max_batch_size=2)
+        event_bus = InMemoryEventBus(mode=mode)
+        event_bus.subscribe(ContactCreated, failing)
+        event_bus.subscribe(ContactCreated, working)
+        events = self.make_events(2)
+        
+        await event_bus.publish_many(events)
+        
+        assert failing.batches == [events]
+        assert working.batches == [events]
+    
+    async def test_publish_during_slow_batch(self):
+        """handle_batch の処理中に配信したイベントも、同時に呼び出さずにすべて渡すテスト"""
+        batch = SlowBatchHandler(max_batch_size=2, batch_window=0.01)
+        event_bus = InMemoryEventBus()
+        event_bus.subscribe(ContactCreated, batch)
+        events = self.make_events(5)
+        
+        await event_bus.publish(events[0])
+        await asyncio.wait_for(batch.started.wait(), timeout=1)
+        publishing = [asyncio.create_task(event_bus.publish_many(events[i:i + 2])) for i in (1, 3)]
+        await asyncio.sleep(0.05)
+        batch.release.set()
+        await asyncio.wait_for(asyncio.gather(*publishing), timeout=1)
+        await event_bus.stop()
+        
+        assert batch.peak == 1
+        assert batch.batches == [events[0:1], events[1:3], events[3:5]]
+    
+    async def test_dispatch_bypasses_buffer(self):
+        """dispatch はバッチ対応ハンドラーにも handle ですぐに渡すテスト"""
+        batch = BatchRecordingHandler()
+        event_bus = InMemoryEventBus()
+        event_bus.subscribe(ContactCreated, batch)
+        [event] = self.make_events(1)
+        
+        assert await event_bus.dispatch(event)
+        assert batch.handled == [event]
+        assert batch.batches == []
@@ -0,0 +1,77 @@
+"""メトリクスレジストリのテスト"""
+
+import pytest
+
+from app.infrastructure.metrics import MetricsRegistry
+
+
+class TestMetricsRegistry:
+    """MetricsRegistryのテスト"""
+    
+    def test_counter_render(self):
+        """Counterの出力形式テスト"""
+        registry = MetricsRegistry()
+        counter = registry.counter("jobs_total", "Jobs processed", ("queue",))
+        
+        counter.inc(queue="default")
+        counter.inc(2, queue="default")
+        
+        assert counter.value(queue="default") == 3
+        assert registry.render() == (
+            "# HELP jobs_total Jobs processed\n"
+            "# TYPE jobs_total counter\n"
+            'jobs_total{queue="default"} 3\n'
+        )
+    
+    def test_counter_rejects_decrease_and_unknown_labels(self):
+        """Counterの減少・不正ラベルを拒否するテスト"""
+        counter = MetricsRegistry().counter("jobs_total", "Jobs processed", ("queue",))
+        
+        with pytest.raises(ValueError):
+            counter.inc(-1, queue="default")
+        with pytest.raises(ValueError):
+            counter.inc(worker="1")
+    
+    def test_gauge_with_collect_callback(self):
+        """コールバックで値を収集するGaugeのテスト"""
+        registry = MetricsRegistry()
+        gauge = registry.gauge(
+            "queue_depth", "Queued items", ("queue",),
+            collect=lambda: [({"queue": "events"}, 7)],
+        )
+        gauge.set(1.5, queue="default")
+        
+        assert gauge.value(queue="events") == 7
+        assert 'queue_depth{queue="default"} 1.5' in registry.render()
+        assert 'queue_depth{queue="events"} 7' in registry.render()
+    
+    def test_histogram_buckets_are_cumulative(self):
+        """Histogramのバケットが累積で出力されるテスト"""
+        registry = MetricsRegistry()
+        histogram = registry.histogram("latency_seconds", "Latency", buckets=(0.1, 1.0))
+        
+        for value in (0.05, 0.5, 0.5, 3.0):
+            histogram.observe(value)
+        
+        lines = registry.render().splitlines()
+        assert 'latency_seconds_bucket{le="0.1"} 1' in lines
+        assert 'latency_seconds_bucket{le="1"} 3' in lines
+        assert 'latency_seconds_bucket{le="+Inf"} 4' in lines
+        assert "latency_seconds_sum 4.05" in lines
+        assert "latency_seconds_count 4" in lines
+    
+    def test_same_name_returns_existing_metric(self):
+        """同じ名前での再登録で既存のメトリクスを返すテスト"""
+        registry = MetricsRegistry()
+        counter = registry.counter("jobs_total", "Jobs processed")
+        
+        assert registry.counter("jobs_total", "Jobs processed") is counter
+        with pytest.raises(ValueError):
+            registry.gauge("jobs_total", "Jobs processed")
+    
+    def test_label_values_are_escaped(self):
+        """ラベル値がエスケープされるテスト"""
+        registry = MetricsRegistry()
+        registry.counter("errors_total", "Errors", ("message",)).inc(message='bad "quote"\n')
+        
+        assert 'errors_total{message="bad \\"quote\\"\\n"} 1' in registry.render()
@@ -0,0 +1,289 @@
+"""トランザクショナルアウトボックスとリレーワーカーのテスト"""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from app.domain.entities.contact import Contact
+from app.domain.events.contact_events import ContactCreated
+from app.infrastructure.database.models import Base
+from app.infrastructure.database.models.event_outbox import EventOutboxModel
+from app.infrastructure.database.unit_of_work import UnitOfWork
+from app.infrastructure.event_bus.handlers import EventHandler
+from app.infrastructure.event_bus.in_memory_event_bus import InMemoryEventBus
+from app.infrastructure.event_bus.outbox_relay import OutboxRelay
+from app.infrastructure.repositories.sqlalchemy_contact_repository import (
+    SQLAlchemyContactRepository,
+)
+
+
+class RecordingHandler(EventHandler):
+    """処理したイベントを記録するテスト用ハンドラー（fail=True なら失敗する）"""
+
+    def __init__(self, fail: bool = False):
+        self.fail = fail
+        self.handled = []
+        self.received = asyncio.Event()
+
+    async def handle(self, event):
+        self.received.set()
+        if self.fail:
+            raise RuntimeError("handler failed")
+        self.handled.append(event)
+
+    @property
+    def event_type(self):
+        return ContactCreated
+
+
+def make_contact(name: str = "テスト太郎") -> Contact:
+    """ContactCreated イベントを持つ問い合わせ"""
+    return Contact.create(
+        name=name,
+        email="test@example.com",
+        message="テストメッセージ",
+        lesson_type="group",
+        preferred_contact="email",
+    )
+
+
+class FakeListenConnection:
+    """asyncpg の接続の代わりに LISTEN と切断コールバックを記録するテスト用接続"""
+
+    def __init__(self):
+        self.channels = []
+        self.termination_listeners = []
+        self.closed = False
+        self.released = False
+
+    async def add_listener(self, channel, callback):
+        self.channels.append(channel)
+
+    async def remove_listener(self, channel, callback):
+        self.channels.remove(channel)
+
+    def add_termination_listener(self, callback):
+        self.termination_listeners.append(callback)
+
+    def remove_termination_listener(self, callback):
+        self.termination_listeners.remove(callback)
+
+    def is_closed(self):
+        return self.closed
+
+    def terminate(self):
+        """サーバー側で切断されたときと同じくコールバックを呼ぶ"""
+        self.closed = True
+        for callback in self.termination_listeners:
+            callback(self)
+
+    # AsyncConnection と raw connection の代わり
+    async def get_raw_connection(self):
+        return SimpleNamespace(driver_connection=self)
+
+    async def close(self):
+        self.released = True
+
+    async def invalidate(self):
+        self.released = True
+
+
+class FakeAsyncpgEngine:
+    """LISTEN 用の接続だけを差し替え、確保と配信は実際のエンジンで行うテスト用エンジン"""
+
+    def __init__(self, engine):
+        self.dialect = SimpleNamespace(driver="asyncpg")
+        self.begin = engine.begin
+        self.connections = []
+
+    async def connect(self):
+        connection = FakeListenConnection()
+        self.connections.append(connection)
+        return connection
+
+
+async def outbox_rows(session):
+    """アウトボックスの全行"""
+    return (await session.scalars(select(EventOutboxModel).order_by(EventOutboxModel.id))).all()
+
+
+class TestOutbox:
+    """アウトボックスへの書き込みとリレーのテスト"""
+
+    @pytest.fixture
+    def handler(self):
+        """ハンドラーのフィクスチャ"""
+        return RecordingHandler()
+
+    @pytest.fixture
+    def event_bus(self, handler):
+        """ハンドラーを登録したイベントバスのフィクスチャ"""
+        event_bus = InMemoryEventBus()
+        event_bus.subscribe(ContactCreated, handler)
+        return event_bus
+
+    @pytest.fixture
+    def relay(self, async_session, event_bus):
+        """リレーのフィクスチャ"""
+        return OutboxRelay(async_session.bind, event_bus, retry_delay=60.0, max_attempts=3)
+
+    async def test_writes_events_in_same_transaction(self, async_session, event_bus, handler):
+        """イベントをアウトボックスに書き込み、その場では配信しないテスト"""
+        contact = make_contact()
+
+        async with UnitOfWork(async_session, event_bus, outbox=True):
+            await SQLAlchemyContactRepository(async_session).save(contact)
+
+        rows = await outbox_rows(async_session)
+        assert handler.handled == []
+        assert [row.event_type for row in rows] == ["ContactCreated"]
+        assert rows[0].payload["data"]["contact_id"] == str(contact.id)
+        assert rows[0].attempts == 0
+
+    async def test_rollback_writes_nothing(self, async_session, event_bus):
+        """ロールバックしたトランザクションのイベントは書き込まれないテスト"""
+        with pytest.raises(RuntimeError):
+            async with UnitOfWork(async_session, event_bus, outbox=True):
+                await SQLAlchemyContactRepository(async_session).save(make_contact())
+                raise RuntimeError("failed")
+
+        assert await async_session.scalar(select(func.count()).select_from(EventOutboxModel)) == 0
+
+    async def test_relay_dispatches_and_deletes(self, async_session, event_bus, handler, relay):
+        """リレーが書き込み順に配信し、配信した行を削除するテスト"""
+        async with UnitOfWork(async_session, event_bus, outbox=True):
+            await SQLAlchemyContactRepository(async_session).insert_many(
+                [make_contact(f"一括{i}") for i in range(3)]
+            )
+
+        assert await relay.relay_once() == 3
+        assert [event.name for event in handler.handled] == ["一括0", "一括1", "一括2"]
+        assert all(isinstance(event, ContactCreated) for event in handler.handled)
+        assert await outbox_rows(async_session) == []
+        assert await relay.relay_once() == 0
+
+    async def test_failed_delivery_is_rescheduled(self, async_session, event_bus, handler, relay):
+        """配信に失敗した行は再試行を予約し、上限に達したら打ち切るテスト"""
+        handler.fail = True
+        async with UnitOfWork(async_session, event_bus, outbox=True):
+            await SQLAlchemyContactRepository(async_session).save(make_contact())
+
+        assert await relay.relay_once() == 1
+        async_session.expire_all()
+        [row] = await outbox_rows(async_session)
+        assert row.attempts == 1
+        assert row.available_at is not None
+        assert row.last_error
+        # 再試行の時刻まではほかの確保の対象にならない
+        assert await relay.relay_once() == 0
+
+        relay._max_attempts = 2
+        await async_session.execute(
+            EventOutboxModel.__table__.update().values(available_at=row.created_at)
+        )
+        await async_session.commit()
+        assert await relay.relay_once() == 1
+        async_session.expire_all()
+        [row] = await outbox_rows(async_session)
+        assert row.attempts == 2
+        assert row.available_at is None
+
+    async def test_claimed_rows_are_leased_during_delivery(self, async_session, event_bus, handler, relay):
+        """配信中の行はトランザクションの外でリースされ、ほかのリレーに確保されないテスト"""
+        other_handler = RecordingHandler()
+        other_bus = InMemoryEventBus()
+        other_bus.subscribe(ContactCreated, other_handler)
+        other_relay = OutboxRelay(async_session.bind, other_bus)
+        claimed_by_other = []
+
+        async def handle(event):
+            claimed_by_other.append(await other_relay.relay_once())
+            handler.handled.append(event)
+
+        handler.handle = handle
+        async with UnitOfWork(async_session, event_bus, outbox=True):
+            await SQLAlchemyContactRepository(async_session).save(make_contact())
+
+        assert await relay.relay_once() == 1
+        assert claimed_by_other == [0]
+        assert len(handler.handled) == 1
+        assert other_handler.handled == []
+        assert await outbox_rows(async_session) == []
+
+    async def test_expired_lease_is_claimed_again(self, async_session, event_bus, handler):
+        """リースが切れた行はほかのリレーが確保し直して再配信するテスト"""
+        other_handler = RecordingHandler()
+        other_bus = InMemoryEventBus()
+        other_bus.subscribe(ContactCreated, other_handler)
+        other_relay = OutboxRelay(async_session.bind, other_bus)
+        relay = OutboxRelay(async_session.bind, event_bus, lease_duration=0.0)
+        claimed_by_other = []
+
+        async def handle(event):
+            claimed_by_other.append(await other_relay.relay_once())
+            handler.handled.append(event)
+
+        handler.handle = handle
+        async with UnitOfWork(async_session, event_bus, outbox=True):
+            await SQLAlchemyContactRepository(async_session).save(make_contact())
+
+        assert await relay.relay_once() == 1
+        assert claimed_by_other == [1]
+        assert len(handler.handled) == 1
+        assert len(other_handler.handled) == 1
+        assert await outbox_rows(async_session) == []
+
+    async def test_worker_relays_on_wakeup(self, tmp_path, event_bus, handler):
+        """起動したワーカーが通知を受けて配信するテスト"""
+        # ワーカーとリクエストが別の接続を使うようにファイルのデータベースを使用
+        engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'outbox.db'}")
+        async with engine.begin() as connection:
+            await connection.run_sync(Base.metadata.create_all)
+        relay = OutboxRelay(engine, event_bus, poll_interval=60.0)
+        await relay.start()
+        try:
+            async with async_sessionmaker(engine)() as session:
+                async with UnitOfWork(session, event_bus, outbox=True):
+                    await SQLAlchemyContactRepository(session).save(make_contact())
+                relay.notify()
+                await asyncio.wait_for(handler.received.wait(), 5.0)
+                await relay.stop(timeout=5.0)
+
+                assert not relay.running
+                assert len(handler.handled) == 1
+                assert await outbox_rows(session) == []
+        finally:
+            await relay.stop()
+            await engine.dispose()
+
+    @pytest.mark.parametrize("notify_termination", [True, False], ids=["termination_listener", "health_check"])
+    async def test_worker_listens_again_after_connection_loss(self, async_session, event_bus, notify_termination):
+        """LISTEN の接続が切れたら接続し直して LISTEN し直すテスト"""
+        engine = FakeAsyncpgEngine(async_session.bind)
+        relay = OutboxRelay(engine, event_bus, poll_interval=0.01)
+
+        async def wait_for_connections(count):
+            while len(engine.connections) < count or not engine.connections[-1].channels:
+                await asyncio.sleep(0.01)
+
+        await relay.start()
+        try:
+            await asyncio.wait_for(wait_for_connections(1), 5.0)
+            lost = engine.connections[0]
+            if notify_termination:
+                lost.terminate()
+            else:
+                lost.closed = True
+            await asyncio.wait_for(wait_for_connections(2), 5.0)
+            await relay.stop(timeout=5.0)
+        finally:
+            await relay.stop()
+
+        assert lost.released
+        [reconnected] = engine.connections[1:]
+        assert reconnected.released
+        assert reconnected.channels == []
+        assert reconnected.termination_listeners == []
@@ -0,0 +1,105 @@
+"""コネクションプールのメトリクスのテスト"""
+
+import time
+
+import pytest
+from sqlalchemy import create_engine, text
+
+from app.infrastructure.database import pool_metrics
+from app.infrastructure.database.pool_metrics import (
+    InstrumentedQueuePool,
+    instrument_engine,
+)
+from app.infrastructure.metrics import get_metrics_registry
+
+
+@pytest.fixture
+def pool_name(request) -> str:
+    """テストごとに一意な pool ラベル"""
+    return f"test_{request.node.name}"
+
+
+def make_engine(tmp_path, **options):
+    """計測用プールを使用したSQLiteエンジンを作成"""
+    return create_engine(
+        f"sqlite:///{tmp_path / 'pool.db'}",
+        poolclass=InstrumentedQueuePool,
+        pool_size=2,
+        max_overflow=1,
+        **options,
+    )
+
+
+def gauge_value(name: str, pool: str) -> float:
+    """pool ラベルのGauge値を取得"""
+    return get_metrics_registry().gauge(name, "", ("pool",)).value(pool=pool)
+
+
+class TestPoolMetrics:
+    """プールメトリクスのテスト"""
+    
+    def test_checkout_latency_and_occupancy(self, tmp_path, pool_name):
+        """チェックアウト時間と使用中・アイドル数の記録テスト"""
+        engine = make_engine(tmp_path)
+        instrument_engine(engine, pool_name)
+        
+        with engine.connect() as first, engine.connect() as second:
+            first.execute(text("SELECT 1"))
+            second.execute(text("SELECT 1"))
+            
+            assert gauge_value("db_pool_connections_in_use", pool_name) == 2
+            assert gauge_value("db_pool_connections_idle", pool_name) == 0
+        
+        assert pool_metrics.checkout_seconds.count(pool=pool_name) == 2
+        assert pool_metrics.connections_created.value(pool=pool_name) == 2
+        assert gauge_value("db_pool_connections_in_use", pool_name) == 0
+        assert gauge_value("db_pool_connections_idle", pool_name) == 2
+        assert gauge_value("db_pool_size", pool_name) == 2
+        engine.dispose()
+    
+    def test_observer_survives_dispose(self, tmp_path, pool_name):
+        """dispose 後の新しいプールでも計測が続くテスト"""
+        engine = make_engine(tmp_path)
+        instrument_engine(engine, pool_name)
+        
+        engine.dispose()
+        with engine.connect():
+            pass
+        
+        assert pool_metrics.checkout_seconds.count(pool=pool_name) == 1
+        engine.dispose()
+    
+    def test_recycle_is_counted(self, tmp_path, pool_name):
+        """pool_recycle による再接続がリサイクルとして記録されるテスト"""
+        engine = make_engine(tmp_path, pool_recycle=0.2)
+        instrument_engine(engine, pool_name)
+        
+        with engine.connect():
+            pass
+        time.sleep(0.3)
+        with engine.connect():
+            pass
+        
+        assert pool_metrics.recycles.value(pool=pool_name) == 1
+        assert pool_metrics.invalidations.value(pool=pool_name) == 0
+        engine.dispose()
+    
+    def test_pre_ping_failure_is_counted(self, tmp_path, pool_name):
+        """プリピングで切断を検出した場合の記録テスト"""
+        engine = make_engine(tmp_path, pool_pre_ping=True)
+        instrument_engine(engine, pool_name)
+        
+        with engine.connect() as connection:
+            dbapi_connection = connection.connection.dbapi_connection
+        # プール内のコネクションをサーバー側で切断された状態にする
+        dbapi_connection.close()
+        
+        with engine.connect() as connection:
+            connection.execute(text("SELECT 1"))
+        
+        assert pool_metrics.pre_ping_failures.value(pool=pool_name) == 1
+        assert pool_metrics.invalidations.value(pool=pool_name) == 1
+        # 無効化による再接続はリサイクルに含めない
+        assert pool_metrics.recycles.value(pool=pool_name) == 0
+        assert pool_metrics.connections_created.value(pool=pool_name) == 2
+        engine.dispose()
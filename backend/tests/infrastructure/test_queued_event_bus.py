@@ -0,0 +1,183 @@
+"""キュー付きイベントバスのテスト"""
+
+import asyncio
+
+import pytest
+
+from app.domain.events.contact_events import ContactCreated
+from app.infrastructure.event_bus.handlers import EventHandler
+from app.infrastructure.event_bus.in_memory_event_bus import InMemoryEventBus
+from app.infrastructure.event_bus.queued_event_bus import (
+    EventQueueFullError,
+    OverflowPolicy,
+    QueuedEventBus,
+    queue_depth,
+    queue_lag_seconds,
+    queue_overflows,
+)
+
+
+class BlockingHandler(EventHandler):
+    """release されるまで処理を止めるテスト用ハンドラー"""
+    
+    def __init__(self):
+        self.released = asyncio.Event()
+        self.handled = []
+    
+    async def handle(self, event):
+        await self.released.wait()
+        self.handled.append(event)
+    
+    @property
+    def event_type(self):
+        return ContactCreated
+
+
+def make_event(name: str = "テスト太郎") -> ContactCreated:
+    """テスト用イベント"""
+    return ContactCreated(
+        contact_id="12345678-1234-1234-1234-123456789012",
+        name=name,
+        email="test@example.com",
+        phone=None,
+        message="テストメッセージ",
+        lesson_type="group",
+        preferred_contact="email"
+    )
+
+
+class TestQueuedEventBus:
+    """QueuedEventBusのテスト"""
+    
+    @pytest.fixture
+    def handler(self):
+        """ハンドラーのフィクスチャ"""
+        return BlockingHandler()
+    
+    def make_bus(self, handler, name, **kwargs) -> QueuedEventBus:
+        """ハンドラーを登録したバスを作成"""
+        event_bus = QueuedEventBus(InMemoryEventBus(), name=name, **kwargs)
+        event_bus.subscribe(ContactCreated, handler)
+        return event_bus
+    
+    async def test_publish_returns_before_handlers_run(self, handler):
+        """publish がハンドラーの完了を待たずに戻り、ワーカーが処理するテスト"""
+        event_bus = self.make_bus(handler, "test_publish", workers=1)
+        await event_bus.start()
+        event = make_event()
+        
+        await asyncio.wait_for(event_bus.publish(event), timeout=1)
+        assert handler.handled == []
+        
+        handler.released.set()
+        await event_bus.stop(timeout=1)
+        
+        assert handler.handled == [event]
+        assert queue_lag_seconds.count(bus="test_publish") == 1
+        assert queue_depth.value(bus="test_publish") == 0
+    
+    async def test_stop_drains_queue(self, handler):
+        """stop でキューに残ったイベントを処理してから停止するテスト"""
+        event_bus = self.make_bus(handler, "test_drain", workers=2)
+        await event_bus.start()
+        events = [make_event(f"テスト{i}") for i in range(10)]
+        for event in events:
+            await event_bus.publish(event)
+        await asyncio.sleep(0)  # 2つのワーカーが1件ずつ取り出して処理中になる
+        assert event_bus.qsize() == 8
+        
+        handler.released.set()
+        await event_bus.stop(timeout=1)
+        
+        assert sorted(e.name for e in handler.handled) == sorted(e.name for e in events)
+        assert not event_bus.running
+    
+    async def test_publish_before_start_dispatches_inline(self, handler):
+        """start 前の publish はキューに積まずに内側のバスで同期的に配信されるテスト"""
+        handler.released.set()
+        event_bus = self.make_bus(handler, "test_not_started", max_size=1)
+        events = [make_event(f"テスト{i}") for i in range(3)]
+        
+        for event in events:
+            await asyncio.wait_for(event_bus.publish(event), timeout=1)
+        
+        assert handler.handled == events
+        assert event_bus.qsize() == 0
+    
+    async def test_publish_after_stop_dispatches_inline(self, handler):
+        """stop 後の publish は内側のバスで同期的に配信されるテスト"""
+        handler.released.set()
+        event_bus = self.make_bus(handler, "test_inline")
+        await event_bus.start()
+        await event_bus.stop()
+        event = make_event()
+        
+        await event_bus.publish(event)
+        
+        assert handler.handled == [event]
+    
+    async def test_reject_policy(self, handler):
+        """REJECT ポリシーで満杯のキューへの publish が失敗するテスト"""
+        event_bus = self.make_bus(
+            handler, "test_reject", max_size=2, workers=1, overflow_policy=OverflowPolicy.REJECT
+        )
+        await event_bus.start()
+        await event_bus.publish(make_event())
+        await asyncio.sleep(0)  # ワーカーが取り出して処理中になる
+        await event_bus.publish(make_event())
+        await event_bus.publish(make_event())
+        
+        with pytest.raises(EventQueueFullError):
+            await event_bus.publish(make_event())
+        
+        assert event_bus.qsize() == 2
+        assert queue_overflows.value(bus="test_reject", policy="reject") == 1
+        handler.released.set()
+        await event_bus.stop(timeout=1)
+    
+    async def test_drop_oldest_policy(self, handler):
+        """DROP_OLDEST ポリシーで最も古いイベントが破棄されるテスト"""
+        event_bus = self.make_bus(
+            handler, "test_drop", max_size=2, workers=1, overflow_policy=OverflowPolicy.DROP_OLDEST
+        )
+        await event_bus.start()
+        await event_bus.publish(make_event("処理中"))
+        await asyncio.sleep(0)  # ワーカーが取り出して処理中になる
+        for name in ("古い", "中間", "新しい"):
+            await event_bus.publish(make_event(name))
+        
+        handler.released.set()
+        await event_bus.stop(timeout=1)
+        
+        assert [event.name for event in handler.handled] == ["処理中", "中間", "新しい"]
+        assert queue_overflows.value(bus="test_drop", policy="drop_oldest") == 1
+    
+    async def test_block_policy(self, handler):
+        """BLOCK ポリシーで空きができるまで publish が待機するテスト"""
+        event_bus = self.make_bus(handler, "test_block", max_size=1, workers=1)
+        await event_bus.start()
+        await event_bus.publish(make_event("1"))  # ワーカーが取り出して処理中になる
+        await asyncio.sleep(0)
+        await event_bus.publish(make_event("2"))  # キューを埋める
+        
+        blocked = asyncio.create_task(event_bus.publish(make_event("3")))
+        await asyncio.sleep(0.01)
+        assert not blocked.done()
+        
+        handler.released.set()
+        await asyncio.wait_for(blocked, timeout=1)
+        await event_bus.stop(timeout=1)
+        
+        assert [event.name for event in handler.handled] == ["1", "2", "3"]
+    
+    async def test_stop_timeout_discards_remaining(self, handler):
+        """処理が終わらない場合は timeout で打ち切って停止するテスト"""
+        event_bus = self.make_bus(handler, "test_timeout", workers=1)
+        await event_bus.start()
+        await event_bus.publish(make_event())
+        await event_bus.publish(make_event())
+        
+        await asyncio.wait_for(event_bus.stop(timeout=0.05), timeout=1)
+        
+        assert handler.handled == []
+        assert not event_bus.running
@@ -0,0 +1,203 @@
+"""プライマリ/レプリカ読み取りルーティングのテスト"""
+
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import event, literal_column, select
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import StaticPool
+
+from app.domain.entities.contact import Contact, LessonType, PreferredContact
+from app.domain.value_objects.email import Email
+from app.infrastructure.database.models.base import Base
+from app.infrastructure.database.routing import (
+    PINNED_TO_PRIMARY,
+    READ_BIND,
+    ReplicaSet,
+    RoutingSession,
+)
+from app.infrastructure.repositories.sqlalchemy_contact_repository import (
+    SQLAlchemyContactRepository,
+)
+
+
+def create_memory_engine():
+    """インメモリSQLiteエンジンを作成"""
+    return create_async_engine(
+        "sqlite+aiosqlite:///:memory:",
+        poolclass=StaticPool,
+        connect_args={"check_same_thread": False},
+    )
+
+
+def make_contact() -> Contact:
+    """テスト用の問い合わせを作成"""
+    return Contact(
+        id=uuid4(),
+        name="ルーティング太郎",
+        email=Email("routing@example.com"),
+        message="ルーティングテスト",
+        lesson_type=LessonType.GROUP,
+        preferred_contact=PreferredContact.EMAIL
+    )
+
+
+class TestRoutingSession:
+    """RoutingSessionのテスト"""
+    
+    @pytest.fixture
+    async def engines(self):
+        """プライマリとレプリカ（別DB）のフィクスチャ"""
+        primary = create_memory_engine()
+        replica = create_memory_engine()
+        for engine in (primary, replica):
+            async with engine.begin() as conn:
+                await conn.run_sync(Base.metadata.create_all)
+        yield primary, replica
+        await primary.dispose()
+        await replica.dispose()
+    
+    @pytest.fixture
+    def clock(self):
+        """テスト用の時計"""
+        return [0.0]
+    
+    @pytest.fixture
+    def replicas(self, engines, clock):
+        """レプリカ集合のフィクスチャ"""
+        _, replica = engines
+        return ReplicaSet([replica], retry_after=10.0, clock=lambda: clock[0])
+    
+    @pytest.fixture
+    def session_maker(self, engines, replicas):
+        """ルーティングセッションファクトリーのフィクスチャ"""
+        primary, _ = engines
+        return async_sessionmaker(
+            bind=primary,
+            class_=AsyncSession,
+            expire_on_commit=False,
+            sync_session_class=RoutingSession,
+            replicas=replicas,
+        )
+    
+    async def test_reads_go_to_replica(self, engines, session_maker):
+        """書き込みのないセッションの読み取りはレプリカに行くテスト"""
+        primary, _ = engines
+        contact = make_contact()
+        async with AsyncSession(primary) as session:
+            await SQLAlchemyContactRepository(session).save(contact)
+            await session.commit()
+        
+        async with session_maker() as session:
+            repository = SQLAlchemyContactRepository(session)
+            
+            # レプリカには未反映なので見つからない
+            assert await repository.find_by_id(contact.id) is None
+            assert not session.info.get(PINNED_TO_PRIMARY)
+    
+    async def test_one_replica_per_transaction(self, engines):
+        """トランザクション中は同じレプリカを使い、次のトランザクションで選び直すテスト"""
+        primary, _ = engines
+        others = [create_memory_engine(), create_memory_engine()]
+        replicas = ReplicaSet(others)
+        used = []
+        for replica in others:
+            event.listen(replica.sync_engine, "before_cursor_execute", lambda conn, *args: used.append(conn.engine))
+        
+        async with AsyncSession(bind=primary, sync_session_class=RoutingSession, replicas=replicas) as session:
+            for _ in range(3):
+                await session.execute(select(literal_column("1")))
+            await session.commit()
+            await session.execute(select(literal_column("1")))
+            assert session.info[READ_BIND] is used[-1]
+        
+        assert used == [others[0].sync_engine] * 3 + [others[1].sync_engine]
+        for replica in others:
+            await replica.dispose()
+    
+    async def test_reads_after_write_are_pinned_to_primary(self, session_maker):
+        """書き込み後の読み取りはプライマリに固定されるテスト"""
+        contact = make_contact()
+        
+        async with session_maker() as session:
+            repository = SQLAlchemyContactRepository(session)
+            await repository.save(contact)
+            
+            assert session.info[PINNED_TO_PRIMARY] is True
+            found = await repository.find_by_email("routing@example.com")
+            assert found is not None
+            assert found.id == contact.id
+    
+    async def test_unhealthy_replica_falls_back_to_primary(self, engines, replicas, clock, session_maker):
+        """障害レプリカはプライマリにフォールバックし、一定時間後に復帰するテスト"""
+        primary, replica = engines
+        contact = make_contact()
+        async with AsyncSession(primary) as session:
+            await SQLAlchemyContactRepository(session).save(contact)
+            await session.commit()
+        
+        replicas.mark_unhealthy(replica.sync_engine)
+        
+        async with session_maker() as session:
+            assert await SQLAlchemyContactRepository(session).find_by_id(contact.id) is not None
+        
+        clock[0] = 11.0
+        assert replicas.is_healthy(replica.sync_engine)
+        async with session_maker() as session:
+            assert await SQLAlchemyContactRepository(session).find_by_id(contact.id) is None
+    
+    async def test_query_error_keeps_replica_healthy(self, engines, replicas, session_maker):
+        """SQLエラーではレプリカが除外されないテスト"""
+        _, replica = engines
+        
+        async with session_maker() as session:
+            with pytest.raises(OperationalError):
+                await session.execute(select(literal_column("missing_column")))
+        
+        assert replicas.is_healthy(replica.sync_engine)
+    
+    async def test_connection_failure_falls_back_to_primary(self, engines):
+        """レプリカへの接続失敗で除外し、読み取りをプライマリで再実行するテスト"""
+        primary, _ = engines
+        contact = make_contact()
+        async with AsyncSession(primary) as session:
+            await SQLAlchemyContactRepository(session).save(contact)
+            await session.commit()
+        unreachable = create_async_engine("sqlite+aiosqlite:////nonexistent/replica.db")
+        replicas = ReplicaSet([unreachable], retry_after=10.0)
+        
+        async with AsyncSession(
+            bind=primary, sync_session_class=RoutingSession, replicas=replicas
+        ) as session:
+            assert await SQLAlchemyContactRepository(session).find_by_id(contact.id) is not None
+            assert session.info[READ_BIND] is primary.sync_engine
+        
+        assert not replicas.is_healthy(unreachable.sync_engine)
+        assert replicas.choose() is None
+        await unreachable.dispose()
+    
+    async def test_disconnect_retries_read_on_primary(self, engines):
+        """読み取り中の接続断で除外し、同じ SELECT をプライマリで再実行するテスト"""
+        primary, _ = engines
+        contact = make_contact()
+        async with AsyncSession(primary) as session:
+            await SQLAlchemyContactRepository(session).save(contact)
+            await session.commit()
+        broken = create_memory_engine()
+        
+        @event.listens_for(broken.sync_engine, "handle_error")
+        def simulate_disconnect(context):
+            context.is_disconnect = True
+        
+        replicas = ReplicaSet([broken], retry_after=10.0)
+        
+        async with AsyncSession(
+            bind=primary, sync_session_class=RoutingSession, replicas=replicas
+        ) as session:
+            found = await SQLAlchemyContactRepository(session).find_by_id(contact.id)
+        
+        assert found is not None
+        assert found.id == contact.id
+        assert not replicas.is_healthy(broken.sync_engine)
+        await broken.dispose()
@@ -0,0 +1,136 @@
+"""スロークエリログのテスト"""
+
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.pool import StaticPool
+
+from app.domain.entities.contact import Contact
+from app.infrastructure.database.models.base import Base
+from app.infrastructure.database.slow_query import (
+    SlowQueryLog,
+    fingerprint,
+    normalize_statement,
+    parameters_shape,
+)
+from app.infrastructure.repositories.sqlalchemy_contact_repository import (
+    SQLAlchemyContactRepository,
+)
+
+
+@pytest.fixture
+async def engine():
+    """テスト用のSQLiteエンジン"""
+    engine = create_async_engine(
+        "sqlite+aiosqlite:///:memory:",
+        poolclass=StaticPool,
+        connect_args={"check_same_thread": False},
+    )
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    yield engine
+    await engine.dispose()
+
+
+class TestNormalization:
+    """ステートメント正規化のテスト"""
+    
+    def test_literals_and_placeholders_are_replaced(self):
+        """リテラルとプレースホルダーが ? になるテスト"""
+        statement = "SELECT * FROM contacts WHERE email = 'a@example.com' AND id = $1 LIMIT 20"
+        
+        assert normalize_statement(statement) == "SELECT * FROM contacts WHERE email = ? AND id = ? LIMIT ?"
+    
+    def test_in_lists_share_a_fingerprint(self):
+        """IN句の要素数が違っても同じフィンガープリントになるテスト"""
+        two = "SELECT id FROM contacts\n WHERE id IN (?, ?)"
+        three = "SELECT id FROM contacts WHERE id IN (?,?, ?)"
+        
+        assert fingerprint(two) == fingerprint(three)
+        assert "IN (...)" in normalize_statement(two)
+    
+    def test_casts_are_kept(self):
+        """PostgreSQLのキャスト（::）がプレースホルダー扱いされないテスト"""
+        statement = "SELECT reltuples::bigint FROM pg_class WHERE oid = 'contacts'::regclass"
+        
+        assert normalize_statement(statement) == "SELECT reltuples::bigint FROM pg_class WHERE oid = ?::regclass"
+    
+    def test_parameters_shape_hides_values(self):
+        """パラメータの値を含まないテスト"""
+        assert parameters_shape({"email": "secret@example.com", "limit": 20}) == "{email: str, limit: int}"
+        assert parameters_shape(("secret", 1)) == "(str, int)"
+        assert parameters_shape([("a", 1), ("b", 2)], executemany=True) == "2 x (str, int)"
+
+
+class TestSlowQueryLog:
+    """SlowQueryLogのテスト"""
+    
+    async def test_records_slow_query_with_caller_and_plan(self, engine):
+        """スロークエリが呼び出し元・実行計画とともに記録されるテスト"""
+        slow_query_log = SlowQueryLog(threshold_ms=0, explain_sample_rate=1.0)
+        slow_query_log.instrument(engine)
+        
+        async with async_sessionmaker(engine)() as session:
+            await SQLAlchemyContactRepository(session).find_by_email("someone@example.com")
+        
+        entry = slow_query_log.entries()[0]
+        assert entry.caller == "SQLAlchemyContactRepository.find_by_email"
+        assert "someone@example.com" not in entry.statement
+        assert entry.parameters_shape == "(str)"
+        assert "ix_contacts_email" in entry.plan
+    
+    async def test_fast_queries_are_not_recorded(self, engine):
+        """しきい値未満のクエリが記録されないテスト"""
+        slow_query_log = SlowQueryLog(threshold_ms=60_000)
+        slow_query_log.instrument(engine)
+        
+        async with async_sessionmaker(engine)() as session:
+            await SQLAlchemyContactRepository(session).count_by()
+        
+        assert slow_query_log.entries() == []
+    
+    async def test_explain_is_sampled(self, engine):
+        """サンプリングされなかったスロークエリは実行計画を取得しないテスト"""
+        slow_query_log = SlowQueryLog(threshold_ms=0, explain_sample_rate=0.5, random_func=lambda: 0.9)
+        slow_query_log.instrument(engine)
+        
+        async with async_sessionmaker(engine)() as session:
+            await SQLAlchemyContactRepository(session).count_by()
+        
+        assert slow_query_log.entries()[0].plan is None
+    
+    async def test_explain_is_select_only(self, engine):
+        """書き込みのステートメントは EXPLAIN しないテスト"""
+        slow_query_log = SlowQueryLog(threshold_ms=0, explain_sample_rate=1.0)
+        slow_query_log.instrument(engine)
+        
+        contact = Contact.create(
+            name="スロークエリ",
+            email="slow@example.com",
+            message="スロークエリのテストです",
+            lesson_type="trial",
+            preferred_contact="email",
+        )
+        async with async_sessionmaker(engine)() as session:
+            repository = SQLAlchemyContactRepository(session)
+            await repository.save(contact)
+            await repository.find_by_id(uuid4())
+        
+        plans = {entry.statement.split()[0]: entry.plan for entry in slow_query_log.entries()}
+        assert plans["INSERT"] is None
+        assert plans["SELECT"] is not None
+    
+    async def test_ring_buffer_keeps_latest(self, engine):
+        """リングバッファが直近のものだけを保持するテスト"""
+        slow_query_log = SlowQueryLog(threshold_ms=0, buffer_size=2)
+        slow_query_log.instrument(engine)
+        
+        async with async_sessionmaker(engine)() as session:
+            repository = SQLAlchemyContactRepository(session)
+            await repository.find_by_email("a@example.com")
+            await repository.find_page(limit=1)
+            await repository.count_by()
+        
+        callers = [entry.caller for entry in slow_query_log.entries()]
+        assert callers == ["SQLAlchemyContactRepository.count_by", "SQLAlchemyContactRepository.find_page"]
@@ -0,0 +1,158 @@
+"""ユニットオブワークのテスト"""
+
+import pytest
+
+from app.domain.entities.contact import Contact, ContactStatus
+from app.domain.events.contact_events import ContactCreated, ContactUpdated
+from app.infrastructure.database.unit_of_work import (
+    COMMITTED_EVENTS,
+    PENDING_EVENTS,
+    UnitOfWork,
+)
+from app.infrastructure.event_bus.event_bus import EventBus
+from app.infrastructure.repositories.sqlalchemy_contact_repository import (
+    SQLAlchemyContactRepository,
+)
+
+
+class RecordingEventBus(EventBus):
+    """配信されたイベントを記録するテスト用イベントバス"""
+    
+    def __init__(self):
+        self.batches = []
+    
+    async def publish(self, event):
+        self.batches.append([event])
+    
+    async def publish_many(self, events):
+        self.batches.append(list(events))
+    
+    def subscribe(self, event_type, handler):
+        pass
+    
+    def unsubscribe(self, event_type, handler):
+        pass
+
+
+def make_contact(name: str = "テスト太郎") -> Contact:
+    """ContactCreated イベントを持つ問い合わせ"""
+    return Contact.create(
+        name=name,
+        email="test@example.com",
+        message="テストメッセージ",
+        lesson_type="group",
+        preferred_contact="email",
+    )
+
+
+class TestUnitOfWork:
+    """UnitOfWorkのテスト"""
+    
+    @pytest.fixture
+    def event_bus(self):
+        """イベントバスのフィクスチャ"""
+        return RecordingEventBus()
+    
+    async def test_publishes_events_once_after_commit(self, async_session, event_bus):
+        """コミット後に保存したエンティティのイベントを1回にまとめて配信するテスト"""
+        repository = SQLAlchemyContactRepository(async_session)
+        first, second = make_contact("一人目"), make_contact("二人目")
+        second.update_status(ContactStatus.PROCESSING)
+        
+        async with UnitOfWork(async_session, event_bus):
+            await repository.save(first)
+            await repository.save(second)
+            assert event_bus.batches == []
+        
+        assert len(event_bus.batches) == 1
+        assert [type(event) for event in event_bus.batches[0]] == [
+            ContactCreated, ContactCreated, ContactUpdated
+        ]
+        assert first.get_domain_events() == []
+        assert second.get_domain_events() == []
+    
+    async def test_rollback_discards_events(self, async_session, event_bus):
+        """ロールバックしたトランザクションのイベントは配信されないテスト"""
+        repository = SQLAlchemyContactRepository(async_session)
+        
+        with pytest.raises(RuntimeError):
+            async with UnitOfWork(async_session, event_bus):
+                await repository.save(make_contact("破棄"))
+                raise RuntimeError("failed")
+        
+        unit_of_work = UnitOfWork(async_session, event_bus)
+        contact = make_contact("保存")
+        await repository.save(contact)
+        await unit_of_work.commit()
+        
+        assert len(event_bus.batches) == 1
+        assert [event.name for event in event_bus.batches[0]] == ["保存"]
+    
+    async def test_bulk_writes_collect_events(self, async_session, event_bus):
+        """一括書き込みしたエンティティのイベントも配信されるテスト"""
+        repository = SQLAlchemyContactRepository(async_session)
+        contacts = [make_contact(f"一括{i}") for i in range(3)]
+        
+        async with UnitOfWork(async_session, event_bus):
+            await repository.insert_many(contacts)
+        
+        assert [event.name for event in event_bus.batches[0]] == ["一括0", "一括1", "一括2"]
+    
+    async def test_commit_without_events(self, async_session, event_bus):
+        """イベントがなければ配信しないテスト"""
+        async with UnitOfWork(async_session, event_bus):
+            pass
+        
+        assert event_bus.batches == []
+    
+    async def test_publish_failure_does_not_raise(self, async_session, event_bus):
+        """コミット後の配信失敗は例外にしないテスト"""
+        async def failing_publish_many(events):
+            raise RuntimeError("bus down")
+        event_bus.publish_many = failing_publish_many
+        repository = SQLAlchemyContactRepository(async_session)
+        contact = make_contact()
+        
+        async with UnitOfWork(async_session, event_bus):
+            await repository.save(contact)
+        
+        assert await repository.find_by_id(contact.id) is not None
+    
+    async def test_events_stay_on_entity_without_unit_of_work(self, async_session):
+        """ユニットオブワーク外の保存・コミットではセッションにイベントが溜まらないテスト"""
+        repository = SQLAlchemyContactRepository(async_session)
+        contact = make_contact()
+        
+        await repository.save(contact)
+        await async_session.commit()
+        
+        assert PENDING_EVENTS not in async_session.info
+        assert COMMITTED_EVENTS not in async_session.info
+        assert [type(event) for event in contact.get_domain_events()] == [ContactCreated]
+    
+    async def test_closed_unit_of_work_stops_collecting(self, async_session, event_bus):
+        """終了したユニットオブワークのセッションではイベントを集めないテスト"""
+        repository = SQLAlchemyContactRepository(async_session)
+        async with UnitOfWork(async_session, event_bus):
+            await repository.save(make_contact("一件目"))
+        
+        later = make_contact("二件目")
+        await repository.save(later)
+        await async_session.commit()
+        
+        assert len(event_bus.batches) == 1
+        assert COMMITTED_EVENTS not in async_session.info
+        assert later.get_domain_events() != []
+    
+    async def test_rollback_publishes_directly_committed_events(self, async_session, event_bus):
+        """途中で直接コミットしたトランザクションのイベントはロールバック時にも配信されるテスト"""
+        repository = SQLAlchemyContactRepository(async_session)
+        
+        with pytest.raises(RuntimeError):
+            async with UnitOfWork(async_session, event_bus):
+                await repository.save(make_contact("コミット済み"))
+                await async_session.commit()
+                await repository.save(make_contact("破棄"))
+                raise RuntimeError("failed")
+        
+        assert [[event.name for event in batch] for batch in event_bus.batches] == [["コミット済み"]]
@@ -0,0 +1,129 @@
+"""Tests for Contact Loader."""
+import asyncio
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+import pytest
+
+from app.domain.entities.contact import Contact, LessonType, PreferredContact
+from app.domain.repositories.contact_repository import ContactRepository
+from app.domain.value_objects.email import Email
+from app.services.contact_loader import ContactLoader
+
+
+def make_contact(index: int) -> Contact:
+    """テスト用の問い合わせを作成"""
+    return Contact(
+        id=uuid4(),
+        name=f"ローダー{index}",
+        email=Email(f"loader{index}@example.com"),
+        lesson_type=LessonType.GROUP,
+        preferred_contact=PreferredContact.EMAIL,
+        message="ローダーテスト"
+    )
+
+
+class TestContactLoader:
+    """ContactLoaderのテストケース"""
+    
+    @pytest.fixture
+    def mock_repository(self):
+        """モックContactRepository"""
+        return AsyncMock(spec=ContactRepository)
+    
+    @pytest.fixture
+    def loader(self, mock_repository):
+        """ContactLoaderインスタンス"""
+        return ContactLoader(mock_repository)
+    
+    async def test_concurrent_loads_are_batched(self, loader, mock_repository):
+        """同一ティックの load はまとめて1回で取得されるテスト"""
+        contacts = [make_contact(i) for i in range(3)]
+        mock_repository.find_by_ids.return_value = contacts
+        missing_id = uuid4()
+        
+        results = await asyncio.gather(
+            *(loader.load(contact.id) for contact in contacts),
+            loader.load(missing_id)
+        )
+        
+        assert results == [*contacts, None]
+        mock_repository.find_by_ids.assert_called_once_with(
+            [contact.id for contact in contacts] + [missing_id]
+        )
+        mock_repository.find_by_id.assert_not_called()
+    
+    async def test_single_load_uses_find_by_id(self, loader, mock_repository):
+        """単独の load は find_by_id を使うテスト"""
+        contact = make_contact(0)
+        mock_repository.find_by_id.return_value = contact
+        
+        result = await loader.load(contact.id)
+        
+        assert result == contact
+        mock_repository.find_by_id.assert_called_once_with(contact.id)
+        mock_repository.find_by_ids.assert_not_called()
+    
+    async def test_results_are_cached(self, loader, mock_repository):
+        """同じIDの再取得はキャッシュされるテスト"""
+        contact = make_contact(0)
+        mock_repository.find_by_id.return_value = contact
+        
+        await loader.load(contact.id)
+        await loader.load(contact.id)
+        
+        mock_repository.find_by_id.assert_called_once_with(contact.id)
+        
+        loader.clear(contact.id)
+        await loader.load(contact.id)
+        
+        assert mock_repository.find_by_id.call_count == 2
+    
+    async def test_max_batch_size(self, mock_repository):
+        """バッチサイズ上限で分割されるテスト"""
+        loader = ContactLoader(mock_repository, max_batch_size=2)
+        contacts = [make_contact(i) for i in range(4)]
+        mock_repository.find_by_ids.side_effect = lambda ids: [
+            contact for contact in contacts if contact.id in ids
+        ]
+        
+        results = await loader.load_many([contact.id for contact in contacts])
+        
+        assert results == contacts
+        assert mock_repository.find_by_ids.call_count == 2
+    
+    async def test_batches_never_share_the_session_concurrently(self, mock_repository):
+        """分割したバッチや別ティックの取得が同時に実行されないテスト"""
+        loader = ContactLoader(mock_repository, max_batch_size=2)
+        contacts = [make_contact(i) for i in range(6)]
+        tracker = {"running": 0, "peak": 0}
+        
+        async def find_by_ids(ids):
+            tracker["running"] += 1
+            tracker["peak"] = max(tracker["peak"], tracker["running"])
+            await asyncio.sleep(0.01)
+            tracker["running"] -= 1
+            return [contact for contact in contacts if contact.id in ids]
+        
+        mock_repository.find_by_ids.side_effect = find_by_ids
+        
+        first = asyncio.ensure_future(loader.load_many([contact.id for contact in contacts[:4]]))
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+        second = await loader.load_many([contact.id for contact in contacts[4:]])
+        
+        assert await first == contacts[:4]
+        assert second == contacts[4:]
+        assert mock_repository.find_by_ids.call_count == 3
+        assert tracker["peak"] == 1
+    
+    async def test_failure_propagates_and_is_not_cached(self, loader, mock_repository):
+        """取得失敗は全待機者に伝わり、キャッシュされないテスト"""
+        contact = make_contact(0)
+        mock_repository.find_by_ids.side_effect = Exception("Database error")
+        
+        with pytest.raises(Exception, match="Database error"):
+            await loader.load_many([contact.id, uuid4()])
+        
+        mock_repository.find_by_id.return_value = contact
+        assert await loader.load(contact.id) == contact
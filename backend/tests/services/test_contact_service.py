@@ -1,14 +1,20 @@
 """Tests for Contact Service."""
-import pytest
 from unittest.mock import AsyncMock, MagicMock
-from uuid import uuid4, UUID
+from uuid import UUID, uuid4
 
-from app.services.contact_service import ContactService
-from app.domain.entities.contact import Contact, ContactStatus, LessonType, PreferredContact
+import pytest
+
+from app.domain.entities.contact import (
+    Contact,
+    ContactStatus,
+    LessonType,
+    PreferredContact,
+)
 from app.domain.repositories.contact_repository import ContactRepository
-from app.services.email_service import EmailService
 from app.domain.value_objects.email import Email
 from app.domain.value_objects.phone import Phone
+from app.services.contact_service import ContactService
+from app.services.email_service import EmailService
 
 
 class TestContactService:
@@ -138,6 +144,31 @@ class TestContactService:
         assert result == saved_contact
         mock_repository.save.assert_called_once()
     
+    async def test_create_contact_passes_value_objects_through(
+        self, 
+        contact_service, 
+        mock_repository, 
+        mock_email_service
+    ):
+        """検証済みの値オブジェクト・Enumがそのままエンティティに渡されるテスト"""
+        email = Email("through@example.com")
+        phone = Phone("090-1234-5678")
+        mock_repository.save.side_effect = lambda contact: contact
+        
+        result = await contact_service.create_contact(
+            name="検証太郎",
+            email=email,
+            phone=phone,
+            lesson_type=LessonType.ONLINE,
+            preferred_contact=PreferredContact.PHONE,
+            message="オンラインレッスンについて教えてください。"
+        )
+        
+        assert result.email is email
+        assert result.phone is phone
+        assert result.lesson_type is LessonType.ONLINE
+        assert result.preferred_contact is PreferredContact.PHONE
+    
     async def test_create_contact_invalid_email(
         self, 
         contact_service, 
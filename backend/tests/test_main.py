@@ -21,3 +21,12 @@ async def test_root_endpoint(client: AsyncClient):
     assert data["message"] == "英会話カフェ API"
     assert data["version"] == "1.0.0"
     assert data["docs"] == "/docs"
+
+
+@pytest.mark.asyncio
+async def test_metrics_endpoint(client: AsyncClient):
+    """Test Prometheus metrics endpoint."""
+    response = await client.get("/metrics")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    assert "# TYPE db_pool_checkout_seconds histogram" in response.text
@@ -0,0 +1,124 @@
+"""起動時ウォームアップのテスト"""
+
+import asyncio
+
+import pytest
+from httpx import AsyncClient
+
+from app import warmup
+from app.config import Settings
+from app.domain.entities.contact import Contact
+from app.infrastructure.database.connection import EngineRegistry
+from app.infrastructure.database.models.base import Base
+from app.infrastructure.repositories.cached_contact_repository import get_contact_cache
+from app.infrastructure.repositories.sqlalchemy_contact_repository import (
+    SQLAlchemyContactRepository,
+)
+from app.main import app as main_app
+from app.warmup import WarmupState, warm_up
+
+
+@pytest.fixture
+async def registry(tmp_path, monkeypatch):
+    """SQLiteファイルを使うエンジンレジストリ"""
+    monkeypatch.setattr(
+        "app.infrastructure.database.connection.get_settings",
+        lambda: Settings(database_url=f"sqlite+aiosqlite:///{tmp_path / 'app.db'}"),
+    )
+    registry = EngineRegistry()
+    async with registry.async_engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    yield registry
+    await registry.dispose()
+    get_contact_cache().clear()
+
+
+class TestWarmUp:
+    """warm_upのテスト"""
+    
+    async def test_warm_up_fills_pool_and_cache(self, registry):
+        """プールのコネクションとキャッシュが事前に用意されるテスト"""
+        sample_contact = Contact.create(
+            name="ウォームアップ",
+            email="warmup@example.com",
+            message="ウォームアップのテストです",
+            lesson_type="trial",
+            preferred_contact="email",
+        )
+        async with registry.session_factory() as session:
+            await SQLAlchemyContactRepository(session).save(sample_contact)
+            await session.commit()
+        settings = Settings(warmup_pool_connections=3, warmup_cache_contacts=10)
+        
+        state = await warm_up(registry, settings, WarmupState(), app=main_app)
+        
+        assert state.ready
+        assert state.errors == {}
+        assert state.completed_steps == ["import_endpoints", "open_connections", "prime_caches"]
+        assert registry.async_engine.pool.checkedin() == 3
+        hit, cached = get_contact_cache().get(sample_contact.id)
+        assert hit
+        assert cached.email == sample_contact.email
+    
+    async def test_failed_connections_block_readiness(self, registry):
+        """コネクションを開くステップが失敗したら準備完了にしないテスト"""
+        async with registry.async_engine.begin() as conn:
+            await conn.run_sync(Base.metadata.drop_all)
+        
+        state = await warm_up(registry, Settings(warmup_pool_connections=1), WarmupState())
+        
+        assert state.finished
+        assert not state.ready
+        assert "open_connections" in state.errors
+        assert "import_endpoints" in state.completed_steps
+    
+    async def test_fail_open_reports_ready(self, registry):
+        """warmup_fail_open なら失敗したステップがあっても準備完了になるテスト"""
+        async with registry.async_engine.begin() as conn:
+            await conn.run_sync(Base.metadata.drop_all)
+        settings = Settings(warmup_pool_connections=1, warmup_fail_open=True)
+        
+        state = await warm_up(registry, settings, WarmupState())
+        
+        assert state.ready
+        assert "open_connections" in state.errors
+    
+    async def test_timeout_blocks_readiness(self, registry, monkeypatch):
+        """コネクションを開く前にタイムアウトしたら準備完了にしないテスト"""
+        async def never_finishes(app):
+            await asyncio.Event().wait()
+        
+        monkeypatch.setattr(warmup, "_import_endpoints", never_finishes)
+        
+        state = await warm_up(registry, Settings(warmup_timeout_seconds=0.05), WarmupState())
+        
+        assert state.finished
+        assert not state.ready
+        assert "timeout" in state.errors
+
+
+class TestReadinessEndpoint:
+    """/health/ready のテスト"""
+    
+    async def test_not_ready_until_warm_up_finishes(self, client: AsyncClient, monkeypatch):
+        """ウォームアップ完了前後のレディネステスト"""
+        state = WarmupState()
+        monkeypatch.setattr(warmup, "_state", state)
+        
+        response = await client.get("/health/ready")
+        assert response.status_code == 503
+        assert response.json()["status"] == "warming_up"
+        
+        state.started_at = state.finished_at = 0.0
+        state.errors["open_connections"] = "connection refused"
+        response = await client.get("/health/ready")
+        assert response.status_code == 503
+        assert response.json()["status"] == "warmup_failed"
+        
+        state.mark_skipped()
+        
+        response = await client.get("/health/ready")
+        assert response.status_code == 200
+        assert response.json()["status"] == "ready"
+        # 生存確認は影響を受けない
+        assert (await client.get("/health")).status_code == 200
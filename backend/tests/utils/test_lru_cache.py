@@ -0,0 +1,111 @@
+"""LRUキャッシュのテスト"""
+
+import pytest
+
+from app.utils.lru_cache import LRUCache
+
+
+class FakeClock:
+    """テスト用の時計"""
+    
+    def __init__(self):
+        self.now = 0.0
+    
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestLRUCache:
+    """LRUCacheのテスト"""
+    
+    @pytest.fixture
+    def clock(self):
+        """時計のフィクスチャ"""
+        return FakeClock()
+    
+    @pytest.fixture
+    def cache(self, clock):
+        """キャッシュのフィクスチャ"""
+        return LRUCache(max_size=2, ttl=10.0, clock=clock)
+    
+    def test_hit_and_miss(self, cache):
+        """ヒットとミスの計数テスト"""
+        cache.set("a", 1)
+        
+        assert cache.get("a") == (True, 1)
+        assert cache.get("b") == (False, None)
+        assert cache.stats.hits == 1
+        assert cache.stats.misses == 1
+        assert cache.stats.hit_ratio == 0.5
+    
+    def test_none_value_is_a_hit(self, cache):
+        """Noneを値として保持できるテスト"""
+        cache.set("a", None)
+        
+        assert cache.get("a") == (True, None)
+    
+    def test_evicts_least_recently_used(self, cache):
+        """最も古く使われたエントリが追い出されるテスト"""
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+        
+        assert cache.get("b") == (False, None)
+        assert cache.get("a") == (True, 1)
+        assert cache.stats.evictions == 1
+        assert len(cache) == 2
+    
+    def test_expiry(self, cache, clock):
+        """有効期限切れのテスト"""
+        cache.set("a", 1)
+        cache.set("b", 2, ttl=1.0)
+        clock.now = 5.0
+        
+        assert cache.get("b") == (False, None)
+        assert cache.get("a") == (True, 1)
+        
+        clock.now = 10.0
+        assert cache.get("a") == (False, None)
+        assert len(cache) == 0
+    
+    def test_invalidate_and_clear(self, cache):
+        """破棄とクリアのテスト"""
+        cache.set("a", 1)
+        cache.invalidate("a")
+        cache.invalidate("missing")
+        
+        assert cache.get("a") == (False, None)
+        
+        cache.set("b", 2)
+        cache.clear()
+        assert len(cache) == 0
+        assert cache.stats.misses == 0
+    
+    def test_set_skips_keys_invalidated_since_generation(self, cache):
+        """読み込み開始後に破棄されたキーには古い値を書き戻さないテスト"""
+        generation = cache.generation
+        cache.invalidate("a")
+        
+        assert not cache.set("a", 1, generation=generation)
+        assert cache.get("a") == (False, None)
+        assert cache.set("b", 2, generation=generation)
+        assert cache.set("a", 1, generation=cache.generation)
+    
+    def test_forgotten_invalidations_still_block_set(self, cache):
+        """記録から溢れた破棄より前の世代でも書き戻さないテスト"""
+        generation = cache.generation
+        for key in ("a", "b", "c"):
+            cache.invalidate(key)
+        
+        assert not cache.set("a", 1, generation=generation)
+        assert cache.set("a", 1, generation=cache.generation)
+        
+        generation = cache.generation
+        cache.clear()
+        assert not cache.set("d", 4, generation=generation)
+    
+    def test_invalid_max_size(self):
+        """不正なサイズ上限のテスト"""
+        with pytest.raises(ValueError):
+            LRUCache(max_size=0, ttl=1.0)